@@ -0,0 +1,31 @@
+"""add package keyset indexes
+
+Revision ID: 3f1c9a7b2e4d
+Revises: d686fee292f3
+Create Date: 2026-10-18 09:12:41.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7b2e4d'
+down_revision: Union[str, Sequence[str], None] = 'd686fee292f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_packages_price_id', 'packages', ['price', 'id'], unique=False)
+    op.create_index('ix_packages_duration_id', 'packages', ['duration', 'id'], unique=False)
+    op.create_index('ix_packages_created_at_id', 'packages', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_packages_created_at_id', table_name='packages')
+    op.drop_index('ix_packages_duration_id', table_name='packages')
+    op.drop_index('ix_packages_price_id', table_name='packages')
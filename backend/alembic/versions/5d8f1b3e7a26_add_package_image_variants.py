@@ -0,0 +1,32 @@
+"""add package image variants
+
+Revision ID: 5d8f1b3e7a26
+Revises: e91d5c3a7f20
+Create Date: 2026-10-18 13:41:27.530214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8f1b3e7a26'
+down_revision: Union[str, Sequence[str], None] = 'e91d5c3a7f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'packages',
+        sa.Column('image_variants', postgresql.JSONB(astext_type=sa.Text()), server_default='{}', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('packages', 'image_variants')
@@ -0,0 +1,77 @@
+"""add package full text search
+
+Revision ID: 7b2d4e9c1a58
+Revises: 3f1c9a7b2e4d
+Create Date: 2026-10-18 10:03:17.554021
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2d4e9c1a58'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7b2e4d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('packages', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Build search document: name (A), destination name + country (B), itinerary (C)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION packages_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(
+                    (SELECT d.name || ' ' || d.country FROM destinations d WHERE d.id = NEW.destination_id),
+                    ''
+                )), 'B') ||
+                setweight(to_tsvector('simple', coalesce(NEW.itinerary, '')), 'C');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER packages_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF name, itinerary, destination_id ON packages
+        FOR EACH ROW EXECUTE FUNCTION packages_search_vector_update();
+    """)
+
+    # Rename destination -> rebuild search document of its packages
+    op.execute("""
+        CREATE OR REPLACE FUNCTION destinations_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            UPDATE packages SET destination_id = destination_id WHERE destination_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER destinations_search_vector_trigger
+        AFTER UPDATE OF name, country ON destinations
+        FOR EACH ROW
+        WHEN (OLD.name IS DISTINCT FROM NEW.name OR OLD.country IS DISTINCT FROM NEW.country)
+        EXECUTE FUNCTION destinations_search_vector_update();
+    """)
+
+    # Backfill existing rows through the trigger
+    op.execute("UPDATE packages SET name = name")
+
+    op.create_index('ix_packages_search_vector', 'packages', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_packages_search_vector', table_name='packages', postgresql_using='gin')
+    op.execute("DROP TRIGGER IF EXISTS destinations_search_vector_trigger ON destinations")
+    op.execute("DROP FUNCTION IF EXISTS destinations_search_vector_update()")
+    op.execute("DROP TRIGGER IF EXISTS packages_search_vector_trigger ON packages")
+    op.execute("DROP FUNCTION IF EXISTS packages_search_vector_update()")
+    op.drop_column('packages', 'search_vector')
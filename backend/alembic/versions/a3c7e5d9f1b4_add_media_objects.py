@@ -0,0 +1,46 @@
+"""add media objects
+
+Revision ID: a3c7e5d9f1b4
+Revises: 5d8f1b3e7a26
+Create Date: 2026-10-18 14:22:09.318540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e5d9f1b4'
+down_revision: Union[str, Sequence[str], None] = '5d8f1b3e7a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'media_objects',
+        sa.Column('namespace', sa.String(length=32), nullable=False),
+        sa.Column('digest', sa.String(length=64), nullable=False),
+        sa.Column('extension', sa.String(length=10), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('namespace', 'digest'),
+    )
+    op.create_index(
+        'ix_media_objects_unreferenced',
+        'media_objects',
+        ['updated_at'],
+        unique=False,
+        postgresql_where=sa.text('ref_count = 0'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_media_objects_unreferenced', table_name='media_objects', postgresql_where=sa.text('ref_count = 0'))
+    op.drop_table('media_objects')
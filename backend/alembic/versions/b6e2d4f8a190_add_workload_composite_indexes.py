@@ -0,0 +1,74 @@
+"""add workload composite indexes
+
+Revision ID: b6e2d4f8a190
+Revises: a3c7e5d9f1b4
+Create Date: 2026-10-18 15:03:52.604417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2d4f8a190'
+down_revision: Union[str, Sequence[str], None] = 'a3c7e5d9f1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial where) - composite index menggantikan index
+# single-column yang menjadi prefix-nya
+NEW_INDEXES = [
+    ('ix_bookings_tourist_id_status', 'bookings', ['tourist_id', 'status'], None),
+    ('ix_bookings_pending_verification_package_id', 'bookings', ['package_id'], "payment_status = 'pending_verification'"),
+    ('ix_reviews_package_id_created_at', 'reviews', ['package_id', 'created_at'], None),
+    ('ix_reviews_tourist_id_created_at', 'reviews', ['tourist_id', 'created_at'], None),
+    ('ix_packages_destination_id_price_id', 'packages', ['destination_id', 'price', 'id'], None),
+]
+
+REPLACED_INDEXES = [
+    ('ix_bookings_tourist_id', 'bookings', ['tourist_id']),
+    ('ix_reviews_package_id', 'reviews', ['package_id']),
+    ('ix_reviews_tourist_id', 'reviews', ['tourist_id']),
+    ('ix_packages_destination_id', 'packages', ['destination_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY tidak boleh di dalam transaksi dan tidak mengunci
+    # tabel dari write selama build. Index yang gagal di tengah jalan (INVALID) di-drop
+    # dulu supaya migration bisa diulang.
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in NEW_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+        for name, table, _, _ in NEW_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,34 @@
+"""add trigram search indexes
+
+Revision ID: c4e8a2f6b913
+Revises: 7b2d4e9c1a58
+Create Date: 2026-10-18 11:26:52.807315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2f6b913'
+down_revision: Union[str, Sequence[str], None] = '7b2d4e9c1a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm is a trusted extension (PG13+), alembic_user needs CREATE on the database
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index('ix_destinations_name_trgm', 'destinations', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_destinations_country_trgm', 'destinations', ['country'], unique=False, postgresql_using='gin', postgresql_ops={'country': 'gin_trgm_ops'})
+    op.create_index('ix_packages_name_trgm', 'packages', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_packages_name_trgm', table_name='packages', postgresql_using='gin')
+    op.drop_index('ix_destinations_country_trgm', table_name='destinations', postgresql_using='gin')
+    op.drop_index('ix_destinations_name_trgm', table_name='destinations', postgresql_using='gin')
@@ -0,0 +1,58 @@
+"""add booking list keyset indexes
+
+Revision ID: c8d1e7f3a5b9
+Revises: f4a8c2e6b1d7
+Create Date: 2026-10-18 19:12:07.318846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d1e7f3a5b9'
+down_revision: Union[str, Sequence[str], None] = 'f4a8c2e6b1d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns) - index untuk keyset pagination bookings_list (created_at, id)
+NEW_INDEXES = [
+    ('ix_bookings_created_at_id', 'bookings', ['created_at', 'id']),
+    ('ix_bookings_tourist_id_created_at_id', 'bookings', ['tourist_id', 'created_at', 'id']),
+    ('ix_bookings_package_id_created_at_id', 'bookings', ['package_id', 'created_at', 'id']),
+]
+
+REPLACED_INDEXES = [
+    ('ix_bookings_created_at', 'bookings', ['created_at']),
+    ('ix_bookings_package_id', 'bookings', ['package_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in NEW_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+        for name, table, _ in NEW_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,47 @@
+"""add package date inventory
+
+Revision ID: d2f9a6c3e8b5
+Revises: b6e2d4f8a190
+Create Date: 2026-10-18 15:47:13.882106
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f9a6c3e8b5'
+down_revision: Union[str, Sequence[str], None] = 'b6e2d4f8a190'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'package_date_inventory',
+        sa.Column('package_id', sa.UUID(), nullable=False),
+        sa.Column('travel_date', sa.Date(), nullable=False),
+        sa.Column('capacity', sa.Integer(), nullable=False),
+        sa.Column('booked', sa.Integer(), server_default='0', nullable=False),
+        sa.CheckConstraint('booked >= 0', name='check_inventory_booked_non_negative'),
+        sa.ForeignKeyConstraint(['package_id'], ['packages.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('package_id', 'travel_date'),
+    )
+
+    # Backfill dari booking yang masih memegang kursi (selain cancelled)
+    op.execute("""
+        INSERT INTO package_date_inventory (package_id, travel_date, capacity, booked)
+        SELECT b.package_id, b.travel_date, p.max_travelers, SUM(b.travelers_count)
+        FROM bookings b
+        JOIN packages p ON p.id = b.package_id
+        WHERE b.status <> 'cancelled'
+        GROUP BY b.package_id, b.travel_date, p.max_travelers
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('package_date_inventory')
@@ -0,0 +1,84 @@
+"""add package rating aggregates
+
+Revision ID: e91d5c3a7f20
+Revises: c4e8a2f6b913
+Create Date: 2026-10-18 12:48:05.117962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91d5c3a7f20'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2f6b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('packages', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('packages', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('packages', sa.Column('rating_avg', sa.Numeric(precision=3, scale=2), server_default='0', nullable=False))
+
+    # Keep aggregates in sync in the same transaction as every review write,
+    # including rows removed by ON DELETE CASCADE (which bypass the ORM)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION reviews_rating_aggregate_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE packages SET
+                    rating_sum = rating_sum - OLD.rating,
+                    rating_count = rating_count - 1,
+                    rating_avg = CASE
+                        WHEN rating_count - 1 > 0
+                        THEN round((rating_sum - OLD.rating)::numeric / (rating_count - 1), 2)
+                        ELSE 0
+                    END
+                WHERE id = OLD.package_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE packages SET
+                    rating_sum = rating_sum + NEW.rating,
+                    rating_count = rating_count + 1,
+                    rating_avg = round((rating_sum + NEW.rating)::numeric / (rating_count + 1), 2)
+                WHERE id = NEW.package_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER reviews_rating_aggregate_trigger
+        AFTER INSERT OR DELETE OR UPDATE OF rating, package_id ON reviews
+        FOR EACH ROW EXECUTE FUNCTION reviews_rating_aggregate_update();
+    """)
+
+    # Backfill from existing reviews
+    op.execute("""
+        UPDATE packages p SET
+            rating_sum = r.rating_sum,
+            rating_count = r.rating_count,
+            rating_avg = round(r.rating_sum::numeric / r.rating_count, 2)
+        FROM (
+            SELECT package_id, sum(rating) AS rating_sum, count(*) AS rating_count
+            FROM reviews
+            GROUP BY package_id
+        ) r
+        WHERE p.id = r.package_id
+    """)
+
+    op.create_index('ix_packages_rating_avg_id', 'packages', ['rating_avg', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_packages_rating_avg_id', table_name='packages')
+    op.execute("DROP TRIGGER IF EXISTS reviews_rating_aggregate_trigger ON reviews")
+    op.execute("DROP FUNCTION IF EXISTS reviews_rating_aggregate_update()")
+    op.drop_column('packages', 'rating_avg')
+    op.drop_column('packages', 'rating_count')
+    op.drop_column('packages', 'rating_sum')
@@ -0,0 +1,66 @@
+"""
+Booking Helper - Pembuatan booking beserta reservasi kursinya dalam satu transaksi
+Dipakai oleh view booking_create dan script stress test concurrency
+"""
+from sqlalchemy import select
+
+from models.booking_model import Booking
+from helpers.inventory_helper import reserve_seats
+from helpers.media_storage_helper import PAYMENT_PROOF_MEDIA
+from helpers.transaction_helper import run_in_transaction
+
+
+def create_booking(session, package, tourist_id, travel_date, travelers_count: int, total_price: float) -> Booking:
+    """
+    Reserve seats and insert a pending booking, committed together
+
+    Retried from scratch on serialization failure / deadlock.
+
+    Args:
+        session: SQLAlchemy session
+        package: Package instance
+        tourist_id: Tourist UUID
+        travel_date: Travel date
+        travelers_count: Number of travelers
+        total_price: Total price
+
+    Returns:
+        Committed Booking
+
+    Raises:
+        SeatsUnavailable: If the date does not have enough seats (transaction rolled back)
+    """
+    def work(session):
+        reserve_seats(session, package, travel_date, travelers_count)
+        booking = Booking(
+            package_id=package.id,
+            tourist_id=tourist_id,
+            travel_date=travel_date,
+            travelers_count=travelers_count,
+            total_price=total_price,
+            status="pending",
+            payment_status="unpaid"
+        )
+        session.add(booking)
+        session.flush()
+        return booking
+
+    return run_in_transaction(session, work)
+
+
+def release_payment_proofs(session, *criteria):
+    """
+    Drop the payment proof references of bookings about to be deleted by a cascade
+
+    Must run in the same transaction as the delete (e.g. before
+    session.delete(package)), so the references are only dropped if the
+    bookings are really gone.
+
+    Args:
+        session: SQLAlchemy session
+        *criteria: WHERE clauses selecting the bookings (e.g. Booking.package_id == id)
+    """
+    urls = session.execute(
+        select(Booking.payment_proof_url).where(Booking.payment_proof_url.isnot(None), *criteria)
+    ).scalars().all()
+    PAYMENT_PROOF_MEDIA.release(session, urls)
@@ -0,0 +1,199 @@
+"""
+Cache Helper - In-process TTL + LRU cache untuk endpoint katalog (packages & destinations)
+Entry diberi tag supaya bisa di-invalidate secara presisi oleh view yang menulis data
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from pyramid.response import Response
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry TTL and tag-based invalidation"""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value, tags)
+        self._tags = {}  # tag -> set of keys
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._tag_versions = {}  # tag -> version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every invalidation, used to drop results computed before it"""
+        return self._generation
+
+    def tag_version(self, tag) -> int:
+        """Version of a tag, bumped every time the tag is invalidated"""
+        with self._lock:
+            return self._tag_versions.get(tag, 0)
+
+    def get(self, key):
+        """
+        Get cached value
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key, value, tags=(), generation: int = None):
+        """
+        Store value under key
+
+        Args:
+            key: Hashable cache key
+            value: Value to cache (must not be mutated afterwards)
+            tags: Tags used for invalidation
+            generation: Generation read before computing value; if an invalidation
+                happened since then the value may be stale and is not stored
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl, value, tuple(tags))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.maxsize:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate(self, *tags):
+        """Remove every entry carrying any of the given tags"""
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+                for key in self._tags.pop(tag, set()):
+                    if key in self._entries:
+                        self._remove(key)
+                        self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxSize": self.maxsize,
+                "ttlSeconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": round(self.hits / lookups, 4) if lookups else 0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+catalog_cache = TTLCache(
+    maxsize=int(os.getenv("CATALOG_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("CATALOG_CACHE_TTL", "60")),
+)
+
+
+# Tags
+PACKAGE_LIST_TAG = "packages"
+DESTINATION_LIST_TAG = "destinations"
+
+
+def package_tag(package_id) -> str:
+    return f"package:{package_id}"
+
+
+def destination_tag(destination_id) -> str:
+    return f"destination:{destination_id}"
+
+
+# Query parameter yang hanya mengubah format output (di-handle renderer), bukan datanya
+PRESENTATION_PARAMS = frozenset({"pretty"})
+
+
+def request_cache_key(namespace: str, request) -> tuple:
+    """
+    Build cache key from route matchdict and normalized query parameters
+
+    Parameter order, empty values and presentation-only parameters
+    (e.g. `pretty`) do not change the key.
+    """
+    matchdict = tuple(sorted((request.matchdict or {}).items()))
+    params = tuple(sorted(
+        (name, value.strip())
+        for name, value in request.params.items()
+        if isinstance(value, str) and value.strip() and name not in PRESENTATION_PARAMS
+    ))
+    return (namespace, matchdict, params)
+
+
+def cached_view(namespace: str, tags):
+    """
+    Cache successful results of a GET view in catalog_cache
+
+    Args:
+        namespace: Key namespace (usually the route name)
+        tags: Callable (request, result) -> iterable of tags for invalidation
+
+    Error results (Response objects or non-200 status) are never cached.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            key = request_cache_key(namespace, request)
+            found, value = catalog_cache.get(key)
+            if found:
+                return value
+
+            generation = catalog_cache.generation
+            result = func(request, *args, **kwargs)
+            if not isinstance(result, Response) and request.response.status_code == 200:
+                catalog_cache.set(key, result, tags(request, result), generation)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,141 @@
+"""
+Compression Helper - gzip/brotli untuk response JSON/teks
+Dipakai oleh compression tween di main.py. Body yang sudah di memori dikompres sekali
+jalan, body streaming (app_iter generator / file) dikompres per chunk tanpa di-buffer
+"""
+import gzip
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:  # brotli opsional, tanpa itu hanya gzip
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+# Response lebih kecil dari ini tidak dikompres (header + overhead lebih besar dari hematnya)
+MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = 6
+# Quality 4-5 cukup cepat untuk response dinamis, rasio masih lebih baik dari gzip 6
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+# Urutan preferensi server jika client menerima keduanya dengan q yang sama
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def is_compressible(content_type) -> bool:
+    if not content_type:
+        return False
+    return (
+        content_type in COMPRESSIBLE_TYPES
+        or content_type.startswith("text/")
+        or content_type.endswith("+json")
+        or content_type.endswith("+xml")
+    )
+
+
+def choose_encoding(request):
+    """
+    Pick the best supported encoding from Accept-Encoding
+
+    Returns:
+        "br", "gzip" or None (no header, identity only, or q=0 for all)
+    """
+    if not request.headers.get("Accept-Encoding"):
+        return None
+    offers = request.accept_encoding.acceptable_offers(SUPPORTED_ENCODINGS)
+    return offers[0][0] if offers else None
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    # mtime=0 supaya output deterministik (body sama -> bytes sama)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_stream(app_iter, encoding: str):
+    """Compress an iterable of byte chunks lazily, closing the source when done"""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        compress, finish = compressor.process, compressor.finish
+    else:
+        # wbits 31 = container gzip
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        compress, finish = compressor.compress, compressor.flush
+
+    try:
+        for chunk in app_iter:
+            data = compress(chunk)
+            if data:
+                yield data
+        yield finish()
+    finally:
+        close = getattr(app_iter, "close", None)
+        if close is not None:
+            close()
+
+
+def _add_vary(response, header: str):
+    vary = list(response.vary or ())
+    if header.lower() not in (value.lower() for value in vary):
+        vary.append(header)
+        response.vary = vary
+
+
+def compress_response(request, response):
+    """
+    Compress response in place if the client accepts it and it is worth it
+
+    Skipped for HEAD, non-2xx/204/206 responses, Range requests, bodies that
+    already have a Content-Encoding (e.g. precompressed static files),
+    Cache-Control: no-transform, non-text content types and bodies smaller
+    than MIN_SIZE. A strong ETag becomes weak because the bytes differ from
+    the identity representation.
+    """
+    if not is_compressible(response.content_type):
+        return response
+
+    _add_vary(response, "Accept-Encoding")
+
+    if (
+        request.method == "HEAD"
+        or not 200 <= response.status_code < 300
+        or response.status_code in (204, 206)
+        or response.content_encoding
+        or "Range" in request.headers
+        or "no-transform" in (response.headers.get("Cache-Control") or "")
+    ):
+        return response
+
+    encoding = choose_encoding(request)
+    if encoding is None:
+        return response
+
+    buffered = isinstance(response.app_iter, (list, tuple))
+    if buffered:
+        body = response.body
+        if len(body) < MIN_SIZE:
+            return response
+        response.body = compress_bytes(body, encoding)
+    else:
+        if response.content_length is not None and response.content_length < MIN_SIZE:
+            return response
+        response.app_iter = compress_stream(response.app_iter, encoding)
+        response.content_length = None
+
+    response.content_encoding = encoding
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        response.headers["ETag"] = f"W/{etag}"
+    return response
@@ -0,0 +1,156 @@
+"""
+Fieldset Helper - Sparse fieldsets (`?fields=`) untuk list endpoint
+Setiap resource mendefinisikan field output -> kolom yang dibutuhkan, sehingga field
+yang tidak diminta tidak di-SELECT dari database dan tidak di-serialize
+"""
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Callable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Output field definition
+
+    Attributes:
+        getter: Callable(obj) -> JSON value; None returns the first column as is
+            (UUID/datetime/Decimal are encoded by the JSON renderer)
+        columns: Model columns the value is computed from
+        loaders: Loader options for relations the value reads (ORM serialization)
+        joins: (target, onclause) pairs the columns need (row serialization)
+    """
+    getter: Optional[Callable] = None
+    columns: tuple = ()
+    loaders: tuple = ()
+    joins: tuple = ()
+
+
+def parse_fields(raw_fields, specs: dict, always=("id",)):
+    """
+    Parse `fields` query parameter
+
+    Args:
+        raw_fields: Comma separated field names (e.g. "name,price,images"), or None
+        specs: Field specs of the resource
+        always: Fields included even when not requested
+
+    Returns:
+        Tuple of field names in spec order, or None when all fields are requested
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if raw_fields is None or not raw_fields.strip():
+        return None
+
+    requested = {name.strip() for name in raw_fields.split(",") if name.strip()}
+    unknown = requested - specs.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(specs)}"
+        )
+
+    requested.update(always)
+    return tuple(name for name in specs if name in requested)
+
+
+def fieldset_options(fields, specs: dict, default_loaders=()):
+    """
+    Build loader options that only load what the fieldset needs
+
+    Args:
+        fields: Output of parse_fields
+        specs: Field specs of the resource
+        default_loaders: Loader options used when every field is requested
+
+    Returns:
+        Tuple of loader options for with_loaders()
+    """
+    if fields is None:
+        return tuple(default_loaders)
+
+    columns = []
+    loaders = []
+    for name in fields:
+        spec = specs[name]
+        # Beberapa field bisa memakai kolom/relasi yang sama (mis. destinationName & country).
+        # Dibandingkan dengan `is` karena == pada kolom SQLAlchemy membuat ekspresi SQL
+        columns.extend(column for column in spec.columns if not _contains(columns, column))
+        loaders.extend(loader for loader in spec.loaders if not _contains(loaders, loader))
+
+    options = (load_only(*columns),) if columns else ()
+    return options + tuple(loaders)
+
+
+def _contains(items, item) -> bool:
+    return any(existing is item for existing in items)
+
+
+def _index(items, item) -> int:
+    return next(i for i, existing in enumerate(items) if existing is item)
+
+
+def _orm_getter(spec: FieldSpec):
+    return spec.getter or attrgetter(spec.columns[0].key)
+
+
+def serialize_fields(obj, fields, specs: dict) -> dict:
+    """
+    Serialize obj restricted to fields (all fields when None)
+
+    Args:
+        obj: ORM instance
+        fields: Output of parse_fields
+        specs: Field specs of the resource
+
+    Returns:
+        Dict of field name -> value
+    """
+    if fields is None:
+        return {name: _orm_getter(spec)(obj) for name, spec in specs.items()}
+    return {name: _orm_getter(specs[name])(obj) for name in fields}
+
+
+def fieldset_select(fields, specs: dict):
+    """
+    Build a column select and a precompiled row serializer for a fieldset
+
+    List endpoints select plain columns (no ORM instances, no identity map)
+    and serialize the row tuples directly. The accessor for every field is
+    resolved once here, so serializing a row is one dict comprehension of
+    tuple lookups and getter calls.
+
+    Args:
+        fields: Output of parse_fields
+        specs: Field specs of the resource (getters read row attributes)
+
+    Returns:
+        Tuple of (select statement, Callable(row) -> dict); callers may add
+        where/order_by/extra columns after the spec columns
+    """
+    names = tuple(specs) if fields is None else fields
+
+    columns = []
+    joins = []
+    for name in names:
+        spec = specs[name]
+        columns.extend(column for column in spec.columns if not _contains(columns, column))
+        joins.extend(join for join in spec.joins if not _contains(joins, join))
+
+    accessors = tuple(
+        (name, specs[name].getter or itemgetter(_index(columns, specs[name].columns[0])))
+        for name in names
+    )
+
+    stmt = select(*columns)
+    for target, onclause in joins:
+        stmt = stmt.join(target, onclause)
+
+    def serialize(row) -> dict:
+        return {name: get(row) for name, get in accessors}
+
+    return stmt, serialize
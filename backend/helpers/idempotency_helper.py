@@ -0,0 +1,206 @@
+"""
+Idempotency Helper - Header `Idempotency-Key` untuk endpoint POST
+Response pertama disimpan di tabel idempotency_keys; retry dengan key yang sama
+mendapat response yang tersimpan tanpa menjalankan view lagi (tidak ada insert ganda)
+"""
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+
+from pyramid.response import Response
+from sqlalchemy import select, update, delete, or_, and_
+from sqlalchemy.dialects.postgresql import insert
+
+from db import Session
+from models.idempotency_key_model import IdempotencyKey
+from helpers.json_helper import to_jsonable
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# Berapa lama response disimpan
+IDEMPOTENCY_TTL = timedelta(hours=24)
+# Request pertama yang tidak selesai dalam waktu ini dianggap gagal (worker mati)
+IN_PROGRESS_TIMEOUT = timedelta(seconds=60)
+# Interval pembersihan key yang sudah expired (per proses)
+CLEANUP_INTERVAL = 600
+
+_cleanup_lock = threading.Lock()
+_last_cleanup = 0.0
+
+
+def request_hash(request) -> str:
+    """SHA-256 over method, path + query string and raw body, used to detect key reuse"""
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b"\0")
+    digest.update(request.path_qs.encode())
+    digest.update(b"\0")
+    digest.update(request.body or b"")
+    return digest.hexdigest()
+
+
+def cleanup_expired(session) -> int:
+    """Delete expired keys, returns number of rows removed"""
+    result = session.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.expires_at < datetime.now(timezone.utc))
+    )
+    session.commit()
+    return result.rowcount
+
+
+def _maybe_cleanup(session):
+    global _last_cleanup
+    now = time.monotonic()
+    if now - _last_cleanup < CLEANUP_INTERVAL or not _cleanup_lock.acquire(blocking=False):
+        return
+    try:
+        _last_cleanup = now
+        cleanup_expired(session)
+    except Exception as e:
+        session.rollback()
+        print(f"Error cleaning up idempotency keys: {e}")
+    finally:
+        _cleanup_lock.release()
+
+
+def _claim(session, user_id, scope, key, req_hash) -> bool:
+    """
+    Insert an in-progress row for the key, or take over an expired/abandoned one
+
+    Returns:
+        True if this request owns the key and must execute the view
+    """
+    now = datetime.now(timezone.utc)
+    values = {
+        "request_hash": req_hash,
+        "status_code": None,
+        "response_body": None,
+        "created_at": now,
+        "expires_at": now + IDEMPOTENCY_TTL,
+    }
+    stmt = insert(IdempotencyKey).values(user_id=user_id, scope=scope, key=key, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[IdempotencyKey.user_id, IdempotencyKey.scope, IdempotencyKey.key],
+        set_=values,
+        where=or_(
+            IdempotencyKey.expires_at < now,
+            and_(
+                IdempotencyKey.status_code.is_(None),
+                IdempotencyKey.created_at < now - IN_PROGRESS_TIMEOUT,
+            ),
+        ),
+    ).returning(IdempotencyKey.key)
+    claimed = session.execute(stmt).scalar_one_or_none() is not None
+    session.commit()
+    return claimed
+
+
+def _key_filter(user_id, scope, key):
+    return and_(
+        IdempotencyKey.user_id == user_id,
+        IdempotencyKey.scope == scope,
+        IdempotencyKey.key == key,
+    )
+
+
+def idempotent(scope: str):
+    """
+    Make a JSON POST view idempotent per `Idempotency-Key` header
+
+    Must be applied below @jwt_validate (keys are scoped per user). Requests
+    without the header run normally. Responses with status >= 500 and
+    non-JSON responses (e.g. a streamed image) are not stored so the client
+    can retry them.
+
+    Args:
+        scope: Endpoint name, keys are unique per (user, scope)
+
+    Replay rules:
+    - same key + same request: stored status and body, header Idempotent-Replayed: true
+    - same key + different request: 422
+    - same key while the first request is still running: 409
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return func(request, *args, **kwargs)
+
+            key = key.strip()
+            if not key or len(key) > MAX_KEY_LENGTH:
+                return Response(
+                    json_body={"error": f"{IDEMPOTENCY_HEADER} must be 1-{MAX_KEY_LENGTH} characters"},
+                    status=400,
+                )
+
+            user_id = str(request.jwt_claims.get("sub"))
+            req_hash = request_hash(request)
+
+            with Session() as session:
+                _maybe_cleanup(session)
+
+                if not _claim(session, user_id, scope, key, req_hash):
+                    stored = session.execute(
+                        select(IdempotencyKey).where(_key_filter(user_id, scope, key))
+                    ).scalar_one_or_none()
+
+                    if stored is None:
+                        # Dihapus di antara insert dan select (request pertama gagal), proses ulang
+                        if not _claim(session, user_id, scope, key, req_hash):
+                            return Response(
+                                json_body={"error": "A request with this Idempotency-Key is still being processed"},
+                                status=409,
+                            )
+                    elif stored.request_hash != req_hash:
+                        return Response(
+                            json_body={"error": "Idempotency-Key was already used for a different request"},
+                            status=422,
+                        )
+                    elif stored.status_code is None:
+                        return Response(
+                            json_body={"error": "A request with this Idempotency-Key is still being processed"},
+                            status=409,
+                        )
+                    else:
+                        request.response.status = stored.status_code
+                        request.response.headers[REPLAYED_HEADER] = "true"
+                        return stored.response_body
+
+                try:
+                    result = func(request, *args, **kwargs)
+                except Exception:
+                    session.rollback()
+                    session.execute(delete(IdempotencyKey).where(_key_filter(user_id, scope, key)))
+                    session.commit()
+                    raise
+
+                storable = True
+                if isinstance(result, Response):
+                    status_code = result.status_code
+                    storable = result.content_type == "application/json"
+                    body = result.json_body if storable else None
+                else:
+                    status_code = request.response.status_code
+                    # Dict view bisa berisi UUID/datetime (di-encode renderer), JSONB butuh tipe JSON biasa
+                    body = to_jsonable(result)
+
+                if status_code >= 500 or not storable:
+                    session.execute(delete(IdempotencyKey).where(_key_filter(user_id, scope, key)))
+                else:
+                    session.execute(
+                        update(IdempotencyKey)
+                        .where(_key_filter(user_id, scope, key))
+                        .values(status_code=status_code, response_body=body)
+                    )
+                session.commit()
+                return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,185 @@
+"""
+Image Helper - Pipeline upload gambar package
+Upload disimpan lewat media_storage_helper, lalu varian WebP/AVIF (thumb/card/hero) dibuat
+di process pool supaya encoding Pillow tidak memblokir thread request
+"""
+import os
+from pathlib import Path
+
+from PIL import Image, ImageOps, features
+from sqlalchemy import update, func, cast
+from sqlalchemy.dialects.postgresql import JSONB
+
+from db import Session
+from models.package_model import Package
+from helpers.cache_helper import catalog_cache, PACKAGE_LIST_TAG, package_tag
+from helpers.media_storage_helper import PACKAGE_MEDIA
+from helpers.worker_pool_helper import WorkerPool
+
+
+ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+
+# Nama varian -> lebar maksimum (px). Gambar yang lebih kecil tidak di-upscale
+VARIANT_WIDTHS = {
+    "thumb": 320,
+    "card": 640,
+    "hero": 1600,
+}
+
+# Varian ikut content-addressed: <variants>/ab/cd/<sha256 original>-thumb.webp
+PACKAGE_VARIANT_DIR = PACKAGE_MEDIA.root / "variants"
+PACKAGE_VARIANT_URL = "/packages/variants"
+
+# AVIF hanya dipakai kalau Pillow di-build dengan libavif
+VARIANT_FORMATS = ("avif", "webp") if features.check("avif") else ("webp",)
+
+ENCODER_OPTIONS = {
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60, "speed": 6},
+}
+
+def generate_variants(source_path: str, output_dir: str, url_prefix: str) -> dict:
+    """
+    Encode resized variants of one image (runs inside the worker process)
+
+    Args:
+        source_path: Path of the original upload
+        output_dir: Directory for the variant files
+        url_prefix: Public URL prefix of output_dir (e.g. "/packages")
+
+    Returns:
+        Dict variant -> {"width": int, format: url, ...}
+    """
+    source = Path(source_path)
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    variants = {}
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        for name, max_width in VARIANT_WIDTHS.items():
+            width = min(max_width, image.width)
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+
+            variant = {"width": width}
+            for fmt in VARIANT_FORMATS:
+                filename = f"{source.stem}-{name}.{fmt}"
+                tmp_path = output / f".{filename}.tmp"
+                resized.save(tmp_path, format=fmt.upper(), **ENCODER_OPTIONS[fmt])
+                os.replace(tmp_path, output / filename)
+                variant[fmt] = f"{url_prefix}/{filename}"
+            variants[name] = variant
+
+    return variants
+
+
+def existing_variants(source_path: Path, output_dir: Path, url_prefix: str):
+    """
+    Return variants of a content-addressed source that were already encoded
+
+    Returns:
+        Same dict as generate_variants, or None if any variant file is missing
+    """
+    variants = {}
+    for name in VARIANT_WIDTHS:
+        variant = {}
+        for fmt in VARIANT_FORMATS:
+            filename = f"{source_path.stem}-{name}.{fmt}"
+            if not (output_dir / filename).exists():
+                return None
+            variant[fmt] = f"{url_prefix}/{filename}"
+        variants[name] = variant
+
+    # Varian terbesar = lebar gambar asli (maks. hero), cukup baca header file-nya
+    largest = max(VARIANT_WIDTHS, key=VARIANT_WIDTHS.get)
+    with Image.open(output_dir / f"{source_path.stem}-{largest}.{VARIANT_FORMATS[-1]}") as image:
+        largest_width = image.width
+    for name, max_width in VARIANT_WIDTHS.items():
+        variants[name] = {"width": min(max_width, largest_width), **variants[name]}
+    return variants
+
+
+# Pool sendiri (forkserver, antrean dibatasi) supaya encoding varian tidak mengambil slot
+# MEDIA_POOL milik request; pool yang broken diganti otomatis oleh WorkerPool
+VARIANT_POOL = WorkerPool(
+    workers=int(os.getenv("IMAGE_WORKERS", "2")),
+    queue_limit=int(os.getenv("IMAGE_QUEUE_LIMIT", "64")),
+    warm_modules=("PIL.Image", "PIL.WebPImagePlugin", "helpers.image_helper"),
+)
+
+
+def submit_variants(source_path: Path, output_dir: Path, url_prefix: str, on_done):
+    """
+    Schedule variant generation for an upload in the process pool
+
+    Args:
+        source_path: Path of the original upload
+        output_dir: Directory for the variant files
+        url_prefix: Public URL prefix of output_dir
+        on_done: Callback(variants) called in the parent process when encoding succeeds
+
+    Returns:
+        concurrent.futures.Future
+
+    Raises:
+        WorkerPoolBusy: If the variant queue is full
+    """
+    future = VARIANT_POOL.submit(generate_variants, str(source_path), str(output_dir), url_prefix)
+
+    def callback(fut):
+        try:
+            variants = fut.result()
+        except Exception as e:
+            print(f"Error generating image variants for {source_path}: {e}")
+            return
+        try:
+            on_done(variants)
+        except Exception as e:
+            print(f"Error storing image variants for {source_path}: {e}")
+
+    future.add_done_callback(callback)
+    return future
+
+
+def schedule_package_variants(package_id, source_path: Path, image_url: str):
+    """
+    Generate variants for one package image and store them in Package.image_variants
+
+    Variants are merged under the original image URL with a single UPDATE
+    (jsonb ||), so concurrent completions for the same package do not
+    overwrite each other. Content that was already encoded for another
+    package is reused without going through the process pool.
+
+    Args:
+        package_id: UUID of the package owning the image
+        source_path: Path of the original upload
+        image_url: Original URL as stored in Package.images
+    """
+    def store(variants):
+        with Session() as session:
+            session.execute(
+                update(Package)
+                .where(Package.id == package_id)
+                .values(
+                    image_variants=Package.image_variants.op("||")(
+                        func.jsonb_build_object(image_url, cast(variants, JSONB))
+                    )
+                )
+            )
+            session.commit()
+        catalog_cache.invalidate(PACKAGE_LIST_TAG, package_tag(package_id))
+
+    shard = PACKAGE_MEDIA.shard(source_path.stem)
+    output_dir = PACKAGE_VARIANT_DIR / shard
+    url_prefix = f"{PACKAGE_VARIANT_URL}/{shard}"
+
+    variants = existing_variants(source_path, output_dir, url_prefix)
+    if variants is not None:
+        store(variants)
+        return None
+
+    return submit_variants(source_path, output_dir, url_prefix, store)
@@ -0,0 +1,156 @@
+"""
+Inventory Helper - Kapasitas kursi per package per tanggal (tabel package_date_inventory)
+Setiap perubahan booking yang memegang/melepas kursi mengubah counter di sini dalam
+transaksi yang sama, jadi availability cukup dibaca dari satu range query
+"""
+from datetime import date
+
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
+
+from models.package_date_inventory_model import PackageDateInventory
+
+
+# Status booking yang memegang kursi; cancelled melepaskan kursinya
+HOLDING_STATUSES = ("pending", "confirmed", "completed")
+
+
+class SeatsUnavailable(Exception):
+    """Raised when a date does not have enough remaining seats"""
+
+    def __init__(self, remaining: int):
+        super().__init__(f"Only {remaining} seats remaining for this date")
+        self.remaining = remaining
+
+
+def holds_seats(status: str) -> bool:
+    return status in HOLDING_STATUSES
+
+
+def reserve_seats(session, package, travel_date: date, count: int) -> int:
+    """
+    Reserve seats for a booking on a travel date with one atomic statement
+
+    INSERT ... ON CONFLICT DO UPDATE SET booked = booked + n WHERE
+    capacity - booked >= n RETURNING: the check and the increment happen on
+    the locked row inside Postgres, so concurrent bookings for the same date
+    cannot both pass the check (no read-then-write window).
+
+    Args:
+        session: SQLAlchemy session (caller commits)
+        package: Package instance (capacity = max_travelers)
+        travel_date: Travel date
+        count: Number of travelers
+
+    Returns:
+        Remaining seats after the reservation
+
+    Raises:
+        SeatsUnavailable: If fewer than count seats remain
+    """
+    stmt = insert(PackageDateInventory).values(
+        package_id=package.id,
+        travel_date=travel_date,
+        capacity=package.max_travelers,
+        booked=count,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PackageDateInventory.package_id, PackageDateInventory.travel_date],
+        set_={"booked": PackageDateInventory.booked + count},
+        where=(PackageDateInventory.capacity - PackageDateInventory.booked) >= count,
+    ).returning(PackageDateInventory.capacity - PackageDateInventory.booked)
+
+    remaining = session.execute(stmt).scalar_one_or_none()
+    if remaining is None:
+        current = session.execute(
+            select(PackageDateInventory.capacity - PackageDateInventory.booked).where(
+                PackageDateInventory.package_id == package.id,
+                PackageDateInventory.travel_date == travel_date,
+            )
+        ).scalar_one_or_none()
+        raise SeatsUnavailable(max(current or 0, 0))
+    if remaining < 0:
+        # Baris baru dengan count > capacity (seharusnya sudah ditolak oleh validasi max_travelers)
+        raise SeatsUnavailable(max(remaining + count, 0))
+    return remaining
+
+
+def release_seats(session, package_id, travel_date: date, count: int):
+    """
+    Give seats of a cancelled booking back to the travel date
+
+    Args:
+        session: SQLAlchemy session (caller commits)
+        package_id: Package UUID
+        travel_date: Travel date
+        count: Number of travelers
+    """
+    session.execute(
+        update(PackageDateInventory)
+        .where(
+            PackageDateInventory.package_id == package_id,
+            PackageDateInventory.travel_date == travel_date,
+        )
+        .values(booked=func.greatest(PackageDateInventory.booked - count, 0))
+    )
+
+
+def apply_status_change(session, booking, new_status: str):
+    """
+    Move a booking's seats in or out of the inventory for a status change
+
+    Args:
+        session: SQLAlchemy session (caller commits)
+        booking: Booking instance, still carrying the old status
+        new_status: Status about to be set
+
+    Raises:
+        SeatsUnavailable: If a cancelled booking is reactivated on a full date
+    """
+    was_holding = holds_seats(booking.status)
+    will_hold = holds_seats(new_status)
+
+    if was_holding and not will_hold:
+        release_seats(session, booking.package_id, booking.travel_date, booking.travelers_count)
+    elif will_hold and not was_holding:
+        reserve_seats(session, booking.package, booking.travel_date, booking.travelers_count)
+
+
+def update_capacity(session, package_id, capacity: int, from_date: date = None):
+    """
+    Apply a new max_travelers to inventory rows from from_date (default today)
+
+    Args:
+        session: SQLAlchemy session (caller commits)
+        package_id: Package UUID
+        capacity: New capacity per date
+        from_date: First travel date affected
+    """
+    session.execute(
+        update(PackageDateInventory)
+        .where(
+            PackageDateInventory.package_id == package_id,
+            PackageDateInventory.travel_date >= (from_date or date.today()),
+        )
+        .values(capacity=capacity)
+    )
+
+
+def inventory_range(session, package_id, date_from: date, date_to: date) -> dict:
+    """
+    Read inventory rows of a package between two dates (inclusive)
+
+    Served by the (package_id, travel_date) primary key as one range scan.
+
+    Returns:
+        Dict travel_date -> (capacity, booked); dates without bookings are absent
+    """
+    rows = session.execute(
+        select(PackageDateInventory.travel_date, PackageDateInventory.capacity, PackageDateInventory.booked)
+        .where(
+            PackageDateInventory.package_id == package_id,
+            PackageDateInventory.travel_date.between(date_from, date_to),
+        )
+        .order_by(PackageDateInventory.travel_date)
+    ).all()
+    return {row.travel_date: (row.capacity, row.booked) for row in rows}
@@ -0,0 +1,92 @@
+"""
+JSON Helper - Encoder JSON berbasis orjson untuk renderer `json`
+UUID, datetime/date dan Decimal di-serialize langsung oleh encoder, jadi view tidak
+perlu memanggil str()/isoformat()/float() per field. Output compact secara default,
+pretty print hanya jika diminta (?pretty=1 atau Accept: application/json; pretty=1)
+"""
+from decimal import Decimal
+
+import orjson
+from pyramid.renderers import JSON
+
+
+# Key dict non-string (int, date, UUID) diubah ke string seperti json.dumps
+DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+PRETTY_PARAM = "pretty"
+_TRUTHY = {"1", "true", "yes"}
+
+
+def _default(obj):
+    """Types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    # Sama seperti json.dumps(default=str) sebelumnya
+    return str(obj)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes
+
+    Args:
+        obj: Value returned by a view
+        indent: Pretty print with 2 spaces
+
+    Returns:
+        JSON document as bytes
+    """
+    option = DUMPS_OPTIONS | orjson.OPT_INDENT_2 if indent else DUMPS_OPTIONS
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+def to_jsonable(obj):
+    """Convert obj to plain JSON types (str/int/float/list/dict), e.g. before storing it in JSONB"""
+    return orjson.loads(dumps(obj))
+
+
+def wants_pretty(request) -> bool:
+    """
+    True if the client asked for indented output
+
+    Either `?pretty=1` or an Accept parameter on application/json,
+    e.g. `Accept: application/json; pretty=1` or `application/json; indent=2`.
+    """
+    if request.params.get(PRETTY_PARAM, "").lower() in _TRUTHY:
+        return True
+
+    for media_range in request.headers.get("Accept", "").split(","):
+        media_type, *params = [part.strip() for part in media_range.split(";")]
+        if media_type.lower() != "application/json":
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            name, value = name.strip().lower(), value.strip().strip('"').lower()
+            if name == PRETTY_PARAM and value in _TRUTHY:
+                return True
+            if name == "indent" and value.isdigit() and int(value) > 0:
+                return True
+    return False
+
+
+class JSONRenderer(JSON):
+    """
+    pyramid `json` renderer backed by orjson
+
+    Compact output by default; indented (2 spaces) when wants_pretty(request).
+    Adapters registered with add_adapter are not used, types orjson does not
+    know go through _default.
+    """
+
+    def __call__(self, info):
+        def _render(value, system):
+            request = system.get("request")
+            pretty = False
+            if request is not None:
+                response = request.response
+                if response.content_type == response.default_content_type:
+                    response.content_type = "application/json"
+                pretty = wants_pretty(request)
+            return dumps(value, indent=pretty)
+
+        return _render
@@ -0,0 +1,64 @@
+"""
+Loader Helper - Strategi eager loading per endpoint
+Semua relasi yang di-serialize oleh list endpoint di-load di sini supaya
+jumlah query per request konstan (tidak ada lazy load per baris / N+1)
+"""
+from sqlalchemy.orm import joinedload, selectinload
+
+from models.booking_model import Booking
+from models.destination_model import Destination
+from models.package_model import Package
+from models.review_model import Review
+from models.tour_guide_assignment_model import TourGuideAssignment
+from models.user_model import User
+
+
+def package_loaders():
+    """Relations used by views.packages.serialization_data"""
+    return (
+        joinedload(Package.destination).load_only(Destination.name, Destination.country),
+    )
+
+
+def booking_owner_loaders():
+    """Relations used by single-booking views for the agent ownership check"""
+    return (
+        joinedload(Booking.package).load_only(Package.id, Package.agent_id),
+    )
+
+
+def booking_detail_loaders():
+    """Relations used by booking_detail (ownership check + assigned guide)"""
+    return booking_owner_loaders() + (
+        selectinload(Booking.guide_assignments)
+        .joinedload(TourGuideAssignment.guide)
+        .load_only(User.id, User.name),
+    )
+
+
+def review_tourist_loaders():
+    """Relations used by review_by_package (reviewer summary)"""
+    return (
+        joinedload(Review.tourist).load_only(User.id, User.name),
+    )
+
+
+def review_package_loaders():
+    """Relations used by review_by_tourist (package summary)"""
+    return (
+        joinedload(Review.package).load_only(Package.id, Package.name),
+    )
+
+
+def with_loaders(stmt, loaders):
+    """
+    Apply loader options to a select() statement
+
+    Args:
+        stmt: SQLAlchemy select statement
+        loaders: Tuple of loader options (one of the *_loaders() functions above)
+
+    Returns:
+        Statement with loader options applied
+    """
+    return stmt.options(*loaders)
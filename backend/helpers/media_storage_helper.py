@@ -0,0 +1,281 @@
+"""
+Media Storage Helper - Content-addressed storage untuk file upload
+File disimpan dengan nama SHA-256 dari isinya di direktori sharded (ab/cd/<sha256>.jpg),
+jadi upload yang sama cukup lookup hash + increment ref_count tanpa menulis file baru.
+URL-nya immutable (isi file tidak pernah berubah) sehingga bisa di-cache browser selamanya
+"""
+import hashlib
+import os
+import re
+import tempfile
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from models.media_object_model import MediaObject
+
+
+MAX_UPLOAD_BYTES = 5 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+SPOOL_MEMORY_BYTES = 1024 * 1024  # upload lebih kecil dari ini di-hash tanpa menyentuh disk
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+PRIVATE_IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+# Grace period sebelum file tanpa referensi dihapus, supaya upload yang sedang berjalan aman
+GC_GRACE_PERIOD = timedelta(hours=24)
+
+EXTENSION_ALIASES = {".jpeg": ".jpg"}
+
+_DIGEST_PATH = re.compile(r"^(?:variants/)?([0-9a-f]{2})/([0-9a-f]{2})/([0-9a-f]{64})[-.]")
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class StoredMedia:
+    digest: str
+    path: Path
+    url: str
+    created: bool  # False kalau isi file sudah ada (deduplicated)
+
+
+class MediaStore:
+    """Content-addressed file store for one storage area"""
+
+    def __init__(self, namespace: str, root: Path, url_prefix: str, cache_control: str = IMMUTABLE_CACHE_CONTROL):
+        self.namespace = namespace
+        self.root = root
+        self.url_prefix = url_prefix
+        self.cache_control = cache_control
+
+    @staticmethod
+    def shard(digest: str) -> str:
+        return f"{digest[:2]}/{digest[2:4]}"
+
+    def path_for(self, digest: str, extension: str) -> Path:
+        return self.root / self.shard(digest) / f"{digest}{extension}"
+
+    def url_for(self, digest: str, extension: str) -> str:
+        return f"{self.url_prefix}/{self.shard(digest)}/{digest}{extension}"
+
+    def digest_from_url(self, url: str):
+        """Return digest of a URL served by this store, None for legacy/external URLs"""
+        if not url or not url.startswith(self.url_prefix + "/"):
+            return None
+        match = _DIGEST_PATH.match(url[len(self.url_prefix) + 1:])
+        return match.group(3) if match else None
+
+    def put(self, session, file_obj, extension: str, max_bytes: int = MAX_UPLOAD_BYTES) -> StoredMedia:
+        """
+        Store upload content and take one reference on it
+
+        The reference is added in the caller's transaction, so it is only kept
+        if the row pointing at the URL is committed as well. Before the file
+        is written, the content is registered with ref_count 0 in a separate
+        committed transaction: if the caller rolls back, the file is still
+        known and collect_garbage() removes it after the grace period.
+
+        Args:
+            session: SQLAlchemy session of the request
+            file_obj: File-like object of the upload
+            extension: File extension including the dot
+            max_bytes: Maximum allowed size
+
+        Returns:
+            StoredMedia
+
+        Raises:
+            UploadTooLarge: If the upload exceeds max_bytes
+        """
+        extension = EXTENSION_ALIASES.get(extension.lower(), extension.lower())
+        hasher = hashlib.sha256()
+        size = 0
+
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES) as spool:
+            while True:
+                chunk = file_obj.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"File size exceeds {max_bytes // (1024 * 1024)}MB limit")
+                hasher.update(chunk)
+                spool.write(chunk)
+
+            digest = hasher.hexdigest()
+            # Same content uploaded with another extension keeps the first one
+            extension = self._register(session, digest, extension, size)
+            path = self.path_for(digest, extension)
+
+            created = False
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f".{uuid.uuid4()}.tmp")
+                spool.seek(0)
+                with open(tmp_path, "wb") as f:
+                    while True:
+                        chunk = spool.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                os.replace(tmp_path, path)
+                created = True
+
+        self._acquire(session, digest, extension, size)
+        return StoredMedia(digest, path, self.url_for(digest, extension), created)
+
+    def retain(self, session, urls):
+        """Take one reference on every content-addressed URL in urls"""
+        self._adjust(session, urls, 1)
+
+    def release(self, session, urls):
+        """Drop one reference on every content-addressed URL in urls"""
+        self._adjust(session, urls, -1)
+
+    def collect_garbage(self, session, grace_period: timedelta = GC_GRACE_PERIOD, derived_dirs=()) -> int:
+        """
+        Delete files that have had no references for longer than grace_period
+
+        Files are unlinked while the rows are still locked, so a concurrent
+        put() of the same content waits and then writes the file again.
+
+        Args:
+            session: SQLAlchemy session
+            grace_period: Minimum time since the last reference was dropped
+            derived_dirs: Directories holding files derived from the digest
+                (e.g. image variants named <digest>-thumb.webp)
+
+        Returns:
+            Number of files removed
+        """
+        cutoff = datetime.now(timezone.utc) - grace_period
+        rows = session.execute(
+            select(MediaObject.digest, MediaObject.extension)
+            .where(
+                MediaObject.namespace == self.namespace,
+                MediaObject.ref_count == 0,
+                MediaObject.updated_at < cutoff,
+            )
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        for digest, extension in rows:
+            self.path_for(digest, extension).unlink(missing_ok=True)
+            for derived_dir in derived_dirs:
+                for derived in (derived_dir / self.shard(digest)).glob(f"{digest}-*"):
+                    derived.unlink(missing_ok=True)
+
+        if rows:
+            session.execute(
+                delete(MediaObject).where(
+                    MediaObject.namespace == self.namespace,
+                    MediaObject.digest.in_([digest for digest, _ in rows]),
+                )
+            )
+        session.commit()
+        return len(rows)
+
+    def _register(self, session, digest: str, extension: str, size: int) -> str:
+        """
+        Make sure a media_objects row exists for digest, committed on its own connection
+
+        Touches updated_at of an existing row so collect_garbage() does not
+        delete the file while this upload is in progress.
+
+        Returns:
+            Extension of the stored file
+        """
+        stmt = insert(MediaObject).values(
+            namespace=self.namespace,
+            digest=digest,
+            extension=extension,
+            size=size,
+            ref_count=0,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MediaObject.namespace, MediaObject.digest],
+            set_={"updated_at": datetime.now(timezone.utc)},
+        ).returning(MediaObject.extension)
+        with Session(bind=session.get_bind()) as registry:
+            extension = registry.execute(stmt).scalar_one()
+            registry.commit()
+        return extension
+
+    def _acquire(self, session, digest: str, extension: str, size: int) -> str:
+        stmt = insert(MediaObject).values(
+            namespace=self.namespace,
+            digest=digest,
+            extension=extension,
+            size=size,
+            ref_count=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MediaObject.namespace, MediaObject.digest],
+            set_={
+                "ref_count": MediaObject.ref_count + 1,
+                "updated_at": datetime.now(timezone.utc),
+            },
+        ).returning(MediaObject.extension)
+        return session.execute(stmt).scalar_one()
+
+    def _adjust(self, session, urls, delta: int):
+        counts = {}
+        for url in urls or []:
+            digest = self.digest_from_url(url)
+            if digest:
+                counts[digest] = counts.get(digest, 0) + 1
+
+        for digest, count in counts.items():
+            session.execute(
+                update(MediaObject)
+                .where(MediaObject.namespace == self.namespace, MediaObject.digest == digest)
+                .values(ref_count=func.greatest(MediaObject.ref_count + delta * count, 0))
+            )
+
+
+PACKAGE_MEDIA = MediaStore("packages", Path("storage/packages"), "/packages")
+DESTINATION_MEDIA = MediaStore("destinations", Path("storage/destinations"), "/destinations")
+PAYMENT_PROOF_MEDIA = MediaStore(
+    "payment_proofs",
+    Path("storage/payment_proofs"),
+    "/payment_proofs",
+    cache_control=PRIVATE_IMMUTABLE_CACHE_CONTROL,
+)
+
+MEDIA_STORES = (PACKAGE_MEDIA, DESTINATION_MEDIA, PAYMENT_PROOF_MEDIA)
+
+
+def immutable_cache_control(path: str):
+    """
+    Cache-Control for a request path if it points at content-addressed media
+
+    Args:
+        path: request.path (e.g. /packages/ab/cd/<sha256>.jpg)
+
+    Returns:
+        Cache-Control header value or None for other paths
+    """
+    for store in MEDIA_STORES:
+        if store.digest_from_url(path):
+            return store.cache_control
+    return None
+
+
+if __name__ == "__main__":
+    # python -m helpers.media_storage_helper  -> hapus file yang sudah tidak direferensikan
+    from db import Session as DbSession
+    from helpers.image_helper import PACKAGE_VARIANT_DIR
+
+    with DbSession() as session:
+        for store in MEDIA_STORES:
+            derived = (PACKAGE_VARIANT_DIR,) if store is PACKAGE_MEDIA else ()
+            removed = store.collect_garbage(session, derived_dirs=derived)
+            print(f"{store.namespace}: removed {removed} unreferenced files")
@@ -0,0 +1,31 @@
+"""
+Media Task Helper - Fungsi yang dijalankan di worker process (lihat worker_pool_helper)
+Argumen dan hasil berupa bytes/str biasa supaya murah di-pickle antar proses
+"""
+from io import BytesIO
+
+from PIL import Image
+
+
+def decode_qr_image(image_data: bytes) -> list:
+    """
+    Decode all QR/barcodes in an uploaded image
+
+    Returns:
+        List of decoded payloads (UTF-8 strings), empty if nothing was found
+    """
+    # pyzbar butuh libzbar, hanya di-import di worker yang memakainya
+    from pyzbar.pyzbar import decode
+
+    with Image.open(BytesIO(image_data)) as image:
+        return [obj.data.decode("utf-8") for obj in decode(image)]
+
+
+def verify_image(image_data: bytes) -> bool:
+    """True if Pillow can parse the image (header and structure, no full decode)"""
+    try:
+        with Image.open(BytesIO(image_data)) as image:
+            image.verify()
+        return True
+    except Exception:
+        return False
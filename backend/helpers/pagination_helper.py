@@ -0,0 +1,140 @@
+"""
+Pagination Helper - Keyset (cursor) pagination untuk list endpoint
+Cursor bersifat opaque bagi client, isinya posisi baris terakhir di halaman sebelumnya
+"""
+import base64
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from sqlalchemy import select, func, tuple_
+
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+# Sampai jumlah ini total dihitung exact, di atasnya pakai estimasi planner
+EXACT_COUNT_THRESHOLD = 1000
+
+
+def parse_limit(raw_limit, default: int = DEFAULT_LIMIT, maximum: int = MAX_LIMIT) -> int:
+    """
+    Parse `limit` query parameter
+
+    Args:
+        raw_limit: Raw value from request.params (may be None)
+        default: Limit used when parameter is missing
+        maximum: Upper bound of items per page
+
+    Returns:
+        Limit clamped to 1..maximum
+
+    Raises:
+        ValueError: If limit is not a valid integer
+    """
+    if raw_limit in (None, ""):
+        return default
+
+    limit = int(raw_limit)
+    return max(1, min(limit, maximum))
+
+
+def encode_cursor(sort_key: str, value, row_id) -> str:
+    """
+    Encode position of the last row into an opaque cursor string
+
+    Args:
+        sort_key: Name of the sort key the page was ordered by
+        value: Value of the sort column on the last row
+        row_id: Primary key of the last row (tiebreak)
+
+    Returns:
+        URL-safe base64 cursor
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+
+    payload = json.dumps({"k": sort_key, "v": value, "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, value_type) -> tuple:
+    """
+    Decode cursor back into (sort value, row id)
+
+    Args:
+        cursor: Cursor string from client
+        sort_key: Sort key of the current request, must match the cursor
+        value_type: Callable converting the stored value (e.g. int, Decimal, datetime.fromisoformat)
+
+    Returns:
+        Tuple of (sort value, row id)
+
+    Raises:
+        ValueError: If cursor is malformed or was issued for another sort key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload["k"] != sort_key:
+            raise ValueError("Cursor does not match sort order")
+        return value_type(payload["v"]), uuid.UUID(payload["id"])
+    except (KeyError, TypeError, InvalidOperation, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def keyset_condition(sort_column, id_column, value, row_id, descending: bool = False):
+    """
+    Build WHERE condition selecting rows after (value, row_id) in sort order
+
+    Uses a row-value comparison so PostgreSQL can seek on a composite
+    (sort_column, id) index instead of skipping OFFSET rows.
+
+    Args:
+        sort_column: Column the list is ordered by (must be NOT NULL in practice)
+        id_column: Primary key column used as tiebreak
+        value: Sort value of the last row of previous page
+        row_id: Primary key of the last row of previous page
+        descending: True if the list is ordered descending
+
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    if descending:
+        return tuple_(sort_column, id_column) < tuple_(value, row_id)
+    return tuple_(sort_column, id_column) > tuple_(value, row_id)
+
+
+def estimate_total(session, stmt, threshold: int = EXACT_COUNT_THRESHOLD) -> tuple:
+    """
+    Count rows matched by stmt without an unbounded COUNT(*)
+
+    Counts at most threshold + 1 rows exactly; if there are more, the
+    planner's row estimate (EXPLAIN) is returned instead, so the cost stays
+    constant however large the table grows.
+
+    Args:
+        session: SQLAlchemy session
+        stmt: Filtered select without cursor condition, ordering or limit
+        threshold: Largest total that is counted exactly
+
+    Returns:
+        Tuple of (total, is_exact)
+    """
+    stmt = stmt.order_by(None)
+    bounded = session.execute(
+        select(func.count()).select_from(stmt.limit(threshold + 1).subquery())
+    ).scalar_one()
+    if bounded <= threshold:
+        return bounded, True
+
+    # Literal binds supaya EXPLAIN bisa dijalankan sebagai satu string SQL
+    compiled = stmt.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return max(int(plan[0]["Plan"]["Plan Rows"]), bounded), False
@@ -0,0 +1,376 @@
+"""
+QR Render Helper - Render QR code (PNG/SVG) dan cache gambar yang content-addressed
+Nama file = SHA-256 dari QRIS string + parameter render, jadi QRIS + amount yang sama
+(mis. harga package yang tetap) cukup dirender sekali. Cache di disk dibatasi ukurannya
+dan dievict secara LRU lewat index di memori.
+View memilih output lewat ?format=png|svg dan ?transport=inline|stream.
+Render dari view dijalankan di MEDIA_POOL (render_qr_in_pool), bukan di thread request
+"""
+import base64
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+import qrcode
+from pyramid.response import Response
+from qrcode.constants import ERROR_CORRECT_L, ERROR_CORRECT_M, ERROR_CORRECT_Q, ERROR_CORRECT_H
+from qrcode.image.svg import SvgPathFillImage
+
+from helpers.media_storage_helper import MediaStore, IMMUTABLE_CACHE_CONTROL
+from helpers.worker_pool_helper import MEDIA_POOL
+
+
+QR_STORAGE_DIR = Path("storage/qris")
+QR_CACHE_DIR = QR_STORAGE_DIR / "rendered"
+QR_CACHE_URL = "/qris/rendered"
+QR_CACHE_MAX_BYTES = int(os.getenv("QR_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# File dynamic_<uuid>.png dari versi lama yang lebih tua dari ini dihapus oleh GC
+LEGACY_GRACE_PERIOD = timedelta(days=1)
+
+ERROR_CORRECTION_LEVELS = {
+    "L": ERROR_CORRECT_L,
+    "M": ERROR_CORRECT_M,
+    "Q": ERROR_CORRECT_Q,
+    "H": ERROR_CORRECT_H,
+}
+
+# format -> Content-Type
+QR_FORMATS = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+}
+# inline: gambar di dalam JSON (PNG base64, SVG teks), stream: body response = gambar
+QR_TRANSPORTS = ("inline", "stream")
+
+_CACHE_FILE = re.compile(r"^([0-9a-f]{64})\.(\w+)$")
+_CACHE_URL = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{2}/([0-9a-f]{64})\.\w+$")
+
+
+@dataclass(frozen=True)
+class QrRenderParams:
+    """Everything besides the data that changes the rendered bytes"""
+    box_size: int = 10
+    border: int = 4
+    error_correction: str = "L"
+    fill_color: str = "black"
+    back_color: str = "white"
+    image_format: str = "png"
+
+    def cache_token(self) -> str:
+        return "|".join(
+            str(value) for value in (
+                self.image_format, self.error_correction, self.box_size,
+                self.border, self.fill_color, self.back_color,
+            )
+        )
+
+
+@dataclass(frozen=True)
+class RenderedQr:
+    digest: str
+    path: Path
+    url: str
+    hit: bool  # False kalau baru dirender pada request ini
+
+
+def render_key(data: str, params: QrRenderParams) -> str:
+    """SHA-256 over render parameters and QR data"""
+    digest = hashlib.sha256()
+    digest.update(params.cache_token().encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(data.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _make_qr(data: str, params: QrRenderParams):
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=ERROR_CORRECTION_LEVELS[params.error_correction],
+        box_size=params.box_size,
+        border=params.border,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+def render_qr_png(data: str, params: QrRenderParams) -> bytes:
+    """Render data as a PNG QR code (smallest version that fits)"""
+    img = _make_qr(data, params).make_image(fill_color=params.fill_color, back_color=params.back_color)
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def render_qr_svg(data: str, params: QrRenderParams) -> bytes:
+    """
+    Render data as an SVG QR code
+
+    Uses qrcode's path factory: one <path> for all modules on a background
+    rect, no rasterizing, scales losslessly.
+    """
+    img = _make_qr(data, params).make_image(image_factory=SvgPathFillImage)
+    return img.to_string(encoding="unicode").encode("utf-8")
+
+
+_RENDERERS = {
+    "png": render_qr_png,
+    "svg": render_qr_svg,
+}
+
+
+def render_qr(data: str, params: QrRenderParams) -> bytes:
+    """Render data in params.image_format"""
+    return _RENDERERS[params.image_format](data, params)
+
+
+def render_qr_in_pool(data: str, params: QrRenderParams) -> bytes:
+    """
+    render_qr in a MEDIA_POOL worker process
+
+    Raises:
+        WorkerPoolError: Pool is full or the render timed out
+    """
+    return MEDIA_POOL.run(render_qr, data, params)
+
+
+def parse_qr_options(request, default_format: str = "png", default_transport: str = "inline") -> tuple:
+    """
+    Read `format` and `transport` query parameters
+
+    Returns:
+        Tuple (image_format, transport); transport is default_transport when
+        the parameter is missing (may be None for view-specific behaviour)
+
+    Raises:
+        ValueError: If a value is not supported
+    """
+    image_format = (request.params.get("format") or default_format).lower()
+    if image_format not in QR_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(QR_FORMATS)}")
+
+    transport = request.params.get("transport") or default_transport
+    if transport is not None:
+        transport = transport.lower()
+        if transport not in QR_TRANSPORTS:
+            raise ValueError(f"transport must be one of: {', '.join(QR_TRANSPORTS)}")
+    return image_format, transport
+
+
+def inline_image(content: bytes, image_format: str) -> str:
+    """Image as a JSON string: SVG markup as is, PNG as base64"""
+    if image_format == "svg":
+        return content.decode("utf-8")
+    return base64.b64encode(content).decode("ascii")
+
+
+def stream_response(content: bytes, image_format: str, headers: dict = None, cache_control: str = None) -> Response:
+    """
+    Response whose body is the image itself
+
+    Args:
+        content: Rendered image bytes
+        image_format: "png" or "svg"
+        headers: Extra headers (e.g. payment metadata)
+        cache_control: Cache-Control value, default no-store
+    """
+    response = Response(body=content, content_type=QR_FORMATS[image_format])
+    response.headers["Cache-Control"] = cache_control or "no-store"
+    for name, value in (headers or {}).items():
+        response.headers[name] = value
+    return response
+
+
+class QrRenderCache:
+    """
+    On-disk LRU of rendered QR images with an in-memory index
+
+    Files live at root/ab/cd/<digest>.<format>. The index (digest -> size,
+    least recently used first) is built from the directory on first use;
+    hits touch the file mtime so the order survives restarts. When the total
+    size exceeds max_bytes the least recently used files are deleted.
+    Several processes may share the directory: a hit whose file was evicted
+    by another process is rendered again, collect_garbage() re-syncs the
+    index with the disk.
+    """
+
+    def __init__(self, root: Path, url_prefix: str, max_bytes: int = QR_CACHE_MAX_BYTES,
+                 cache_control: str = IMMUTABLE_CACHE_CONTROL):
+        self.root = root
+        self.url_prefix = url_prefix
+        self.max_bytes = max_bytes
+        self.cache_control = cache_control
+        self._index = None  # OrderedDict[(digest, ext)] -> size
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def path_for(self, digest: str, extension: str) -> Path:
+        return self.root / MediaStore.shard(digest) / f"{digest}.{extension}"
+
+    def url_for(self, digest: str, extension: str) -> str:
+        return f"{self.url_prefix}/{MediaStore.shard(digest)}/{digest}.{extension}"
+
+    def digest_from_url(self, url: str):
+        """Return digest of a URL served by this cache, None for other URLs"""
+        if not url or not url.startswith(self.url_prefix + "/"):
+            return None
+        match = _CACHE_URL.match(url[len(self.url_prefix) + 1:])
+        return match.group(1) if match else None
+
+    def _scan(self) -> OrderedDict:
+        """Read cache files from disk, least recently used first"""
+        entries = []
+        if self.root.exists():
+            for path in self.root.glob("*/*/*"):
+                match = _CACHE_FILE.match(path.name)
+                if not match:
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, (match.group(1), match.group(2)), stat.st_size))
+        entries.sort()
+        return OrderedDict((key, size) for _, key, size in entries)
+
+    def _ensure_index(self):
+        if self._index is None:
+            self._index = self._scan()
+            self._total = sum(self._index.values())
+
+    def _evict(self) -> int:
+        """Delete least recently used files until under max_bytes (lock held)"""
+        removed = 0
+        while self._total > self.max_bytes and len(self._index) > 1:
+            (digest, extension), size = self._index.popitem(last=False)
+            self._total -= size
+            try:
+                self.path_for(digest, extension).unlink()
+            except FileNotFoundError:
+                pass
+            removed += 1
+        return removed
+
+    def get_or_render(self, data: str, params: QrRenderParams = QrRenderParams(), render=render_qr) -> RenderedQr:
+        """
+        Return the cached image for (data, params), rendering it on a miss
+
+        Args:
+            data: QR payload (e.g. dynamic QRIS string)
+            params: Render parameters
+            render: Callable(data, params) -> bytes used on a miss
+
+        Returns:
+            RenderedQr with file path and URL
+        """
+        digest = render_key(data, params)
+        extension = params.image_format
+        key = (digest, extension)
+        path = self.path_for(digest, extension)
+
+        with self._lock:
+            self._ensure_index()
+            hit = key in self._index
+            if hit:
+                self._index.move_to_end(key)
+
+        if hit:
+            try:
+                os.utime(path)
+                return RenderedQr(digest, path, self.url_for(digest, extension), True)
+            except FileNotFoundError:
+                # Dievict proses lain, render ulang
+                with self._lock:
+                    self._total -= self._index.pop(key, 0)
+
+        content = render(data, params)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            # Tulis ke file sementara lalu rename supaya tidak ada yang membaca file setengah jadi
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+                tmp.write(content)
+            os.replace(tmp.name, path)
+
+        with self._lock:
+            if key not in self._index:
+                self._index[key] = len(content)
+                self._total += len(content)
+            self._index.move_to_end(key)
+            self._evict()
+
+        return RenderedQr(digest, path, self.url_for(digest, extension), False)
+
+    def get_content(self, data: str, params: QrRenderParams = QrRenderParams(), render=render_qr) -> tuple:
+        """
+        Like get_or_render, but also return the image bytes
+
+        Returns:
+            Tuple (RenderedQr, bytes)
+        """
+        rendered = self.get_or_render(data, params, render)
+        try:
+            return rendered, rendered.path.read_bytes()
+        except FileNotFoundError:
+            # Dievict tepat setelah ditulis (cache sangat kecil / proses lain)
+            return rendered, render(data, params)
+
+    def collect_garbage(self, legacy_dir: Path = None, legacy_grace: timedelta = LEGACY_GRACE_PERIOD) -> int:
+        """
+        Re-sync the index with the disk and enforce the size cap
+
+        Also removes leftover temp files and, if legacy_dir is given,
+        dynamic_<uuid>.png files written before the cache existed.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        cutoff = time.time() - legacy_grace.total_seconds()
+
+        if self.root.exists():
+            for tmp in self.root.glob("*/*/*.tmp"):
+                try:
+                    if tmp.stat().st_mtime < cutoff:
+                        tmp.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+
+        if legacy_dir is not None and legacy_dir.exists():
+            for legacy in legacy_dir.glob("dynamic_*.png"):
+                try:
+                    if legacy.stat().st_mtime < cutoff:
+                        legacy.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+
+        with self._lock:
+            self._index = self._scan()
+            self._total = sum(self._index.values())
+            removed += self._evict()
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._ensure_index()
+            return {"files": len(self._index), "bytes": self._total, "max_bytes": self.max_bytes}
+
+
+QR_RENDER_CACHE = QrRenderCache(QR_CACHE_DIR, QR_CACHE_URL)
+
+
+if __name__ == "__main__":
+    # python -m helpers.qr_render_helper  -> enforce batas ukuran + hapus dynamic_*.png lama
+    removed = QR_RENDER_CACHE.collect_garbage(legacy_dir=QR_STORAGE_DIR)
+    print(f"qr render cache: removed {removed} files, {QR_RENDER_CACHE.stats()}")
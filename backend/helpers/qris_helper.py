@@ -2,6 +2,36 @@
 QRIS Helper - Generate dan validasi dynamic QRIS string
 Mengikuti standard QRIS Indonesia
 """
+import binascii
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+# CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF) sesuai EMVCo, dihitung per byte UTF-8.
+# binascii.crc_hqx adalah implementasi table-driven (256 entry) di C dengan polynomial
+# yang sama dan menerima nilai CRC sebelumnya, jadi bisa dilanjutkan (resumable)
+CRC16_INIT = 0xFFFF
+
+
+def crc16_update(crc: int, data) -> int:
+    """
+    Continue a CRC16 computation over more data
+
+    Args:
+        crc: Current CRC state (CRC16_INIT for a new checksum)
+        data: str (encoded as UTF-8) or bytes
+
+    Returns:
+        New CRC state, pass it to crc16_update again or to crc16_hex
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return binascii.crc_hqx(data, crc)
+
+
+def crc16_hex(crc: int) -> str:
+    """Format a CRC state as the 4-character uppercase hex used in tag 63"""
+    return format(crc, '04X')
 
 
 def crc16(data: str) -> str:
@@ -14,25 +44,230 @@ def crc16(data: str) -> str:
     Returns:
         CRC16 checksum as 4-character hex string (uppercase)
     """
-    crc = 0xFFFF
-    
-    for char in data:
-        crc ^= ord(char) << 8
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
-            else:
-                crc = (crc << 1) & 0xFFFF
-    
-    hex_value = format(crc & 0xFFFF, '04X')
-    return hex_value
+    return crc16_hex(crc16_update(CRC16_INIT, data))
+
+
+def crc16_batch(payloads, initial: int = CRC16_INIT) -> list:
+    """
+    Checksum many payloads in one call
+
+    Args:
+        payloads: Iterable of str/bytes payloads
+        initial: CRC state to start every payload from, e.g. the state after a
+            shared prefix (crc16_update(CRC16_INIT, prefix))
+
+    Returns:
+        List of 4-character hex checksums in input order
+    """
+    crc_hqx = binascii.crc_hqx
+    return [
+        format(crc_hqx(payload.encode("utf-8") if isinstance(payload, str) else payload, initial), '04X')
+        for payload in payloads
+    ]
+
+
+# Tag EMVCo yang dipakai di sini (top level)
+TAG_POINT_OF_INITIATION = "01"
+TAG_AMOUNT = "54"
+TAG_TIP_INDICATOR = "55"
+TAG_FEE_FIXED = "56"
+TAG_FEE_PERCENTAGE = "57"
+TAG_MERCHANT_NAME = "59"
+TAG_MERCHANT_CITY = "60"
+TAG_CRC = "63"
+
+POINT_OF_INITIATION_STATIC = "11"
+POINT_OF_INITIATION_DYNAMIC = "12"
+# Nilai tag 55: 02 = convenience fee tetap (tag 56), 03 = persentase (tag 57)
+TIP_FIXED_FEE = "02"
+TIP_PERCENTAGE_FEE = "03"
+
+# "6304" = header tag CRC, ikut dihitung dalam checksum
+CRC_HEADER = f"{TAG_CRC}04"
+
+
+def parse_tlv(payload: str) -> tuple:
+    """
+    Parse an EMVCo tag-length-value string (one level)
+
+    Args:
+        payload: Concatenated data objects, each "TTLLvalue" with 2-digit
+            tag and 2-digit length (in characters)
+
+    Returns:
+        Tuple of (tag, value) pairs in payload order; nested templates
+        (e.g. tag 26-51, 62) are returned raw and can be parsed again
+
+    Raises:
+        ValueError: If a header is not numeric or a length runs past the end
+    """
+    fields = []
+    position = 0
+    size = len(payload)
+    while position < size:
+        header = payload[position:position + 4]
+        if len(header) < 4 or not header.isdigit():
+            raise ValueError(f"Invalid TLV header {header!r} at position {position}")
+        end = position + 4 + int(header[2:])
+        if end > size:
+            raise ValueError(f"Tag {header[:2]} length {header[2:]} exceeds payload")
+        fields.append((header[:2], payload[position + 4:end]))
+        position = end
+    return tuple(fields)
+
+
+def encode_tlv(tag: str, value: str) -> str:
+    """
+    Encode one data object as "TTLLvalue"
+
+    Raises:
+        ValueError: If value is longer than 99 characters
+    """
+    if len(value) > 99:
+        raise ValueError(f"Value of tag {tag} is longer than 99 characters")
+    return f"{tag}{len(value):02d}{value}"
+
+
+@dataclass(frozen=True)
+class QrisTemplate:
+    """
+    Static QRIS parsed once and pre-serialized around the amount/fee tags
+
+    A dynamic payload is prefix + tag 54 + fee tags (55-57) + suffix + CRC,
+    with the CRC continued from prefix_crc, so rendering never rescans the
+    static string.
+
+    Attributes:
+        fields: Top-level (tag, value) pairs of the static QRIS, without CRC
+        prefix: Tags before 54 with point of initiation set to dynamic (12)
+        fee_tags: Tags 55-57 of the static QRIS, kept when no fee is given
+        suffix: Tags after 57 followed by the CRC header "6304"
+        prefix_crc: CRC16 state after prefix
+    """
+    fields: tuple
+    prefix: str
+    fee_tags: str
+    suffix: str
+    prefix_crc: int
+
+    def get(self, tag: str, default=None):
+        """Value of a top-level tag of the static QRIS"""
+        for field_tag, value in self.fields:
+            if field_tag == tag:
+                return value
+        return default
+
+
+def build_qris_template(static_qris: str) -> QrisTemplate:
+    """
+    Parse a static QRIS into a QrisTemplate
+
+    Args:
+        static_qris: Static QRIS string (dari scan/upload QR)
+
+    Returns:
+        QrisTemplate
+
+    Raises:
+        ValueError: If the string is not valid TLV or has no CRC tag at the end
+    """
+    fields = parse_tlv(static_qris)
+    if not fields or fields[-1][0] != TAG_CRC:
+        raise ValueError("QRIS tidak memiliki CRC (tag 63) di akhir")
+    fields = fields[:-1]
+
+    prefix, fee_tags, suffix = [], [], []
+    for tag, value in fields:
+        if tag == TAG_POINT_OF_INITIATION:
+            value = POINT_OF_INITIATION_DYNAMIC
+        if tag == TAG_AMOUNT:
+            # Amount selalu diisi per pembayaran
+            continue
+        if tag < TAG_AMOUNT:
+            prefix.append(encode_tlv(tag, value))
+        elif tag <= TAG_FEE_PERCENTAGE:
+            fee_tags.append(encode_tlv(tag, value))
+        else:
+            suffix.append(encode_tlv(tag, value))
+
+    if not any(tag == TAG_POINT_OF_INITIATION for tag, _ in fields):
+        # Tag 01 opsional di QRIS statis, setelah tag 00 (payload format indicator)
+        position = 1 if fields and fields[0][0] == "00" else 0
+        prefix.insert(position, encode_tlv(TAG_POINT_OF_INITIATION, POINT_OF_INITIATION_DYNAMIC))
+
+    prefix = "".join(prefix)
+    return QrisTemplate(
+        fields=fields,
+        prefix=prefix,
+        fee_tags="".join(fee_tags),
+        suffix="".join(suffix) + CRC_HEADER,
+        prefix_crc=crc16_update(CRC16_INIT, prefix),
+    )
+
+
+@lru_cache(maxsize=1024)
+def qris_template(qris_id, static_qris: str) -> QrisTemplate:
+    """
+    Template of a stored Qris row, parsed once per Qris.id
+
+    The static string is part of the key so an edited row never reuses a
+    stale template.
+
+    Raises:
+        ValueError: See build_qris_template
+    """
+    return build_qris_template(static_qris)
+
+
+@lru_cache(maxsize=256)
+def _template_from_string(static_qris: str) -> QrisTemplate:
+    # Untuk QRIS yang belum disimpan (mis. preview), di-cache per string
+    return build_qris_template(static_qris)
+
+
+def _fee_tags(fee_type: str = None, fee_value=None):
+    """Serialized tags 55 + 56/57 for a fee, or None when there is no fee"""
+    if not fee_value or float(fee_value) <= 0:
+        return None
+    if fee_type and fee_type.lower() == "rupiah":
+        return encode_tlv(TAG_TIP_INDICATOR, TIP_FIXED_FEE) + encode_tlv(TAG_FEE_FIXED, str(int(fee_value)))
+    # Percentage
+    return encode_tlv(TAG_TIP_INDICATOR, TIP_PERCENTAGE_FEE) + encode_tlv(TAG_FEE_PERCENTAGE, str(fee_value))
+
+
+def render_dynamic_qris(
+    template: QrisTemplate,
+    amount: float,
+    fee_type: str = None,
+    fee_value: float = None
+) -> str:
+    """
+    Render a dynamic QRIS string from a template
+
+    Args:
+        template: QrisTemplate of the merchant's static QRIS
+        amount: Amount to be paid in rupiah
+        fee_type: Fee type ('persentase' or 'rupiah'), optional
+        fee_value: Fee value, optional; replaces tags 55-57 of the static QRIS
+
+    Returns:
+        Dynamic QRIS string including CRC
+    """
+    fee_tags = _fee_tags(fee_type, fee_value)
+    rest = (
+        encode_tlv(TAG_AMOUNT, str(int(amount)))
+        + (template.fee_tags if fee_tags is None else fee_tags)
+        + template.suffix
+    )
+    return template.prefix + rest + crc16_hex(crc16_update(template.prefix_crc, rest))
 
 
 def generate_dynamic_qris_string(
     static_qris: str,
     amount: float,
     fee_type: str = None,
-    fee_value: float = None
+    fee_value: float = None,
+    qris_id=None
 ) -> str:
     """
     Generate dynamic QRIS string from static QRIS with amount and fee information
@@ -42,6 +277,7 @@ def generate_dynamic_qris_string(
         amount: Amount to be paid in rupiah
         fee_type: Fee type ('persentase' or 'rupiah'), optional
         fee_value: Fee value, optional
+        qris_id: Qris.id if static_qris is a stored row (template cached per id)
     
     Returns:
         Dynamic QRIS string with amount info (atau static QRIS jika format tidak bisa dikonversi)
@@ -54,57 +290,21 @@ def generate_dynamic_qris_string(
         raise ValueError("Data QRIS statis tidak valid.")
     
     try:
-        # Remove CRC from static QRIS (last 4 chars)
-        qris_without_crc = static_qris[:-4]
-        
-        # Convert static to dynamic (010211 -> 010212)
-        step1 = qris_without_crc.replace("010211", "010212")
-        
-        # Split by country code
-        parts = step1.split("5802ID")
-        if len(parts) != 2:
-            # Jika format tidak sesuai, return static QRIS dengan info amount di note
-            # Ini untuk QRIS format yang non-standard
-            return static_qris
-        
-        # Generate amount tag
-        amount_int = int(amount)
-        amount_str = str(amount_int)
-        amount_length = str(len(amount_str)).zfill(2)
-        amount_tag = f"54{amount_length}{amount_str}"
-        
-        # Generate fee tag if provided
-        fee_tag = ""
-        if fee_value and float(fee_value) > 0:
-            if fee_type and fee_type.lower() == "rupiah":
-                fee_int = int(fee_value)
-                fee_str = str(fee_int)
-                fee_length = str(len(fee_str)).zfill(2)
-                fee_tag = f"55020256{fee_length}{fee_str}"
-            else:
-                # Percentage
-                fee_str = str(fee_value)
-                fee_length = str(len(fee_str)).zfill(2)
-                fee_tag = f"55020357{fee_length}{fee_str}"
-        
-        # Construct final payload
-        payload = f"{parts[0]}{amount_tag}{fee_tag}5802ID{parts[1]}"
-        
-        # Calculate and append CRC
-        final_crc = crc16(payload)
-        
-        return payload + final_crc
-    
+        if qris_id is not None:
+            template = qris_template(qris_id, static_qris)
+        else:
+            template = _template_from_string(static_qris)
+        return render_dynamic_qris(template, amount, fee_type, fee_value)
     except Exception as e:
         print(f"Warning: Could not generate dynamic QRIS: {str(e)}. Returning static QRIS.")
-        # Fallback: return static QRIS if conversion fails
+        # Fallback: return static QRIS if conversion fails (format non-standard)
         return static_qris
 
 
 def decode_qris_string(qris_string: str) -> dict:
     """
     Decode QRIS string to extract information
-    Basic decoding - extracts amount and merchant info
+    Parses the top-level tags - point of initiation, amount and merchant info
     
     Args:
         qris_string: QRIS string to decode
@@ -124,31 +324,33 @@ def decode_qris_string(qris_string: str) -> dict:
     if not qris_string or len(qris_string) < 4:
         return result
     
-    # Check CRC
-    payload = qris_string[:-4]
-    checksum = qris_string[-4:]
-    calculated_crc = crc16(payload)
+    try:
+        fields = dict(parse_tlv(qris_string))
+    except ValueError:
+        return result
     
-    if checksum != calculated_crc:
+    # Check CRC (tag 63 harus tag terakhir, checksum dihitung sampai "6304")
+    if not qris_string[:-4].endswith(CRC_HEADER):
+        return result
+    if qris_string[-4:].upper() != crc16(qris_string[:-4]):
         return result
     
     result["valid"] = True
     
-    # Check if dynamic (010212) or static (010211)
-    if "010212" in qris_string:
-        result["is_dynamic"] = True
-    elif "010211" in qris_string:
-        result["is_static"] = True
+    # Check if dynamic (12) or static (11)
+    point_of_initiation = fields.get(TAG_POINT_OF_INITIATION)
+    result["is_dynamic"] = point_of_initiation == POINT_OF_INITIATION_DYNAMIC
+    result["is_static"] = point_of_initiation == POINT_OF_INITIATION_STATIC
     
-    # Extract amount (tag 54)
-    if "54" in qris_string:
+    # Amount (tag 54)
+    amount = fields.get(TAG_AMOUNT)
+    if amount:
         try:
-            idx = qris_string.find("54")
-            if idx != -1:
-                length = int(qris_string[idx + 2 : idx + 4])
-                amount_str = qris_string[idx + 4 : idx + 4 + length]
-                result["amount"] = float(amount_str)
-        except (ValueError, IndexError):
+            result["amount"] = float(amount)
+        except ValueError:
             pass
     
+    result["merchant_name"] = fields.get(TAG_MERCHANT_NAME)
+    result["city_code"] = fields.get(TAG_MERCHANT_CITY)
+    
     return result
@@ -0,0 +1,65 @@
+"""
+Query Counter Helper - Hitung jumlah query SQL yang dijalankan
+Dipakai untuk memastikan list endpoint berjalan dengan jumlah query konstan (tanpa N+1)
+"""
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """Collects SQL statements executed on an engine while active"""
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine):
+    """
+    Count SQL statements executed on `engine` inside the with-block
+
+    Args:
+        engine: SQLAlchemy engine (e.g. db.engine)
+
+    Yields:
+        QueryCounter with `count` and `statements`
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter._before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(engine, max_queries: int):
+    """
+    Fail if more than `max_queries` SQL statements run inside the with-block
+
+    Usage:
+        with assert_max_queries(engine, 2):
+            get_packages(request)
+
+    Args:
+        engine: SQLAlchemy engine (e.g. db.engine)
+        max_queries: Maximum allowed number of statements
+
+    Raises:
+        AssertionError: If the block executed more statements than allowed
+    """
+    with count_queries(engine) as counter:
+        yield counter
+    if counter.count > max_queries:
+        executed = "\n".join(counter.statements)
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {counter.count}:\n{executed}"
+        )
@@ -0,0 +1,116 @@
+"""
+Search Helper - Full-text dan fuzzy (trigram) search untuk katalog
+Full-text memakai kolom packages.search_vector (tsvector) yang di-maintain trigger database,
+fuzzy memakai index GIN pg_trgm di destinations.name, destinations.country dan packages.name
+"""
+import re
+
+from sqlalchemy import func, cast, text
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+
+
+# Harus sama dengan config yang dipakai trigger di migration
+SEARCH_CONFIG = "simple"
+
+MAX_SEARCH_TERMS = 8
+
+# Batas word_similarity untuk operator %>, default pg_trgm (0.6) terlalu ketat untuk typo
+# seperti "Jogjakarta" vs "Yogyakarta"
+FUZZY_THRESHOLD = 0.3
+
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_prefix_tsquery(search_query: str):
+    """
+    Convert free text from the search box into a prefix tsquery string
+
+    Every word becomes a prefix term (`bal:*`) so partially typed words
+    still match, and all terms must match (AND).
+
+    Args:
+        search_query: Raw text from `q`/`search` parameter
+
+    Returns:
+        tsquery string (e.g. "bali:* & ubud:*") or None if no usable terms
+    """
+    terms = _TERM_PATTERN.findall(search_query.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def search_condition(vector_column, tsquery: str):
+    """
+    Build `search_vector @@ to_tsquery(...)` condition (served by the GIN index)
+
+    Args:
+        vector_column: tsvector column
+        tsquery: Output of build_prefix_tsquery
+
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    return vector_column.op("@@")(func.to_tsquery(SEARCH_CONFIG, tsquery))
+
+
+def search_rank(vector_column, tsquery: str):
+    """
+    Build relevance score expression for ordering search results
+
+    Cast to double precision so the value round-trips exactly through
+    pagination cursors.
+
+    Args:
+        vector_column: tsvector column
+        tsquery: Output of build_prefix_tsquery
+
+    Returns:
+        SQLAlchemy numeric expression
+    """
+    return cast(
+        func.ts_rank_cd(vector_column, func.to_tsquery(SEARCH_CONFIG, tsquery)),
+        DOUBLE_PRECISION,
+    )
+
+
+def set_fuzzy_threshold(session, threshold: float = FUZZY_THRESHOLD):
+    """
+    Set pg_trgm word similarity threshold for the current transaction
+
+    Args:
+        session: SQLAlchemy session (threshold resets on commit/rollback)
+        threshold: Minimum word_similarity for the %> operator
+    """
+    session.execute(
+        text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+        {"threshold": str(threshold)},
+    )
+
+
+def fuzzy_condition(column, search_query: str):
+    """
+    Build typo-tolerant match condition `column %> query` (served by gin_trgm_ops index)
+
+    Args:
+        column: Text column with a pg_trgm GIN index
+        search_query: Raw text typed by the user
+
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    return column.op("%>")(search_query)
+
+
+def fuzzy_score(column, search_query: str):
+    """
+    Build word similarity score (0..1) between query and column
+
+    Args:
+        column: Text column
+        search_query: Raw text typed by the user
+
+    Returns:
+        SQLAlchemy numeric expression
+    """
+    return func.word_similarity(search_query, column)
@@ -0,0 +1,53 @@
+"""
+Transaction Helper - Menjalankan unit kerja database dengan retry
+Transaksi yang gagal karena serialization failure / deadlock aman untuk diulang dari awal
+"""
+import random
+import time
+
+from sqlalchemy.exc import DBAPIError
+
+
+# SQLSTATE: serialization_failure, deadlock_detected
+RETRYABLE_SQLSTATES = {"40001", "40P01"}
+
+DEFAULT_ATTEMPTS = 3
+BASE_DELAY = 0.02  # detik, dikali 2 setiap percobaan + jitter
+
+
+def is_retryable(err: Exception) -> bool:
+    """True if the database asked us to retry the whole transaction"""
+    return isinstance(err, DBAPIError) and getattr(err.orig, "pgcode", None) in RETRYABLE_SQLSTATES
+
+
+def run_in_transaction(session, work, attempts: int = DEFAULT_ATTEMPTS, base_delay: float = BASE_DELAY):
+    """
+    Run work(session) and commit, retrying on serialization failure or deadlock
+
+    work must only touch the database through session and have no other side
+    effects, because it is executed again from scratch after a rollback.
+
+    Args:
+        session: SQLAlchemy session
+        work: Callable(session) -> result
+        attempts: Maximum number of attempts
+        base_delay: Initial backoff in seconds
+
+    Returns:
+        Result of work
+
+    Raises:
+        Any exception raised by work (after rollback); retryable database
+        errors only after the last attempt
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            result = work(session)
+            session.commit()
+            return result
+        except Exception as err:
+            session.rollback()
+            if attempt == attempts or not is_retryable(err):
+                raise
+            # Exponential backoff dengan jitter supaya transaksi yang bentrok tidak bertabrakan lagi
+            time.sleep(base_delay * (2 ** (attempt - 1)) * (0.5 + random.random()))
@@ -0,0 +1,225 @@
+"""
+Worker Pool Helper - Process pool untuk pekerjaan CPU media (render QR, decode barcode, verifikasi gambar)
+Pillow/qrcode/pyzbar memegang GIL, kalau dijalankan di thread waitress request JSON yang
+murah ikut antre. Di pool ini pekerjaan tersebut jalan di proses terpisah (paralel antar core),
+dengan batas antrean (503 saat penuh) dan timeout per task
+"""
+import importlib
+import multiprocessing
+import os
+import threading
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, CancelledError, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+
+MEDIA_WORKERS = int(os.getenv("MEDIA_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Task yang menunggu + sedang jalan; lebih dari ini request langsung mendapat 503
+MEDIA_QUEUE_LIMIT = int(os.getenv("MEDIA_QUEUE_LIMIT", str(MEDIA_WORKERS * 4)))
+MEDIA_TASK_TIMEOUT = float(os.getenv("MEDIA_TASK_TIMEOUT", "10"))
+RETRY_AFTER_SECONDS = 1
+
+# Di-import sekali saat worker start, bukan pada task pertama
+WARM_MODULES = (
+    "PIL.Image",
+    "PIL.PngImagePlugin",
+    "PIL.JpegImagePlugin",
+    "PIL.GifImagePlugin",
+    "qrcode",
+    "qrcode.image.svg",
+    "pyzbar.pyzbar",
+    "helpers.media_task_helper",
+    "helpers.qr_render_helper",
+)
+
+# forkserver: worker tidak di-fork dari proses server yang punya banyak thread dan koneksi DB
+START_METHOD = os.getenv("MEDIA_WORKER_START_METHOD", "forkserver")
+
+
+class WorkerPoolError(Exception):
+    """Base class for errors that should become a 503 response"""
+
+
+class WorkerPoolBusy(WorkerPoolError):
+    pass
+
+
+class WorkerTimeout(WorkerPoolError):
+    pass
+
+
+def _warm_worker(modules):
+    """Worker initializer: import heavy modules up front"""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            # pyzbar butuh libzbar, opsional
+            pass
+
+
+def _ping():
+    return os.getpid()
+
+
+class WorkerPool:
+    """
+    Bounded ProcessPoolExecutor for CPU-bound media tasks
+
+    At most queue_limit tasks are queued or running; submit() beyond that
+    raises WorkerPoolBusy instead of letting requests pile up behind the
+    pool. A running task cannot be cancelled, so when run() times out the
+    whole executor is recycled: its workers are terminated, tasks of other
+    requests still in it fail with WorkerPoolBusy (retryable) and their
+    slots are released. Task functions and arguments must be picklable
+    (module-level functions, plain data).
+    """
+
+    def __init__(self, workers: int = MEDIA_WORKERS, queue_limit: int = MEDIA_QUEUE_LIMIT,
+                 timeout: float = MEDIA_TASK_TIMEOUT, warm_modules: tuple = WARM_MODULES,
+                 start_method: str = START_METHOD):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self.warm_modules = warm_modules
+        self.start_method = start_method
+        self._slots = threading.BoundedSemaphore(queue_limit)
+        self._pending = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_warm_worker,
+                    initargs=(self.warm_modules,),
+                )
+            return self._executor
+
+    def _reset(self, executor, terminate: bool = False):
+        """
+        Drop an executor, the next submit starts a new one
+
+        Args:
+            executor: Executor that is broken (worker crashed) or hung
+            terminate: Also kill its worker processes (task that timed out)
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        # shutdown() melepas referensi ke proses, ambil dulu sebelum dipanggil
+        processes = list((executor._processes or {}).values()) if terminate else []
+        executor.shutdown(wait=False, cancel_futures=not terminate)
+        # Worker yang mati membuat executor broken: semua future yang tersisa
+        # selesai dengan BrokenProcessPool sehingga slotnya dilepas
+        for process in processes:
+            process.terminate()
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def _task_done(self, executor, future):
+        self._release(future)
+        # Worker mati (mis. OOM-killed): executor diganti juga untuk task yang tidak ditunggu run()
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._reset(executor)
+
+    def warm(self):
+        """Start all workers now (one no-op task each) so the first requests do not pay for it"""
+        executor = self._get_executor()
+        return [executor.submit(_ping) for _ in range(self.workers)]
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Queue fn(*args, **kwargs) in a worker process
+
+        Returns:
+            concurrent.futures.Future
+
+        Raises:
+            WorkerPoolBusy: If queue_limit tasks are already queued or running
+        """
+        return self._submit(fn, *args, **kwargs)[1]
+
+    def _submit(self, fn, *args, **kwargs) -> tuple:
+        """submit() that also returns the executor the task went to"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise WorkerPoolBusy("Server is busy processing images, please retry shortly")
+
+        with self._lock:
+            self._pending += 1
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args, **kwargs)
+        except (BrokenProcessPool, RuntimeError):
+            # Broken atau baru di-shutdown oleh _reset di thread lain
+            self._release(None)
+            self._reset(executor)
+            raise WorkerPoolBusy("Image worker restarted, please retry")
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(partial(self._task_done, executor))
+        return executor, future
+
+    def run(self, fn, *args, timeout: float = None, **kwargs):
+        """
+        Run fn in a worker process and wait for its result
+
+        Args:
+            fn: Module-level function
+            timeout: Seconds to wait, default self.timeout
+
+        Raises:
+            WorkerPoolBusy: Queue is full or a worker crashed
+            WorkerTimeout: The task did not finish in time
+            Exception: Whatever fn raised
+        """
+        executor, future = self._submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except FutureTimeoutError:
+            # Task yang sudah jalan tidak bisa dibatalkan, worker-nya dimatikan
+            if not future.cancel():
+                self._reset(executor, terminate=True)
+            with self._lock:
+                self._timeouts += 1
+            raise WorkerTimeout("Image processing timed out, please retry")
+        except (BrokenProcessPool, CancelledError):
+            self._reset(executor)
+            raise WorkerPoolBusy("Image worker restarted, please retry")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queueLimit": self.queue_limit,
+                "pending": self._pending,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+            }
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def pool_error(request, error: WorkerPoolError) -> dict:
+    """Set 503 + Retry-After on the response and return the JSON error body"""
+    request.response.status = 503
+    request.response.headers["Retry-After"] = str(RETRY_AFTER_SECONDS)
+    return {"error": str(error)}
+
+
+MEDIA_POOL = WorkerPool()
@@ -1,11 +1,14 @@
 import hupper
-import json
 from waitress import serve
 from pyramid.config import Configurator
 from pyramid.request import Request
 from pyramid.response import Response
-from pyramid.renderers import JSON
 from db import Session
+from helpers.media_storage_helper import immutable_cache_control
+from helpers.json_helper import JSONRenderer
+from helpers.compression_helper import compress_response
+from helpers.qr_render_helper import QR_RENDER_CACHE
+from helpers.worker_pool_helper import MEDIA_POOL
 
 
 class DBRequest(Request):
@@ -30,7 +33,8 @@ def cors_tween_factory(handler, registry):
         # Add CORS headers to ALL responses
         response.headers['Access-Control-Allow-Origin'] = '*'
         response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, PATCH, DELETE, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Origin, Content-Type, Accept, Authorization, X-Requested-With'
+        response.headers['Access-Control-Allow-Headers'] = 'Origin, Content-Type, Accept, Authorization, X-Requested-With, If-None-Match, If-Modified-Since, Idempotency-Key'
+        response.headers['Access-Control-Expose-Headers'] = 'ETag, Last-Modified, Idempotent-Replayed, X-Qris-Id, X-Dynamic-Qris-String, X-Total-Amount, X-Foto-Qr-Url, Retry-After'
         response.headers['Access-Control-Max-Age'] = '3600'
         
         return response
@@ -38,23 +42,45 @@ def cors_tween_factory(handler, registry):
     return cors_tween
 
 
+# gzip/brotli for JSON/text responses above a size threshold, based on Accept-Encoding
+def compression_tween_factory(handler, registry):
+    def compression_tween(request):
+        response = handler(request)
+        return compress_response(request, response)
+
+    return compression_tween
+
+
+# Content-addressed media (/packages/ab/cd/<sha256>.jpg, /qris/rendered/...) never changes, browsers can keep it forever
+def immutable_media_tween_factory(handler, registry):
+    def immutable_media_tween(request):
+        response = handler(request)
+        if request.method in ('GET', 'HEAD') and response.status_code in (200, 304):
+            cache_control = immutable_cache_control(request.path)
+            if not cache_control and QR_RENDER_CACHE.digest_from_url(request.path):
+                cache_control = QR_RENDER_CACHE.cache_control
+            if cache_control:
+                response.headers['Cache-Control'] = cache_control
+                if 'Expires' in response.headers:
+                    del response.headers['Expires']
+        return response
+
+    return immutable_media_tween
+
+
 def main():
     with Configurator() as config:
         # Intercept all request
         config.add_tween('main.cors_tween_factory')
+        config.add_tween('main.immutable_media_tween_factory')
+        # Ditambahkan terakhir = tween paling luar, mengompres response final
+        config.add_tween('main.compression_tween_factory')
         
         # Set custom request factory
         config.set_request_factory(DBRequest)
         
-        # Setup pretty JSON renderer
-        json_renderer = JSON()
-        json_renderer.serializer = lambda obj, **kwargs: json.dumps(
-            obj, 
-            indent=2, 
-            ensure_ascii=False,
-            default=str
-        )
-        config.add_renderer('json', json_renderer)
+        # Setup JSON renderer (orjson, compact; ?pretty=1 untuk debugging)
+        config.add_renderer('json', JSONRenderer())
         
         # route
         ## auth
@@ -66,13 +92,22 @@ def main():
 
         ## packages
         config.add_route("packages", "/api/packages")
+        config.add_route("package_facets", "/api/packages/facets")
+        config.add_route("package_bulk", "/api/packages/bulk")
         config.add_route("package_detail", "/api/packages/{id}")
+        config.add_route("package_availability", "/api/packages/{id}/availability")
         config.add_route("package_agent", "/api/packages/agent/{agentId}")
 
         ## destinations
         config.add_route("destinations", "/api/destinations")
         config.add_route("destination_detail", "/api/destinations/{id}")
 
+        ## search
+        config.add_route("search_suggest", "/api/search/suggest")
+
+        ## cache
+        config.add_route("cache_stats", "/api/cache/stats")
+
         ## qris
         config.add_route("qris", "/api/qris")
         config.add_route("qris_detail", "/api/qris/{id}")
@@ -103,10 +138,12 @@ def main():
         config.add_route("analytics_tourist_stats", "/api/analytics/tourist/stats")
         
         # Static file serving untuk QRIS storage dan payment proofs
-        config.add_static_view(name='qris', path='storage/qris', cache_max_age=3600)
-        config.add_static_view(name='payment_proofs', path='storage/payment_proofs', cache_max_age=3600)
-        config.add_static_view(name='destinations', path='storage/destinations', cache_max_age=3600)
-        config.add_static_view(name='packages', path='storage/packages', cache_max_age=3600)
+        # Sibling .br/.gz (mis. qr.svg.br) dikirim jika ada dan diterima client
+        static_options = dict(cache_max_age=3600, content_encodings=['br', 'gzip'])
+        config.add_static_view(name='qris', path='storage/qris', **static_options)
+        config.add_static_view(name='payment_proofs', path='storage/payment_proofs', **static_options)
+        config.add_static_view(name='destinations', path='storage/destinations', **static_options)
+        config.add_static_view(name='packages', path='storage/packages', **static_options)
 
         #assignment_routes
         config.add_route("assignment_create", "/api/assignments")
@@ -118,6 +155,9 @@ def main():
         config.scan("views.assignments")
         app = config.make_wsgi_app()
 
+    # Worker media (PIL, qrcode, pyzbar) di-start dan di-import sebelum request pertama
+    MEDIA_POOL.warm()
+
     print("Server running on http://0.0.0.0:6543 (Hot Reload Active)")
     serve(app, host="0.0.0.0", port=6543)
 
@@ -7,3 +7,6 @@ from .package_model import Package
 from .review_model import Review
 from .qris_model import Qris
 from .tour_guide_assignment_model import TourGuideAssignment
+from .media_object_model import MediaObject
+from .package_date_inventory_model import PackageDateInventory
+from .idempotency_key_model import IdempotencyKey
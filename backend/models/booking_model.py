@@ -11,9 +11,11 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Enum,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import text
 
 from .base import Base
 
@@ -23,10 +25,10 @@ class Booking(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     package_id = Column(
-        UUID(as_uuid=True), ForeignKey("packages.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("packages.id", ondelete="CASCADE"), nullable=False
     )
     tourist_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
     travel_date = Column(Date, nullable=False, index=True)
     travelers_count = Column(Integer, nullable=False)
@@ -37,7 +39,7 @@ class Booking(Base):
         default="pending",
         index=True,
     )
-    created_at = Column(DateTime, default=datetime.now(timezone.utc), index=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     completed_at = Column(DateTime, nullable=True)
     has_reviewed = Column(Boolean, default=False)
 
@@ -65,3 +67,18 @@ class Booking(Base):
     tourist = relationship("User", back_populates="bookings", foreign_keys=[tourist_id])
     review = relationship("Review", back_populates="booking", uselist=False)
     guide_assignments = relationship("TourGuideAssignment", back_populates="booking")
+
+    __table_args__ = (
+        # Booking milik tourist difilter per status (booking_by_tourist, tourist stats)
+        Index("ix_bookings_tourist_id_status", "tourist_id", "status"),
+        # bookings_list: keyset (created_at, id) terbaru dulu, global / per tourist / per package (agent)
+        Index("ix_bookings_created_at_id", "created_at", "id"),
+        Index("ix_bookings_tourist_id_created_at_id", "tourist_id", "created_at", "id"),
+        Index("ix_bookings_package_id_created_at_id", "package_id", "created_at", "id"),
+        # Antrian verifikasi pembayaran agent, hanya baris pending_verification yang di-index
+        Index(
+            "ix_bookings_pending_verification_package_id",
+            "package_id",
+            postgresql_where=text("payment_status = 'pending_verification'"),
+        ),
+    )
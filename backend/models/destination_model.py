@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import Column, String, DateTime, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -14,12 +14,18 @@ class Destination(Base):
     description = Column(Text, nullable=False)
     photo_url = Column(String(500), nullable=False)
     country = Column(String(100), nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
     )
 
     # Relationships
     packages = relationship("Package", back_populates="destination")
+
+    # Trigram indexes for typo-tolerant search / autocomplete (pg_trgm)
+    __table_args__ = (
+        Index("ix_destinations_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_destinations_country_trgm", "country", postgresql_using="gin", postgresql_ops={"country": "gin_trgm_ops"}),
+    )
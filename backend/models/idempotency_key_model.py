@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, DateTime, Integer, Index
+from sqlalchemy.dialects.postgresql import JSONB
+
+from .base import Base
+
+
+class IdempotencyKey(Base):
+    """Stored response of a POST sent with an Idempotency-Key header"""
+    __tablename__ = "idempotency_keys"
+
+    # Key hanya unik per user dan per endpoint
+    user_id = Column(String(64), primary_key=True)
+    scope = Column(String(50), primary_key=True)
+    key = Column(String(255), primary_key=True)
+
+    request_hash = Column(String(64), nullable=False)  # SHA-256 of method, path and body
+
+    # NULL selama request pertama masih diproses
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(JSONB, nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    expires_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, DateTime, Integer, Index
+from sqlalchemy.sql import text
+
+from .base import Base
+
+
+class MediaObject(Base):
+    __tablename__ = "media_objects"
+
+    # Storage area (packages, destinations, payment_proofs) + SHA-256 of the file content
+    namespace = Column(String(32), primary_key=True)
+    digest = Column(String(64), primary_key=True)
+    extension = Column(String(10), nullable=False)
+    size = Column(Integer, nullable=False)
+
+    # Number of rows referencing the file; 0 means it can be garbage collected
+    ref_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        Index("ix_media_objects_unreferenced", "updated_at", postgresql_where=text("ref_count = 0")),
+    )
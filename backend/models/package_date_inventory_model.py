@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Date, Integer, ForeignKey, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+
+class PackageDateInventory(Base):
+    """Seats held per package per travel date, maintained by the booking views"""
+    __tablename__ = "package_date_inventory"
+
+    package_id = Column(
+        UUID(as_uuid=True), ForeignKey("packages.id", ondelete="CASCADE"), primary_key=True
+    )
+    travel_date = Column(Date, primary_key=True)
+    capacity = Column(Integer, nullable=False)  # snapshot of packages.max_travelers
+    booked = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        CheckConstraint("booked >= 0", name="check_inventory_booked_non_negative"),
+    )
@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Text, Integer, Numeric, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Text, Integer, Numeric, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, TSVECTOR, JSONB
+from sqlalchemy.orm import relationship, deferred
 
 from .base import Base
 
@@ -15,7 +15,7 @@ class Package(Base):
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
     )
     destination_id = Column(
-        UUID(as_uuid=True), ForeignKey("destinations.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("destinations.id"), nullable=False
     )
     name = Column(String(200), nullable=False)
     duration = Column(Integer, nullable=False)  # in days
@@ -24,12 +24,22 @@ class Package(Base):
     max_travelers = Column(Integer, nullable=False)
     contact_phone = Column(String(20), nullable=False)
     images = Column(ARRAY(String), nullable=False)  # PostgreSQL array of image URLs
+    # Resized WebP/AVIF variants keyed by original image URL, filled by the image pipeline
+    image_variants = Column(JSONB, nullable=False, default=dict, server_default="{}")
 
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    # Denormalized review aggregates, maintained by trigger on reviews
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_avg = Column(Numeric(3, 2), nullable=False, default=0, server_default="0")
+
+    # Full-text search document (name, destination, itinerary), maintained by DB trigger
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
     )
 
     # Relationships
@@ -37,3 +47,15 @@ class Package(Base):
     destination = relationship("Destination", back_populates="packages")
     bookings = relationship("Booking", back_populates="package", cascade="all, delete-orphan")
     reviews = relationship("Review", back_populates="package", cascade="all, delete-orphan")
+
+    # Composite indexes for keyset pagination (sort column + id tiebreak)
+    __table_args__ = (
+        Index("ix_packages_price_id", "price", "id"),
+        Index("ix_packages_duration_id", "duration", "id"),
+        Index("ix_packages_created_at_id", "created_at", "id"),
+        Index("ix_packages_rating_avg_id", "rating_avg", "id"),
+        # Filter destinasi + rentang harga (dan sort harga) di katalog
+        Index("ix_packages_destination_id_price_id", "destination_id", "price", "id"),
+        Index("ix_packages_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_packages_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Text, Integer, ForeignKey, CheckConstraint
+from sqlalchemy import Column, DateTime, Text, Integer, ForeignKey, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -12,10 +12,10 @@ class Review(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     package_id = Column(
-        UUID(as_uuid=True), ForeignKey("packages.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("packages.id", ondelete="CASCADE"), nullable=False
     )
     tourist_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
     booking_id = Column(
         UUID(as_uuid=True), ForeignKey("bookings.id", ondelete="CASCADE"), nullable=True, index=True
@@ -32,4 +32,7 @@ class Review(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint("rating >= 1 AND rating <= 5", name="check_rating_range"),
+        # Review per package/tourist diurutkan terbaru dulu (review_by_package, review_by_tourist)
+        Index("ix_reviews_package_id_created_at", "package_id", "created_at"),
+        Index("ix_reviews_tourist_id_created_at", "tourist_id", "created_at"),
     )
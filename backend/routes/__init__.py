@@ -7,6 +7,8 @@ from .booking_routes import include_bookings_routes
 from .review_routes import include_review_routes
 from .analytics_routes import include_analytics_routes
 from .assignment_routes import include_assignment_routes
+from .search_routes import include_search_routes
+from .cache_routes import include_cache_routes
 
 
 def include_routes(config):
@@ -19,3 +21,5 @@ def include_routes(config):
     include_review_routes(config)
     include_analytics_routes(config)
     include_assignment_routes(config)
+    include_search_routes(config)
+    include_cache_routes(config)
@@ -0,0 +1,3 @@
+#cache routes
+def include_cache_routes(config):
+    config.add_route("cache_stats", "/api/cache/stats")
@@ -1,5 +1,8 @@
 #packages routes
 def include_packages_routes(config):
     config.add_route("packages", "/api/packages")
+    config.add_route("package_facets", "/api/packages/facets")
+    config.add_route("package_bulk", "/api/packages/bulk")
     config.add_route("package_detail", "/api/packages/{id}")
+    config.add_route("package_availability", "/api/packages/{id}/availability")
     config.add_route("package_agent", "/api/packages/agent/{agentId}")
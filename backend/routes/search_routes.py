@@ -0,0 +1,3 @@
+#search routes
+def include_search_routes(config):
+    config.add_route("search_suggest", "/api/search/suggest")
@@ -0,0 +1,144 @@
+"""
+Microbenchmark for booking list serialization
+Compares the old path (ORM instances, hand-built dict with str()/isoformat()/float(),
+json.dumps indent=2 default=str) with the new one (row tuples, precompiled
+serializer from BOOKING_LIST_FIELDS, orjson renderer). No database needed.
+Usage: python -m seeds.bench_booking_serializer [rows] [repeat]
+"""
+import json
+import sys
+import timeit
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy.engine.result import result_tuple
+
+from helpers.fieldset_helper import fieldset_select
+from helpers.json_helper import dumps
+from models.booking_model import Booking
+from models.package_model import Package
+from models.user_model import User
+from views.bookings import BOOKING_LIST_FIELDS
+
+
+def make_bookings(n: int):
+    """Transient ORM instances with package and tourist attached"""
+    package = Package(id=uuid.uuid4(), name="Maldives Paradise Retreat", images=["https://example.com/a.jpg"])
+    tourist = User(id=uuid.uuid4(), name="John Doe", email="john@example.com")
+    now = datetime(2026, 1, 1, 10, 0, 0, 123456)
+    bookings = []
+    for i in range(n):
+        bookings.append(
+            Booking(
+                id=uuid.uuid4(),
+                package_id=package.id,
+                tourist_id=tourist.id,
+                travel_date=date(2026, 2, 15) + timedelta(days=i % 90),
+                travelers_count=2,
+                total_price=Decimal("7000.00"),
+                status="confirmed",
+                created_at=now - timedelta(minutes=i),
+                completed_at=None,
+                has_reviewed=False,
+                payment_status="verified",
+                payment_proof_url="/payments/ab/cd/abcdef.jpg",
+                payment_proof_uploaded_at=now,
+                payment_verified_at=now,
+                payment_rejection_reason=None,
+                package=package,
+                tourist=tourist,
+            )
+        )
+    return bookings
+
+
+def make_rows(bookings):
+    """Same data as the rows fieldset_select would return"""
+    stmt, _ = fieldset_select(None, BOOKING_LIST_FIELDS)
+    make_row = result_tuple([column.key for column in stmt.selected_columns])
+    return [
+        make_row(
+            (
+                b.id, b.package_id, b.tourist_id, b.travel_date, b.travelers_count, b.total_price,
+                b.status, b.created_at, b.completed_at, b.has_reviewed, b.payment_status,
+                b.payment_proof_url, b.payment_proof_uploaded_at, b.payment_verified_at,
+                b.payment_rejection_reason, b.package.name, b.package.images[:1],
+                b.tourist.name, b.tourist.email,
+            )
+        )
+        for b in bookings
+    ]
+
+
+def old_serialize(b) -> dict:
+    """Dict built by bookings_list before the shared serializer"""
+    return {
+        "id": str(b.id),
+        "packageId": str(b.package_id),
+        "touristId": str(b.tourist_id),
+        "travelDate": b.travel_date.isoformat(),
+        "travelersCount": b.travelers_count,
+        "totalPrice": float(b.total_price),
+        "status": b.status,
+        "createdAt": b.created_at.isoformat() if b.created_at else None,
+        "completedAt": b.completed_at.isoformat() if b.completed_at else None,
+        "hasReviewed": b.has_reviewed,
+        "paymentStatus": b.payment_status,
+        "paymentProofUrl": b.payment_proof_url,
+        "paymentProofUploadedAt": b.payment_proof_uploaded_at.isoformat() if b.payment_proof_uploaded_at else None,
+        "paymentVerifiedAt": b.payment_verified_at.isoformat() if b.payment_verified_at else None,
+        "paymentRejectionReason": b.payment_rejection_reason,
+        "package": {
+            "id": str(b.package.id),
+            "name": b.package.name,
+            "images": b.package.images[:1] if b.package.images else [],
+        } if b.package else None,
+        "tourist": {
+            "id": str(b.tourist.id),
+            "name": b.tourist.name,
+            "email": b.tourist.email,
+        } if b.tourist else None,
+    }
+
+
+def old_encode(obj) -> str:
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
+
+def per_row_us(func, rows: int, repeat: int) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    return best / rows * 1e6
+
+
+def main() -> int:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    bookings = make_bookings(n)
+    rows = make_rows(bookings)
+    _, serialize = fieldset_select(None, BOOKING_LIST_FIELDS)
+
+    old_data = [old_serialize(b) for b in bookings]
+    new_data = [serialize(row) for row in rows]
+    # Output harus identik setelah di-encode
+    assert json.loads(old_encode(old_data)) == json.loads(dumps(new_data)), "output differs"
+
+    results = {
+        "serialize old (ORM + str/isoformat/float)": per_row_us(lambda: [old_serialize(b) for b in bookings], n, repeat),
+        "serialize new (row tuple, precompiled)": per_row_us(lambda: [serialize(row) for row in rows], n, repeat),
+        "encode old (json.dumps)": per_row_us(lambda: old_encode(old_data), n, repeat),
+        "encode new (orjson, compact)": per_row_us(lambda: dumps(new_data), n, repeat),
+        "total old": per_row_us(lambda: old_encode([old_serialize(b) for b in bookings]), n, repeat),
+        "total new": per_row_us(lambda: dumps([serialize(row) for row in rows]), n, repeat),
+    }
+
+    print(f"{n} bookings, best of {repeat}")
+    for name, us in results.items():
+        print(f"  {name:<45} {us:8.2f} us/row")
+    print(f"  speedup: {results['total old'] / results['total new']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Benchmark for the json renderer on a 1,000-booking list payload
+Compares response size and encode time of the old renderer (json.dumps indent=2,
+default=str) with orjson pretty (?pretty=1) and orjson compact (default).
+No database needed.
+Usage: python -m seeds.bench_json_renderer [bookings] [repeat]
+"""
+import json
+import sys
+import timeit
+
+from helpers.fieldset_helper import fieldset_select
+from helpers.json_helper import dumps
+from seeds.bench_booking_serializer import make_bookings, make_rows
+from views.bookings import BOOKING_LIST_FIELDS
+
+
+def old_renderer(obj) -> bytes:
+    """Renderer configured in main.py before orjson"""
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def main() -> int:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    _, serialize = fieldset_select(None, BOOKING_LIST_FIELDS)
+    payload = {"data": [serialize(row) for row in make_rows(make_bookings(n))]}
+
+    encoders = {
+        "json.dumps indent=2 default=str": old_renderer,
+        "orjson pretty (?pretty=1)": lambda obj: dumps(obj, indent=True),
+        "orjson compact (default)": dumps,
+    }
+
+    baseline_bytes = baseline_ms = None
+    print(f"{n} bookings, best of {repeat}")
+    for name, encode in encoders.items():
+        size = len(encode(payload))
+        ms = min(timeit.repeat(lambda: encode(payload), number=1, repeat=repeat)) * 1000
+        if baseline_bytes is None:
+            baseline_bytes, baseline_ms = size, ms
+        print(
+            f"  {name:<34} {size:>9,} bytes ({size / baseline_bytes:6.1%})"
+            f"  {ms:8.2f} ms ({baseline_ms / ms:5.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Benchmark QR render output modes
+CPU time and bytes per format for a dynamic QRIS payload: PNG (raw stream vs
+base64 in JSON) and SVG (path factory, raw and gzip as sent by the compression tween).
+Usage: python -m seeds.bench_qr_render [repeat]
+"""
+import gzip
+import sys
+import time
+
+from helpers.compression_helper import GZIP_LEVEL
+from helpers.qr_render_helper import QrRenderParams, render_qr, inline_image
+from helpers.qris_helper import generate_dynamic_qris_string
+from seeds.bench_qris_crc import STATIC_QRIS
+
+
+def cpu_ms(func, repeat: int) -> float:
+    """Best-of CPU time per call (process_time, unaffected by other processes)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        best = min(best, time.process_time() - start)
+    return best * 1000
+
+
+def main() -> int:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    data = generate_dynamic_qris_string(STATIC_QRIS, 1500000, "rupiah", 2500)
+
+    png_params = QrRenderParams(image_format="png")
+    svg_params = QrRenderParams(image_format="svg")
+    png = render_qr(data, png_params)
+    svg = render_qr(data, svg_params)
+
+    rows = [
+        ("png stream (image/png)", cpu_ms(lambda: render_qr(data, png_params), repeat), len(png)),
+        ("png inline (base64 in JSON)",
+         cpu_ms(lambda: inline_image(render_qr(data, png_params), "png"), repeat),
+         len(inline_image(png, "png"))),
+        ("svg (path factory)", cpu_ms(lambda: render_qr(data, svg_params), repeat), len(svg)),
+        ("svg + gzip",
+         cpu_ms(lambda: gzip.compress(render_qr(data, svg_params), compresslevel=GZIP_LEVEL, mtime=0), repeat),
+         len(gzip.compress(svg, compresslevel=GZIP_LEVEL, mtime=0))),
+    ]
+
+    print(f"payload {len(data)} chars, best of {repeat}")
+    for name, ms, size in rows:
+        print(f"  {name:<30} {ms:8.2f} ms cpu  {size:8d} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
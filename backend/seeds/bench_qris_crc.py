@@ -0,0 +1,79 @@
+"""
+Benchmark for the QRIS CRC16 engine
+Compares the old bit-by-bit crc16 with the table-driven engine, the batch API and
+generate_dynamic_qris_string resuming from the cached merchant prefix state.
+No database needed.
+Usage: python -m seeds.bench_qris_crc [payloads] [repeat]
+"""
+import sys
+import timeit
+
+from helpers.qris_helper import (
+    CRC16_INIT,
+    crc16,
+    crc16_batch,
+    crc16_hex,
+    crc16_update,
+    generate_dynamic_qris_string,
+)
+
+
+_STATIC_PAYLOAD = (
+    "00020101021126570011ID.DANA.WWW011893600915302259148102090225914810303UMI"
+    "51440014ID.CO.QRIS.WWW0215ID10200176114730303UMI5204581253033605802ID"
+    "5922Warung Sayur Bu Sugeng6010Kab. Demak6105595676304"
+)
+STATIC_QRIS = _STATIC_PAYLOAD + crc16(_STATIC_PAYLOAD)
+
+
+def crc16_bitwise(data: str) -> str:
+    """crc16 before the table-driven engine (8 shifts per character)"""
+    crc = 0xFFFF
+    for char in data:
+        crc ^= ord(char) << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+    return format(crc & 0xFFFF, '04X')
+
+
+def per_item_us(func, items: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) / items * 1e6
+
+
+def main() -> int:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    # Payload dinamis dengan amount berbeda-beda (tanpa 4 karakter CRC)
+    payloads = [generate_dynamic_qris_string(STATIC_QRIS, 100000 + i)[:-4] for i in range(n)]
+
+    expected = [crc16_bitwise(p) for p in payloads]
+    assert [crc16(p) for p in payloads] == expected, "crc16 differs"
+    assert crc16_batch(payloads) == expected, "crc16_batch differs"
+    prefix = payloads[0][:40]
+    assert all(payload.startswith(prefix) for payload in payloads)
+    prefix_crc = crc16_update(CRC16_INIT, prefix)
+    assert crc16_batch([p[len(prefix):] for p in payloads], prefix_crc) == expected, "resumed crc differs"
+    assert crc16_hex(crc16_update(prefix_crc, payloads[0][len(prefix):])) == expected[0]
+
+    results = {
+        "crc16 bitwise (old)": per_item_us(lambda: [crc16_bitwise(p) for p in payloads], n, repeat),
+        "crc16 table-driven": per_item_us(lambda: [crc16(p) for p in payloads], n, repeat),
+        "crc16_batch": per_item_us(lambda: crc16_batch(payloads), n, repeat),
+        "generate_dynamic_qris_string": per_item_us(
+            lambda: [generate_dynamic_qris_string(STATIC_QRIS, 100000 + i) for i in range(n)], n, repeat
+        ),
+    }
+
+    print(f"{n} payloads of {len(payloads[0]) + 4} chars, best of {repeat}")
+    baseline = results["crc16 bitwise (old)"]
+    for name, us in results.items():
+        print(f"  {name:<32} {us:8.2f} us/payload ({baseline / us:6.1f}x vs old crc16)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
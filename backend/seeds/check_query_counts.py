@@ -0,0 +1,189 @@
+"""
+Query count check for the list endpoints
+Seeds the same agent/tourist/destination with a small and a large number of packages,
+bookings and reviews, calls every list endpoint through the real WSGI app and fails if
+an endpoint runs more than MAX_QUERIES statements or if its query count grows with the
+number of rows (N+1). Test data is removed afterwards.
+Usage: python -m seeds.check_query_counts [small] [large]
+"""
+import sys
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import jwt
+from pyramid.config import Configurator
+from pyramid.request import Request
+from sqlalchemy import delete
+
+from db import Session, engine
+from main import DBRequest
+from models.booking_model import Booking
+from models.destination_model import Destination
+from models.package_model import Package
+from models.review_model import Review
+from models.user_model import User
+from helpers.cache_helper import catalog_cache
+from helpers.json_helper import JSONRenderer
+from helpers.query_counter_helper import assert_max_queries
+from routes import include_routes
+
+
+SMALL = 10
+LARGE = 200
+# Batas per request: data + join/selectin loader + count/estimate
+MAX_QUERIES = 6
+
+
+def build_app():
+    """WSGI app with the same request factory, renderer and routes as main.py"""
+    with Configurator() as config:
+        config.set_request_factory(DBRequest)
+        config.add_renderer("json", JSONRenderer())
+        include_routes(config)
+        config.scan("views")
+        return config.make_wsgi_app()
+
+
+def make_token(user_id, role: str) -> str:
+    now = datetime.now(timezone.utc)
+    payload = {"sub": str(user_id), "role": role, "iat": now, "exp": now + timedelta(hours=1)}
+    return jwt.encode(payload, "secret", algorithm="HS256")
+
+
+def setup(rows: int) -> dict:
+    """
+    One agent, tourist and destination with `rows` packages, bookings and reviews
+
+    All bookings and reviews belong to the tourist and the first package, so
+    every list endpoint below returns `rows` items.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    with Session() as session:
+        agent = User(name="Count Agent", email=f"count-agent-{run_id}@example.com", password_hash="x", role="agent")
+        tourist = User(name="Count Tourist", email=f"count-tourist-{run_id}@example.com", password_hash="x", role="tourist")
+        destination = Destination(name=f"Count {run_id}", description="Query count check", photo_url="https://example.com/c.jpg", country="Test")
+        session.add_all([agent, tourist, destination])
+        session.flush()
+
+        packages = [
+            Package(
+                agent_id=agent.id,
+                destination_id=destination.id,
+                name=f"Count package {run_id} {i}",
+                duration=3,
+                price=100 + i,
+                itinerary="Query count check",
+                max_travelers=10,
+                contact_phone="0800",
+                images=[],
+            )
+            for i in range(rows)
+        ]
+        session.add_all(packages)
+        session.flush()
+
+        first = packages[0]
+        bookings = [
+            Booking(
+                package_id=first.id,
+                tourist_id=tourist.id,
+                travel_date=date.today() + timedelta(days=30 + i),
+                travelers_count=1,
+                total_price=100,
+                status="confirmed",
+                payment_status="pending_verification",
+            )
+            for i in range(rows)
+        ]
+        session.add_all(bookings)
+        session.flush()
+
+        session.add_all(
+            Review(package_id=first.id, tourist_id=tourist.id, booking_id=booking.id, rating=5, comment="Query count check")
+            for booking in bookings
+        )
+        session.commit()
+        return {
+            "agent_id": agent.id,
+            "tourist_id": tourist.id,
+            "destination_id": destination.id,
+            "package_id": first.id,
+        }
+
+
+def teardown(ids: dict):
+    with Session() as session:
+        package_ids = [
+            package_id for (package_id,) in session.query(Package.id).filter(Package.agent_id == ids["agent_id"])
+        ]
+        session.execute(delete(Review).where(Review.package_id.in_(package_ids)))
+        session.execute(delete(Booking).where(Booking.package_id.in_(package_ids)))
+        session.execute(delete(Package).where(Package.id.in_(package_ids)))
+        session.execute(delete(Destination).where(Destination.id == ids["destination_id"]))
+        session.execute(delete(User).where(User.id.in_([ids["agent_id"], ids["tourist_id"]])))
+        session.commit()
+
+
+def endpoints(ids: dict) -> dict:
+    """Endpoint name -> (path, role, user id); limit high enough to return every seeded row"""
+    agent = ("agent", ids["agent_id"])
+    tourist = ("tourist", ids["tourist_id"])
+    return {
+        "packages": (f"/api/packages?destination={ids['destination_id']}&limit=100", *tourist),
+        "package_agent": (f"/api/packages/agent/{ids['agent_id']}", *agent),
+        "bookings_list": ("/api/bookings?limit=100", *agent),
+        "booking_by_tourist": (f"/api/bookings/tourist/{ids['tourist_id']}", *tourist),
+        "booking_by_package": (f"/api/bookings/package/{ids['package_id']}", *agent),
+        "booking_payment_pending": ("/api/bookings/payment/pending", *agent),
+        "review_by_package": (f"/api/reviews/package/{ids['package_id']}", *tourist),
+        "review_by_tourist": (f"/api/reviews/tourist/{ids['tourist_id']}", *tourist),
+        "agent_package_performance": ("/api/analytics/agent/package-performance?limit=1000", *agent),
+    }
+
+
+def measure(app, rows: int) -> dict:
+    """Query count per endpoint for a dataset of `rows` rows"""
+    ids = setup(rows)
+    counts = {}
+    try:
+        for name, (path, role, user_id) in endpoints(ids).items():
+            # Cache katalog bisa melewati query sama sekali
+            catalog_cache.clear()
+            request = Request.blank(path, headers={"Authorization": f"Bearer {make_token(user_id, role)}"})
+            with assert_max_queries(engine, MAX_QUERIES) as counter:
+                response = request.get_response(app)
+            if response.status_code != 200:
+                raise AssertionError(f"{name}: {path} returned {response.status}: {response.text[:200]}")
+            counts[name] = counter.count
+    finally:
+        teardown(ids)
+    return counts
+
+
+def main() -> int:
+    small = int(sys.argv[1]) if len(sys.argv) > 1 else SMALL
+    large = int(sys.argv[2]) if len(sys.argv) > 2 else LARGE
+
+    app = build_app()
+    try:
+        small_counts = measure(app, small)
+        large_counts = measure(app, large)
+    except AssertionError as e:
+        print(f"FAIL: {e}")
+        return 1
+
+    failures = []
+    for name, small_count in small_counts.items():
+        large_count = large_counts[name]
+        status = "ok" if small_count == large_count else "FAIL"
+        print(f"[{status}] {name}: {small_count} queries ({small} rows), {large_count} queries ({large} rows)")
+        if small_count != large_count:
+            failures.append(name)
+
+    for name in failures:
+        print(f"FAIL: {name} runs more queries as rows grow (N+1)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
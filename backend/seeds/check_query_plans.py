@@ -0,0 +1,184 @@
+"""
+Plan check for the hot list queries
+Seeds a synthetic workload inside a transaction, runs EXPLAIN on the query each hot
+view executes and fails if any of them scans a large table sequentially.
+Everything is rolled back at the end, so it is safe to run against a dev database.
+Usage: python -m seeds.check_query_plans
+"""
+import hashlib
+import json
+import sys
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import select, and_, text
+
+from db import engine
+from models.booking_model import Booking
+from models.package_model import Package
+from models.review_model import Review
+
+
+AGENTS = 50
+TOURISTS = 2000
+DESTINATIONS = 40
+PACKAGES = 5000
+BOOKINGS = 100000
+REVIEWS = 30000
+
+# Tabel yang tidak boleh di-scan sequential oleh query di bawah
+GUARDED_TABLES = {"bookings", "reviews", "packages"}
+
+
+SEED_SQL = """
+INSERT INTO users (id, name, email, password_hash, role, created_at, updated_at)
+SELECT md5('agent' || g)::uuid, 'Agent ' || g, 'plan-agent-' || g || '@example.com', 'x', 'agent', now(), now()
+FROM generate_series(1, :agents) g;
+
+INSERT INTO users (id, name, email, password_hash, role, created_at, updated_at)
+SELECT md5('tourist' || g)::uuid, 'Tourist ' || g, 'plan-tourist-' || g || '@example.com', 'x', 'tourist', now(), now()
+FROM generate_series(1, :tourists) g;
+
+INSERT INTO destinations (id, name, description, photo_url, country, created_at, updated_at)
+SELECT md5('destination' || g)::uuid, 'Destination ' || g, 'Plan check', 'https://example.com/d.jpg',
+       'Country ' || (g % 8), now(), now()
+FROM generate_series(1, :destinations) g;
+
+INSERT INTO packages (id, agent_id, destination_id, name, duration, price, itinerary,
+                      max_travelers, contact_phone, images, created_at, updated_at)
+SELECT md5('package' || g)::uuid,
+       md5('agent' || (g % :agents + 1))::uuid,
+       md5('destination' || (g % :destinations + 1))::uuid,
+       'Package ' || g, g % 14 + 1, (g % 400) * 10 + 100, 'Day 1', 10, '0800', ARRAY[]::varchar[],
+       now() - (g || ' minutes')::interval, now()
+FROM generate_series(1, :packages) g;
+
+INSERT INTO bookings (id, package_id, tourist_id, travel_date, travelers_count, total_price,
+                      status, created_at, has_reviewed, payment_status)
+SELECT md5('booking' || g)::uuid,
+       md5('package' || (g % :packages + 1))::uuid,
+       md5('tourist' || (g % :tourists + 1))::uuid,
+       current_date + (g % 365), 2, 1000,
+       (ARRAY['pending', 'confirmed', 'cancelled', 'completed'])[g % 4 + 1]::booking_status,
+       now() - (g || ' seconds')::interval, false,
+       -- sekitar 1% booking menunggu verifikasi, sama seperti di production
+       (CASE WHEN g % 100 = 0 THEN 'pending_verification' ELSE 'verified' END)::payment_status
+FROM generate_series(1, :bookings) g;
+
+INSERT INTO reviews (id, package_id, tourist_id, booking_id, rating, comment, created_at)
+SELECT md5('review' || g)::uuid,
+       md5('package' || (g % :packages + 1))::uuid,
+       md5('tourist' || (g % :tourists + 1))::uuid,
+       NULL, g % 5 + 1, 'Plan check', now() - (g || ' seconds')::interval
+FROM generate_series(1, :reviews) g;
+
+ANALYZE users;
+ANALYZE destinations;
+ANALYZE packages;
+ANALYZE bookings;
+ANALYZE reviews;
+"""
+
+
+def seeded_uuid(prefix: str, n: int) -> uuid.UUID:
+    return uuid.UUID(bytes=hashlib.md5(f"{prefix}{n}".encode()).digest())
+
+
+def hot_queries():
+    """Same filters/ordering the hot views build"""
+    agent_id = seeded_uuid("agent", 1)
+    tourist_id = seeded_uuid("tourist", 1)
+    package_id = seeded_uuid("package", 1)
+    destination_id = seeded_uuid("destination", 1)
+
+    return {
+        # booking_payment_pending
+        "booking_payment_pending": select(Booking.id).join(Package).where(
+            and_(
+                Booking.payment_status == "pending_verification",
+                Package.agent_id == agent_id,
+            )
+        ),
+        # booking_by_tourist / tourist stats per status
+        "booking_by_tourist_status": select(Booking.id).where(
+            Booking.tourist_id == tourist_id, Booking.status == "confirmed"
+        ),
+        "booking_by_tourist": select(Booking.id).where(Booking.tourist_id == tourist_id),
+        # review_by_package
+        "review_by_package": select(Review.id)
+        .where(Review.package_id == package_id)
+        .order_by(Review.created_at.desc()),
+        # review_by_tourist
+        "review_by_tourist": select(Review.id)
+        .where(Review.tourist_id == tourist_id)
+        .order_by(Review.created_at.desc()),
+        # bookings_list (tourist / agent), halaman pertama urut (created_at, id) terbaru dulu
+        "bookings_list_tourist": select(Booking.id)
+        .where(Booking.tourist_id == tourist_id)
+        .order_by(Booking.created_at.desc(), Booking.id.desc())
+        .limit(21),
+        "bookings_list_agent": select(Booking.id)
+        .join(Package, Booking.package_id == Package.id)
+        .where(Package.agent_id == agent_id)
+        .order_by(Booking.created_at.desc(), Booking.id.desc())
+        .limit(21),
+        # get_packages?destination=...&minPrice=...&maxPrice=...&sortBy=price
+        "packages_destination_price": select(Package.id)
+        .where(
+            Package.destination_id == destination_id,
+            Package.price >= Decimal("500"),
+            Package.price <= Decimal("1500"),
+        )
+        .order_by(Package.price, Package.id)
+        .limit(21),
+        # get_package_by_agent
+        "packages_by_agent": select(Package.id).where(Package.agent_id == agent_id),
+    }
+
+
+def sequential_scans(plan: dict):
+    """Yield relation names scanned sequentially anywhere in the plan tree"""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan.get("Relation Name")
+    for child in plan.get("Plans", []):
+        yield from sequential_scans(child)
+
+
+def main() -> int:
+    failures = []
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            connection.execute(
+                text(SEED_SQL),
+                {
+                    "agents": AGENTS,
+                    "tourists": TOURISTS,
+                    "destinations": DESTINATIONS,
+                    "packages": PACKAGES,
+                    "bookings": BOOKINGS,
+                    "reviews": REVIEWS,
+                },
+            )
+
+            for name, stmt in hot_queries().items():
+                compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+                plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar_one()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                root = plan[0]["Plan"]
+                scanned = sorted(set(sequential_scans(root)) & GUARDED_TABLES)
+                status = "FAIL" if scanned else "ok"
+                print(f"[{status}] {name}: {root['Node Type']} (cost {root['Total Cost']})")
+                if scanned:
+                    failures.append((name, scanned))
+        finally:
+            transaction.rollback()
+
+    for name, tables in failures:
+        print(f"{name} uses a sequential scan on {', '.join(tables)}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
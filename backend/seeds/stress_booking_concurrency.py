@@ -0,0 +1,137 @@
+"""
+Concurrency stress test for booking creation
+Fires many parallel bookings at one package/date and checks that the date is never
+oversold and that p99 latency stays bounded. Test data is removed afterwards.
+Usage: python -m seeds.stress_booking_concurrency [requests] [capacity] [p99_ms]
+"""
+import statistics
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, select, delete, func
+from sqlalchemy.orm import sessionmaker
+
+from db import engine as app_engine
+from models.booking_model import Booking
+from models.destination_model import Destination
+from models.package_date_inventory_model import PackageDateInventory
+from models.package_model import Package
+from models.user_model import User
+from helpers.booking_helper import create_booking
+from helpers.inventory_helper import SeatsUnavailable
+
+
+REQUESTS = 300
+CAPACITY = 50
+TRAVELERS_PER_BOOKING = 1
+P99_LIMIT_MS = 2000
+WORKERS = 64
+
+
+def setup(Session, capacity):
+    run_id = uuid.uuid4().hex[:8]
+    with Session() as session:
+        agent = User(name="Stress Agent", email=f"stress-agent-{run_id}@example.com", password_hash="x", role="agent")
+        tourist = User(name="Stress Tourist", email=f"stress-tourist-{run_id}@example.com", password_hash="x", role="tourist")
+        destination = Destination(name=f"Stress {run_id}", description="Stress test", photo_url="https://example.com/s.jpg", country="Test")
+        session.add_all([agent, tourist, destination])
+        session.flush()
+
+        package = Package(
+            agent_id=agent.id,
+            destination_id=destination.id,
+            name=f"Stress package {run_id}",
+            duration=3,
+            price=100,
+            itinerary="Stress test",
+            max_travelers=capacity,
+            contact_phone="0800",
+            images=[],
+        )
+        session.add(package)
+        session.commit()
+        return package.id, tourist.id, agent.id, destination.id
+
+
+def teardown(Session, package_id, tourist_id, agent_id, destination_id):
+    with Session() as session:
+        session.execute(delete(Booking).where(Booking.package_id == package_id))
+        session.execute(delete(PackageDateInventory).where(PackageDateInventory.package_id == package_id))
+        session.execute(delete(Package).where(Package.id == package_id))
+        session.execute(delete(Destination).where(Destination.id == destination_id))
+        session.execute(delete(User).where(User.id.in_([tourist_id, agent_id])))
+        session.commit()
+
+
+def main() -> int:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else REQUESTS
+    capacity = int(sys.argv[2]) if len(sys.argv) > 2 else CAPACITY
+    p99_limit_ms = float(sys.argv[3]) if len(sys.argv) > 3 else P99_LIMIT_MS
+
+    # Pool sebesar jumlah worker supaya yang diuji lock di database, bukan antrian pool
+    engine = create_engine(app_engine.url.render_as_string(hide_password=False), pool_size=WORKERS, max_overflow=0)
+    Session = sessionmaker(bind=engine)
+
+    package_id, tourist_id, agent_id, destination_id = setup(Session, capacity)
+    travel_date = date.today() + timedelta(days=30)
+
+    def attempt(_):
+        started = time.perf_counter()
+        with Session() as session:
+            package = session.get(Package, package_id)
+            try:
+                create_booking(session, package, tourist_id, travel_date, TRAVELERS_PER_BOOKING, 100)
+                ok = True
+            except SeatsUnavailable:
+                ok = False
+        return ok, (time.perf_counter() - started) * 1000
+
+    try:
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            results = list(pool.map(attempt, range(requests)))
+
+        with Session() as session:
+            booked_rows = session.execute(
+                select(func.coalesce(func.sum(Booking.travelers_count), 0)).where(
+                    Booking.package_id == package_id, Booking.travel_date == travel_date
+                )
+            ).scalar_one()
+            inventory_booked = session.execute(
+                select(PackageDateInventory.booked).where(
+                    PackageDateInventory.package_id == package_id,
+                    PackageDateInventory.travel_date == travel_date,
+                )
+            ).scalar_one()
+    finally:
+        teardown(Session, package_id, tourist_id, agent_id, destination_id)
+        engine.dispose()
+
+    succeeded = sum(1 for ok, _ in results if ok)
+    latencies = sorted(ms for _, ms in results)
+    p99 = latencies[max(0, int(len(latencies) * 0.99) - 1)]
+
+    expected = min(requests * TRAVELERS_PER_BOOKING, capacity)
+    print(f"requests={requests} capacity={capacity} succeeded={succeeded} rejected={requests - succeeded}")
+    print(f"seats booked (bookings)={booked_rows} (inventory)={inventory_booked}")
+    print(f"latency ms: p50={statistics.median(latencies):.1f} p99={p99:.1f} max={latencies[-1]:.1f}")
+
+    failures = []
+    if booked_rows > capacity:
+        failures.append(f"overbooked: {booked_rows} seats sold for capacity {capacity}")
+    if booked_rows != inventory_booked:
+        failures.append(f"inventory drift: bookings={booked_rows} inventory={inventory_booked}")
+    if booked_rows != expected:
+        failures.append(f"undersold: expected {expected} seats booked, got {booked_rows}")
+    if p99 > p99_limit_ms:
+        failures.append(f"p99 latency {p99:.1f}ms exceeds {p99_limit_ms}ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,9 @@
 """Get top performing packages"""
 from pyramid.view import view_config
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func
 
 from models.package_model import Package
 from models.booking_model import Booking
-from models.review_model import Review
 from helpers.jwt_validate_helper import jwt_validate
 
 
@@ -45,41 +44,33 @@ def analytics_agent_package_performance(request):
         
         db_session = request.dbsession
         
-        # Get all packages for agent
-        query_packages = select(Package).where(Package.agent_id == user_id)
-        result_packages = db_session.execute(query_packages)
-        packages = result_packages.scalars().all()
-        
-        package_stats = []
-        
-        for package in packages:
-            # Get bookings for package (confirmed + completed only)
-            query_bookings = select(Booking).where(
-                and_(
-                    Booking.package_id == package.id,
-                    Booking.status.in_(["confirmed", "completed"])
-                )
+        # Booking count + revenue per package in one grouped query (confirmed + completed only),
+        # average rating comes from the denormalized packages.rating_avg
+        paid_booking = Booking.status.in_(["confirmed", "completed"])
+        query_stats = (
+            select(
+                Package.id,
+                Package.name,
+                Package.rating_avg,
+                func.count(Booking.id).filter(paid_booking).label("bookings_count"),
+                func.coalesce(func.sum(Booking.total_price).filter(paid_booking), 0).label("revenue"),
             )
-            result_bookings = db_session.execute(query_bookings)
-            bookings = result_bookings.scalars().all()
-            
-            bookings_count = len(bookings)
-            revenue = sum(float(b.total_price) for b in bookings)
-            
-            # Get average rating for package
-            query_avg_rating = select(func.avg(Review.rating)).where(
-                Review.package_id == package.id
-            )
-            avg_rating = db_session.execute(query_avg_rating).scalar()
-            avg_rating = float(avg_rating) if avg_rating else 0
-            
-            package_stats.append({
-                "packageId": str(package.id),
-                "packageName": package.name,
-                "bookingsCount": bookings_count,
-                "revenue": round(revenue, 2),
-                "averageRating": round(avg_rating, 2)
-            })
+            .outerjoin(Booking, Booking.package_id == Package.id)
+            .where(Package.agent_id == user_id)
+            .group_by(Package.id)
+        )
+        rows = db_session.execute(query_stats).all()
+        
+        package_stats = [
+            {
+                "packageId": str(row.id),
+                "packageName": row.name,
+                "bookingsCount": row.bookings_count,
+                "revenue": round(float(row.revenue), 2),
+                "averageRating": round(float(row.rating_avg or 0), 2)
+            }
+            for row in rows
+        ]
         
         # Sort by revenue descending
         package_stats.sort(key=lambda x: x["revenue"], reverse=True)
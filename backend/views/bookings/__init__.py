@@ -0,0 +1,66 @@
+from sqlalchemy.orm import aliased
+
+from models.booking_model import Booking
+from models.package_model import Package
+from models.user_model import User
+from helpers.fieldset_helper import FieldSpec, serialize_fields
+
+
+# Satu-satunya definisi output booking. Field tanpa getter dikirim apa adanya
+# (UUID, date, datetime) dan di-encode oleh renderer json, jadi spec yang sama
+# dipakai untuk row tuple (list endpoint) maupun instance ORM (single booking)
+BOOKING_FIELDS = {
+    "id": FieldSpec(columns=(Booking.id,)),
+    "packageId": FieldSpec(columns=(Booking.package_id,)),
+    "touristId": FieldSpec(columns=(Booking.tourist_id,)),
+    "travelDate": FieldSpec(columns=(Booking.travel_date,)),
+    "travelersCount": FieldSpec(columns=(Booking.travelers_count,)),
+    "totalPrice": FieldSpec(lambda b: float(b.total_price), (Booking.total_price,)),
+    "status": FieldSpec(columns=(Booking.status,)),
+    "createdAt": FieldSpec(columns=(Booking.created_at,)),
+    "completedAt": FieldSpec(columns=(Booking.completed_at,)),
+    "hasReviewed": FieldSpec(columns=(Booking.has_reviewed,)),
+    "paymentStatus": FieldSpec(columns=(Booking.payment_status,)),
+    "paymentProofUrl": FieldSpec(columns=(Booking.payment_proof_url,)),
+    "paymentProofUploadedAt": FieldSpec(columns=(Booking.payment_proof_uploaded_at,)),
+    "paymentVerifiedAt": FieldSpec(columns=(Booking.payment_verified_at,)),
+    "paymentRejectionReason": FieldSpec(columns=(Booking.payment_rejection_reason,)),
+}
+
+# Alias supaya join ringkasan tidak bentrok dengan join Package untuk filter agent
+_summary_package = aliased(Package, name="summary_package")
+_summary_tourist = aliased(User, name="summary_tourist")
+
+_PACKAGE_NAME = _summary_package.name.label("package_name")
+# Hanya gambar pertama yang diambil dari database (images[1:1])
+_PACKAGE_IMAGES = _summary_package.images[1:1].label("package_images")
+_TOURIST_NAME = _summary_tourist.name.label("tourist_name")
+_TOURIST_EMAIL = _summary_tourist.email.label("tourist_email")
+
+# bookings_list juga menyertakan ringkasan package dan tourist (hanya untuk row tuple)
+BOOKING_LIST_FIELDS = {
+    **BOOKING_FIELDS,
+    "package": FieldSpec(
+        lambda r: {
+            "id": r.package_id,
+            "name": r.package_name,
+            "images": r.package_images or [],
+        },
+        (Booking.package_id, _PACKAGE_NAME, _PACKAGE_IMAGES),
+        joins=((_summary_package, Booking.package_id == _summary_package.id),),
+    ),
+    "tourist": FieldSpec(
+        lambda r: {
+            "id": r.tourist_id,
+            "name": r.tourist_name,
+            "email": r.tourist_email,
+        },
+        (Booking.tourist_id, _TOURIST_NAME, _TOURIST_EMAIL),
+        joins=((_summary_tourist, Booking.tourist_id == _summary_tourist.id),),
+    ),
+}
+
+
+def serialize_booking(booking) -> dict:
+    """Serialize a single Booking instance (create/detail/status/payment views)"""
+    return serialize_fields(booking, None, BOOKING_FIELDS)
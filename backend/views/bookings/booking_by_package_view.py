@@ -4,6 +4,8 @@ from sqlalchemy import select
 
 from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.fieldset_helper import parse_fields, fieldset_select
+from . import BOOKING_FIELDS
 
 
 @view_config(route_name="booking_by_package", request_method="GET", renderer="json")
@@ -13,6 +15,9 @@ def booking_by_package(request):
     GET /api/bookings/package/{packageId}
     Get bookings by package
     
+    Query Parameters:
+    - fields (optional): Comma separated fields to return (e.g. id,travelDate,status)
+    
     Response (200 OK):
     [
         {
@@ -39,6 +44,12 @@ def booking_by_package(request):
         user_id = request.jwt_claims.get("sub")
         user_role = request.jwt_claims.get("role")
         
+        try:
+            fields = parse_fields(request.params.get("fields"), BOOKING_FIELDS)
+        except ValueError as e:
+            request.response.status = 400
+            return {"error": str(e)}
+        
         if not package_id:
             request.response.status = 400
             return {"error": "Package ID is required"}
@@ -56,30 +67,10 @@ def booking_by_package(request):
                 return {"error": "Forbidden"}
         
         db_session = request.dbsession
-        query = select(Booking).where(Booking.package_id == package_id)
-        result = db_session.execute(query)
-        bookings = result.scalars().all()
+        query, serialize = fieldset_select(fields, BOOKING_FIELDS)
+        rows = db_session.execute(query.where(Booking.package_id == package_id)).all()
         
-        return [
-            {
-                "id": str(b.id),
-                "packageId": str(b.package_id),
-                "touristId": str(b.tourist_id),
-                "travelDate": b.travel_date.isoformat(),
-                "travelersCount": b.travelers_count,
-                "totalPrice": float(b.total_price),
-                "status": b.status,
-                "createdAt": b.created_at.isoformat() if b.created_at else None,
-                "completedAt": b.completed_at.isoformat() if b.completed_at else None,
-                "hasReviewed": b.has_reviewed,
-                "paymentStatus": b.payment_status,
-                "paymentProofUrl": b.payment_proof_url,
-                "paymentProofUploadedAt": b.payment_proof_uploaded_at.isoformat() if b.payment_proof_uploaded_at else None,
-                "paymentVerifiedAt": b.payment_verified_at.isoformat() if b.payment_verified_at else None,
-                "paymentRejectionReason": b.payment_rejection_reason
-            }
-            for b in bookings
-        ]
+        return [serialize(row) for row in rows]
     
     except Exception as e:
         request.response.status = 500
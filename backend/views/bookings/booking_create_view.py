@@ -5,18 +5,24 @@ from sqlalchemy import select
 from datetime import datetime, timedelta, date
 import json
 
-from models.booking_model import Booking
 from models.package_model import Package
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.idempotency_helper import idempotent
+from helpers.inventory_helper import SeatsUnavailable
+from helpers.booking_helper import create_booking
+from . import serialize_booking
 
 
 @view_config(route_name="bookings", request_method="POST", renderer="json")
 @jwt_validate
+@idempotent("bookings")
 def booking_create(request):
     """
     POST /api/bookings
     Create new booking (Tourist only)
     
+    Header opsional Idempotency-Key: retry dengan key yang sama mengembalikan response pertama
+    
     Request Body:
     {
         "packageId": "uuid",
@@ -117,39 +123,15 @@ def booking_create(request):
             request.response.status = 400
             return {"error": f"Travelers count cannot exceed {package.max_travelers}"}
         
-        # Create booking
-        booking = Booking(
-            package_id=package_id,
-            tourist_id=user_id,
-            travel_date=travel_date,
-            travelers_count=travelers_count,
-            total_price=total_price,
-            status="pending",
-            payment_status="unpaid"
-        )
-        
-        db_session.add(booking)
-        db_session.flush()
-        db_session.commit()
+        # Reserve seats atomically and insert the booking in one transaction
+        try:
+            booking = create_booking(db_session, package, user_id, travel_date, travelers_count, total_price)
+        except SeatsUnavailable as e:
+            request.response.status = 409
+            return {"error": str(e), "remaining": e.remaining}
         
         request.response.status = 201
-        return {
-            "id": str(booking.id),
-            "packageId": str(booking.package_id),
-            "touristId": str(booking.tourist_id),
-            "travelDate": booking.travel_date.isoformat(),
-            "travelersCount": booking.travelers_count,
-            "totalPrice": float(booking.total_price),
-            "status": booking.status,
-            "createdAt": booking.created_at.isoformat() if booking.created_at else None,
-            "completedAt": booking.completed_at.isoformat() if booking.completed_at else None,
-            "hasReviewed": booking.has_reviewed,
-            "paymentStatus": booking.payment_status,
-            "paymentProofUrl": booking.payment_proof_url,
-            "paymentProofUploadedAt": booking.payment_proof_uploaded_at.isoformat() if booking.payment_proof_uploaded_at else None,
-            "paymentVerifiedAt": booking.payment_verified_at.isoformat() if booking.payment_verified_at else None,
-            "paymentRejectionReason": booking.payment_rejection_reason
-        }
+        return serialize_booking(booking)
     
     except Exception as e:
         request.response.status = 500
@@ -4,6 +4,8 @@ from sqlalchemy import select
 
 from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.loader_helper import with_loaders, booking_detail_loaders
+from . import serialize_booking
 
 
 @view_config(route_name="booking_detail", request_method="GET", renderer="json")
@@ -42,7 +44,7 @@ def booking_detail(request):
             request.response.status = 400
             return {"error": "ID is required"}
         
-        query = select(Booking).where(Booking.id == booking_id)
+        query = with_loaders(select(Booking), booking_detail_loaders()).where(Booking.id == booking_id)
         result = db_session.execute(query)
         booking = result.scalar_one_or_none()
         
@@ -69,23 +71,7 @@ def booking_detail(request):
                 "name": last_assignment.guide.name,
                 "status": last_assignment.status
             }
-        return {
-            "id": str(booking.id),
-            "packageId": str(booking.package_id),
-            "touristId": str(booking.tourist_id),
-            "travelDate": booking.travel_date.isoformat(),
-            "travelersCount": booking.travelers_count,
-            "totalPrice": float(booking.total_price),
-            "status": booking.status,
-            "createdAt": booking.created_at.isoformat() if booking.created_at else None,
-            "completedAt": booking.completed_at.isoformat() if booking.completed_at else None,
-            "hasReviewed": booking.has_reviewed,
-            "paymentStatus": booking.payment_status,
-            "paymentProofUrl": booking.payment_proof_url,
-            "paymentProofUploadedAt": booking.payment_proof_uploaded_at.isoformat() if booking.payment_proof_uploaded_at else None,
-            "paymentVerifiedAt": booking.payment_verified_at.isoformat() if booking.payment_verified_at else None,
-            "paymentRejectionReason": booking.payment_rejection_reason
-        }
+        return serialize_booking(booking)
     
     except Exception as e:
         request.response.status = 500
@@ -2,13 +2,16 @@
 import json
 from pyramid.view import view_config
 from pyramid.response import Response
-from sqlalchemy import select, and_
-from datetime import datetime
+from sqlalchemy import select, and_, desc
+from datetime import date, datetime
 
 from models.booking_model import Booking
 from models.package_model import Package
 from models.user_model import User
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.fieldset_helper import parse_fields, fieldset_select
+from helpers.pagination_helper import parse_limit, encode_cursor, decode_cursor, keyset_condition, estimate_total
+from . import BOOKING_LIST_FIELDS
 
 
 @view_config(route_name="bookings", request_method="GET", renderer="json")
@@ -16,16 +19,23 @@ from helpers.jwt_validate_helper import jwt_validate
 def bookings_list(request):
     """
     GET /api/bookings
-    Get all bookings with optional filters
+    Get bookings with optional filters, newest first
+    
+    Tourists only see their own bookings, agents only bookings of their packages.
     
     Query Parameters:
     - tourist_id (optional): Filter by tourist
     - package_id (optional): Filter by package
     - status (optional): Filter by status (pending, confirmed, cancelled, completed)
     - payment_status (optional): Filter by payment status (unpaid, pending_verification, verified, rejected)
+    - travelDateFrom / travelDateTo (optional): Travel date range, inclusive (YYYY-MM-DD)
+    - fields (optional): Comma separated fields to return (e.g. id,travelDate,status,package)
+    - limit (optional): Page size (default 20, max 100)
+    - cursor (optional): nextCursor from the previous page
     
     Response:
-    [
+    {
+      "data": [
         {
             "id": "uuid",
             "packageId": "uuid",
@@ -45,15 +55,41 @@ def bookings_list(request):
             "package": {"id": "uuid", "name": "..."},
             "tourist": {"id": "uuid", "name": "...", "email": "..."}
         }
-    ]
+      ],
+      "pagination": {
+        "limit": 20,
+        "nextCursor": "opaque" | null,
+        "hasMore": true,
+        "total": 1234,
+        "totalIsEstimate": true
+      }
+    }
     """
     try:
         db_session = request.dbsession
         user_id = request.jwt_claims.get("sub")
         user_role = request.jwt_claims.get("role")
         
-        # Base query
-        query = select(Booking)
+        try:
+            fields = parse_fields(request.params.get("fields"), BOOKING_LIST_FIELDS)
+        except ValueError as e:
+            request.response.status = 400
+            return {"error": str(e)}
+        
+        try:
+            limit = parse_limit(request.params.get("limit"))
+        except ValueError:
+            request.response.status = 400
+            return {"error": "limit must be a valid number"}
+        
+        try:
+            travel_date_from = request.params.get("travelDateFrom")
+            travel_date_from = date.fromisoformat(travel_date_from) if travel_date_from else None
+            travel_date_to = request.params.get("travelDateTo")
+            travel_date_to = date.fromisoformat(travel_date_to) if travel_date_to else None
+        except ValueError:
+            request.response.status = 400
+            return {"error": "travelDateFrom/travelDateTo must be YYYY-MM-DD"}
         
         # Apply filters
         filters = []
@@ -61,6 +97,9 @@ def bookings_list(request):
         # Role-based access
         if user_role == "tourist":
             filters.append(Booking.tourist_id == user_id)
+        elif user_role == "agent":
+            # Agent hanya melihat booking dari package miliknya
+            filters.append(Package.agent_id == user_id)
         
         # Optional filters
         tourist_id = request.params.get("tourist_id")
@@ -79,43 +118,55 @@ def bookings_list(request):
         if payment_status:
             filters.append(Booking.payment_status == payment_status)
         
-        if filters:
-            query = query.where(and_(*filters))
+        if travel_date_from:
+            filters.append(Booking.travel_date >= travel_date_from)
+        
+        if travel_date_to:
+            filters.append(Booking.travel_date <= travel_date_to)
+        
+        def filtered(stmt):
+            if user_role == "agent":
+                stmt = stmt.join(Package, Booking.package_id == Package.id)
+            return stmt.where(and_(*filters)) if filters else stmt
+        
+        # Base query (hanya kolom/join yang dibutuhkan fields), urut (created_at, id) terbaru dulu
+        query, serialize = fieldset_select(fields, BOOKING_LIST_FIELDS)
+        query = filtered(
+            query.add_columns(Booking.created_at.label("sort_value"))
+        ).order_by(desc(Booking.created_at), desc(Booking.id))
+        
+        cursor = request.params.get("cursor")
+        if cursor:
+            try:
+                last_created_at, last_id = decode_cursor(cursor, "created_at", datetime.fromisoformat)
+            except ValueError as e:
+                request.response.status = 400
+                return {"error": str(e)}
+            query = query.where(
+                keyset_condition(Booking.created_at, Booking.id, last_created_at, last_id, descending=True)
+            )
+        
+        # Ambil 1 baris ekstra untuk tahu apakah masih ada halaman berikutnya
+        rows = db_session.execute(query.limit(limit + 1)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = encode_cursor("created_at", last.sort_value, last.id)
         
-        result = db_session.execute(query)
-        bookings = result.scalars().all()
+        total, exact = estimate_total(db_session, filtered(select(Booking.id)))
         
         return {
-            "data": [
-                {
-                    "id": str(b.id),
-                    "packageId": str(b.package_id),
-                    "touristId": str(b.tourist_id),
-                    "travelDate": b.travel_date.isoformat(),
-                    "travelersCount": b.travelers_count,
-                    "totalPrice": float(b.total_price),
-                    "status": b.status,
-                    "createdAt": b.created_at.isoformat() if b.created_at else None,
-                    "completedAt": b.completed_at.isoformat() if b.completed_at else None,
-                    "hasReviewed": b.has_reviewed,
-                    "paymentStatus": b.payment_status,
-                    "paymentProofUrl": b.payment_proof_url,
-                    "paymentProofUploadedAt": b.payment_proof_uploaded_at.isoformat() if b.payment_proof_uploaded_at else None,
-                    "paymentVerifiedAt": b.payment_verified_at.isoformat() if b.payment_verified_at else None,
-                    "paymentRejectionReason": b.payment_rejection_reason,
-                    "package": {
-                        "id": str(b.package.id),
-                        "name": b.package.name,
-                        "images": b.package.images[:1] if b.package.images else []
-                    } if b.package else None,
-                    "tourist": {
-                        "id": str(b.tourist.id),
-                        "name": b.tourist.name,
-                        "email": b.tourist.email
-                    } if b.tourist else None
-                }
-                for b in bookings
-            ]
+            "data": [serialize(row) for row in rows],
+            "pagination": {
+                "limit": limit,
+                "nextCursor": next_cursor,
+                "hasMore": has_more,
+                "total": total,
+                "totalIsEstimate": not exact,
+            },
         }
     
     except Exception as e:
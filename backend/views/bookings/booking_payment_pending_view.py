@@ -1,9 +1,28 @@
 """Get pending payment verifications"""
 from pyramid.view import view_config
-from sqlalchemy import select
 
 from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.fieldset_helper import fieldset_select
+from . import BOOKING_LIST_FIELDS
+
+
+# Field yang ditampilkan di antrian verifikasi pembayaran
+PAYMENT_PENDING_FIELDS = (
+    "id",
+    "packageId",
+    "touristId",
+    "travelDate",
+    "travelersCount",
+    "totalPrice",
+    "status",
+    "createdAt",
+    "paymentStatus",
+    "paymentProofUrl",
+    "paymentProofUploadedAt",
+    "package",
+    "tourist",
+)
 
 
 @view_config(route_name="booking_payment_pending", request_method="GET", renderer="json")
@@ -29,7 +48,8 @@ def booking_payment_pending(request):
             "paymentProofUploadedAt": "2024-12-06T10:00:00Z",
             "package": {
                 "id": "uuid",
-                "name": "Maldives Paradise Retreat"
+                "name": "Maldives Paradise Retreat",
+                "images": ["https://..."]
             },
             "tourist": {
                 "id": "uuid",
@@ -54,41 +74,17 @@ def booking_payment_pending(request):
         from sqlalchemy import and_
         from models.package_model import Package
         
-        query = select(Booking).join(Package).where(
+        query, serialize = fieldset_select(PAYMENT_PENDING_FIELDS, BOOKING_LIST_FIELDS)
+        query = query.join(Package, Booking.package_id == Package.id).where(
             and_(
                 Booking.payment_status == "pending_verification",
                 Package.agent_id == user_id
             )
         )
         
-        result = db_session.execute(query)
-        bookings = result.scalars().all()
+        rows = db_session.execute(query).all()
         
-        return [
-            {
-                "id": str(b.id),
-                "packageId": str(b.package_id),
-                "touristId": str(b.tourist_id),
-                "travelDate": b.travel_date.isoformat(),
-                "travelersCount": b.travelers_count,
-                "totalPrice": float(b.total_price),
-                "status": b.status,
-                "createdAt": b.created_at.isoformat() if b.created_at else None,
-                "paymentStatus": b.payment_status,
-                "paymentProofUrl": b.payment_proof_url,
-                "paymentProofUploadedAt": b.payment_proof_uploaded_at.isoformat() if b.payment_proof_uploaded_at else None,
-                "package": {
-                    "id": str(b.package.id),
-                    "name": b.package.name
-                },
-                "tourist": {
-                    "id": str(b.tourist.id),
-                    "name": b.tourist.name,
-                    "email": b.tourist.email
-                }
-            }
-            for b in bookings
-        ]
+        return [serialize(row) for row in rows]
     
     except Exception as e:
         request.response.status = 500
@@ -1,17 +1,17 @@
 """Upload payment proof"""
-import os
-import uuid as uuid_lib
 from datetime import datetime
 from pyramid.view import view_config
 from sqlalchemy import select
-from PIL import Image
 from io import BytesIO
 
 from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.media_storage_helper import PAYMENT_PROOF_MEDIA
+from helpers.media_task_helper import verify_image
+from helpers.worker_pool_helper import MEDIA_POOL, WorkerPoolError, pool_error
+from . import serialize_booking
 
 # Storage configuration
-STORAGE_DIR = "storage/payment_proofs"
 ALLOWED_EXTENSIONS = {"jpeg", "png", "jpg", "gif"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
@@ -83,6 +83,13 @@ def booking_payment_upload(request):
             request.response.status = 400
             return {"error": f"Payment proof must be image file (jpeg, png, or gif). Got: {content_type}"}
         
+        # Validate file extension (disimpan di media_objects.extension)
+        filename = getattr(payment_file, 'filename', '') or ''
+        file_ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+        if file_ext not in ALLOWED_EXTENSIONS:
+            request.response.status = 400
+            return {"error": f"Payment proof file extension must be one of: {', '.join(sorted(ALLOWED_EXTENSIONS))}"}
+        
         # Read file data
         image_data = payment_file.file.read()
         file_size = len(image_data)
@@ -92,11 +99,13 @@ def booking_payment_upload(request):
             request.response.status = 400
             return {"error": "Payment proof file size must be <= 5MB"}
         
-        # Validate it's a valid image
+        # Validate it's a valid image (Pillow di worker process)
         try:
-            image = Image.open(BytesIO(image_data))
-            image.verify()
-        except Exception:
+            is_valid_image = MEDIA_POOL.run(verify_image, image_data)
+        except WorkerPoolError as e:
+            return pool_error(request, e)
+        
+        if not is_valid_image:
             request.response.status = 400
             return {"error": "Invalid image file"}
         
@@ -119,43 +128,19 @@ def booking_payment_upload(request):
             request.response.status = 400
             return {"error": "Cannot upload payment proof for this booking"}
         
-        # Create storage directory if it doesn't exist
-        os.makedirs(STORAGE_DIR, exist_ok=True)
-        
-        # Generate unique filename
-        file_ext = payment_file.filename.split('.')[-1]
-        unique_filename = f"{booking_id}_{uuid_lib.uuid4()}.{file_ext}"
-        filepath = os.path.join(STORAGE_DIR, unique_filename)
-        
-        # Save file
-        with open(filepath, 'wb') as f:
-            f.write(image_data)
+        # Save file (content-addressed, re-upload of the same proof is only a hash lookup)
+        stored = PAYMENT_PROOF_MEDIA.put(db_session, BytesIO(image_data), f".{file_ext}")
+        PAYMENT_PROOF_MEDIA.release(db_session, [booking.payment_proof_url])
         
         # Update booking
-        booking.payment_proof_url = f"/payment_proofs/{unique_filename}"
+        booking.payment_proof_url = stored.url
         booking.payment_proof_uploaded_at = datetime.now()
         booking.payment_status = "pending_verification"
         
         db_session.flush()
         db_session.commit()
         
-        return {
-            "id": str(booking.id),
-            "packageId": str(booking.package_id),
-            "touristId": str(booking.tourist_id),
-            "travelDate": booking.travel_date.isoformat(),
-            "travelersCount": booking.travelers_count,
-            "totalPrice": float(booking.total_price),
-            "status": booking.status,
-            "createdAt": booking.created_at.isoformat() if booking.created_at else None,
-            "completedAt": booking.completed_at.isoformat() if booking.completed_at else None,
-            "hasReviewed": booking.has_reviewed,
-            "paymentStatus": booking.payment_status,
-            "paymentProofUrl": booking.payment_proof_url,
-            "paymentProofUploadedAt": booking.payment_proof_uploaded_at.isoformat() if booking.payment_proof_uploaded_at else None,
-            "paymentVerifiedAt": booking.payment_verified_at.isoformat() if booking.payment_verified_at else None,
-            "paymentRejectionReason": booking.payment_rejection_reason
-        }
+        return serialize_booking(booking)
     
     except Exception as e:
         request.response.status = 500
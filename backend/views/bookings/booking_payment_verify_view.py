@@ -5,6 +5,9 @@ from datetime import datetime
 
 from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.loader_helper import with_loaders, booking_owner_loaders
+from helpers.inventory_helper import apply_status_change, SeatsUnavailable
+from . import serialize_booking
 
 
 @view_config(route_name="booking_payment_verify", request_method="PUT", renderer="json")
@@ -50,7 +53,7 @@ def booking_payment_verify(request):
             return {"error": "ID is required"}
         
         # Get booking
-        query = select(Booking).where(Booking.id == booking_id)
+        query = with_loaders(select(Booking), booking_owner_loaders()).where(Booking.id == booking_id)
         result = db_session.execute(query)
         booking = result.scalar_one_or_none()
         
@@ -68,6 +71,14 @@ def booking_payment_verify(request):
             request.response.status = 400
             return {"error": "Booking payment status is not pending verification"}
         
+        # Booking yang sudah cancelled harus memesan kursinya lagi
+        try:
+            apply_status_change(db_session, booking, "confirmed")
+        except SeatsUnavailable as e:
+            db_session.rollback()
+            request.response.status = 409
+            return {"error": str(e), "remaining": e.remaining}
+        
         # Update payment
         booking.payment_status = "verified"
         booking.payment_verified_at = datetime.now()
@@ -77,23 +88,7 @@ def booking_payment_verify(request):
         db_session.flush()
         db_session.commit()
         
-        return {
-            "id": str(booking.id),
-            "packageId": str(booking.package_id),
-            "touristId": str(booking.tourist_id),
-            "travelDate": booking.travel_date.isoformat(),
-            "travelersCount": booking.travelers_count,
-            "totalPrice": float(booking.total_price),
-            "status": booking.status,
-            "createdAt": booking.created_at.isoformat() if booking.created_at else None,
-            "completedAt": booking.completed_at.isoformat() if booking.completed_at else None,
-            "hasReviewed": booking.has_reviewed,
-            "paymentStatus": booking.payment_status,
-            "paymentProofUrl": booking.payment_proof_url,
-            "paymentProofUploadedAt": booking.payment_proof_uploaded_at.isoformat() if booking.payment_proof_uploaded_at else None,
-            "paymentVerifiedAt": booking.payment_verified_at.isoformat() if booking.payment_verified_at else None,
-            "paymentRejectionReason": booking.payment_rejection_reason
-        }
+        return serialize_booking(booking)
     
     except Exception as e:
         request.response.status = 500
@@ -0,0 +1,32 @@
+"""Catalog cache statistics"""
+from pyramid.view import view_config
+
+from helpers.cache_helper import catalog_cache
+from helpers.jwt_validate_helper import jwt_validate
+
+
+@view_config(route_name="cache_stats", request_method="GET", renderer="json")
+@jwt_validate
+def cache_stats(request):
+    """
+    GET /api/cache/stats
+    Hit/miss/eviction counters of the in-process catalog cache (Agent only)
+    
+    Response (200 OK):
+    {
+        "size": 120,
+        "maxSize": 512,
+        "ttlSeconds": 60,
+        "hits": 9500,
+        "misses": 500,
+        "hitRatio": 0.95,
+        "evictions": 0,
+        "expirations": 380,
+        "invalidations": 42
+    }
+    """
+    if request.jwt_claims.get("role") != "agent":
+        request.response.status = 403
+        return {"error": "Only agents can view cache statistics"}
+    
+    return catalog_cache.stats()
@@ -1,5 +1,5 @@
 from db import Session
-from sqlalchemy import select
+from sqlalchemy import select, or_, desc, func
 from sqlalchemy.exc import NoResultFound, IntegrityError
 from typing import Optional
 from pyramid.view import view_config
@@ -7,6 +7,9 @@ from pydantic import BaseModel, ValidationError
 from pyramid.response import Response
 from models.destination_model import Destination
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.cache_helper import cached_view, catalog_cache, DESTINATION_LIST_TAG, PACKAGE_LIST_TAG, destination_tag
+from helpers.conditional_helper import conditional_view, collection_validators, row_validators
+from helpers.search_helper import set_fuzzy_threshold, fuzzy_condition, fuzzy_score
 import os
 import uuid
 from pathlib import Path
@@ -15,6 +18,7 @@ from pathlib import Path
 class DestinationFilterRequest(BaseModel):
     country: Optional[str] = None
     name: Optional[str] = None
+    q: Optional[str] = None
 
 
 class CreateDestinationRequest(BaseModel):
@@ -34,6 +38,8 @@ def serialization_data(destination):
 
 
 @view_config(route_name="destinations", request_method="GET", renderer="json")
+@conditional_view(collection_validators("destinations", DESTINATION_LIST_TAG))
+@cached_view("destinations", lambda request, result: (DESTINATION_LIST_TAG,))
 def destinations(request):
     # request validation
     try:
@@ -50,6 +56,23 @@ def destinations(request):
             stmt = stmt.where(Destination.country == req_data.country)
         if req_data.name is not None:
             stmt = stmt.where(Destination.name == req_data.name)
+        if req_data.q:
+            # pencarian toleran typo (pg_trgm), hasil paling mirip di atas
+            search_query = req_data.q.strip()
+            set_fuzzy_threshold(session)
+            stmt = stmt.where(
+                or_(
+                    fuzzy_condition(Destination.name, search_query),
+                    fuzzy_condition(Destination.country, search_query),
+                )
+            ).order_by(
+                desc(
+                    func.greatest(
+                        fuzzy_score(Destination.name, search_query),
+                        fuzzy_score(Destination.country, search_query),
+                    )
+                )
+            )
 
         try:
             result = (
@@ -64,6 +87,8 @@ def destinations(request):
 
 
 @view_config(route_name="destination_detail", request_method="GET", renderer="json")
+@conditional_view(row_validators(Destination))
+@cached_view("destination_detail", lambda request, result: (destination_tag(result["id"]),))
 def destination_detail(request):
     dest_id = request.matchdict.get("id")
     with Session() as session:
@@ -107,6 +132,7 @@ def create_destination(request):
             try:
                 session.add(new_destination)
                 session.commit()
+                catalog_cache.invalidate(DESTINATION_LIST_TAG)
                 return {
                     "message": "Destination created successfully",
                     "destination": serialization_data(new_destination),
@@ -157,6 +183,8 @@ def update_destination(request):
             
             try:
                 session.commit()
+                # nama/negara destinasi ikut ter-embed di payload package
+                catalog_cache.invalidate(DESTINATION_LIST_TAG, destination_tag(dest_id), PACKAGE_LIST_TAG)
                 return {
                     "message": "Destination updated successfully",
                     "destination": serialization_data(destination)
@@ -189,6 +217,7 @@ def delete_destination(request):
             try:
                 session.delete(destination)
                 session.commit()
+                catalog_cache.invalidate(DESTINATION_LIST_TAG, destination_tag(dest_id))
                 return {
                     "message": "Destination deleted successfully",
                     "id": str(dest_id)
@@ -1,17 +1,47 @@
-def serialization_data(pkg):
-    return {
-        "id": str(pkg.id),
-        "agentId": str(pkg.agent_id),
-        "destinationId": str(pkg.destination_id),
-        "name": pkg.name,
-        "duration": pkg.duration,
-        "price": float(pkg.price),
-        "itinerary": pkg.itinerary,
-        "maxTravelers": pkg.max_travelers,
-        "contactPhone": pkg.contact_phone,
-        "images": pkg.images,
-        "rating": 0,
-        "reviewsCount": 0,
-        "destinationName": pkg.destination.name if pkg.destination else None,
-        "country": pkg.destination.country if pkg.destination else None,
-    }
+from models.package_model import Package
+from helpers.fieldset_helper import FieldSpec, serialize_fields
+from helpers.loader_helper import package_loaders
+
+# Satu instance supaya destinationName & country berbagi join yang sama
+_DESTINATION_LOADERS = package_loaders()
+
+PACKAGE_FIELDS = {
+    "id": FieldSpec(lambda pkg: str(pkg.id), (Package.id,)),
+    "agentId": FieldSpec(lambda pkg: str(pkg.agent_id), (Package.agent_id,)),
+    "destinationId": FieldSpec(lambda pkg: str(pkg.destination_id), (Package.destination_id,)),
+    "name": FieldSpec(lambda pkg: pkg.name, (Package.name,)),
+    "duration": FieldSpec(lambda pkg: pkg.duration, (Package.duration,)),
+    "price": FieldSpec(lambda pkg: float(pkg.price), (Package.price,)),
+    "itinerary": FieldSpec(lambda pkg: pkg.itinerary, (Package.itinerary,)),
+    "maxTravelers": FieldSpec(lambda pkg: pkg.max_travelers, (Package.max_travelers,)),
+    "contactPhone": FieldSpec(lambda pkg: pkg.contact_phone, (Package.contact_phone,)),
+    "images": FieldSpec(lambda pkg: pkg.images, (Package.images,)),
+    # Sejajar dengan images, null kalau varian belum selesai dibuat
+    "imageVariants": FieldSpec(
+        lambda pkg: [(pkg.image_variants or {}).get(url) for url in pkg.images or []],
+        (Package.images, Package.image_variants),
+    ),
+    "rating": FieldSpec(lambda pkg: float(pkg.rating_avg or 0), (Package.rating_avg,)),
+    "reviewsCount": FieldSpec(lambda pkg: pkg.rating_count or 0, (Package.rating_count,)),
+    "destinationName": FieldSpec(
+        lambda pkg: pkg.destination.name if pkg.destination else None,
+        (Package.destination_id,),
+        _DESTINATION_LOADERS,
+    ),
+    "country": FieldSpec(
+        lambda pkg: pkg.destination.country if pkg.destination else None,
+        (Package.destination_id,),
+        _DESTINATION_LOADERS,
+    ),
+}
+
+
+def serialization_data(pkg, fields=None):
+    """
+    Serialize package
+
+    Args:
+        pkg: Package instance
+        fields: Field names from parse_fields (`?fields=`), None for all fields
+    """
+    return serialize_fields(pkg, fields, PACKAGE_FIELDS)
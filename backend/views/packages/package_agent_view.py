@@ -3,7 +3,9 @@ from pyramid.view import view_config
 from sqlalchemy import select, desc
 from db import Session
 from models.package_model import Package
-from . import serialization_data
+from helpers.loader_helper import with_loaders, package_loaders
+from helpers.fieldset_helper import parse_fields, fieldset_options
+from . import serialization_data, PACKAGE_FIELDS
 import uuid
 
 
@@ -11,6 +13,11 @@ import uuid
 def get_package_by_agent(request):
     agent_id = request.matchdict.get("agentId")
 
+    try:
+        fields = parse_fields(request.params.get("fields"), PACKAGE_FIELDS)
+    except ValueError as e:
+        return Response(json_body={"error": str(e)}, status=400)
+
     with Session() as session:
         try:
             uuid.UUID(agent_id)
@@ -18,14 +25,14 @@ def get_package_by_agent(request):
             return Response(json_body={"error": "Invalid Agent ID format"}, status=400)
 
         stmt = (
-            select(Package)
+            with_loaders(select(Package), fieldset_options(fields, PACKAGE_FIELDS, package_loaders()))
             .where(Package.agent_id == agent_id)
             .order_by(desc(Package.created_at))
         )
 
         try:
             results = session.execute(stmt).scalars().all()
-            return [serialization_data(pkg) for pkg in results]
+            return [serialization_data(pkg, fields) for pkg in results]
         except Exception as e:
             print(f"Error fetching agent packages: {e}")
             return Response(json_body={"error": "Internal Server Error"}, status=500)
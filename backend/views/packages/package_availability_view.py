@@ -0,0 +1,77 @@
+from pyramid.response import Response
+from pyramid.view import view_config
+from sqlalchemy import select
+from db import Session
+from models.package_model import Package
+from helpers.inventory_helper import inventory_range
+from datetime import date, timedelta
+import uuid
+
+
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 366
+
+
+@view_config(route_name="package_availability", request_method="GET", renderer="json")
+def get_package_availability(request):
+    """
+    GET /api/packages/{id}/availability?from=2025-02-01&to=2025-02-28
+    Remaining seats per travel date (default: today + 30 days, max 366 days)
+
+    Response (200 OK):
+    {
+        "packageId": "uuid",
+        "capacity": 20,
+        "dates": [
+            {"date": "2025-02-01", "capacity": 20, "booked": 6, "remaining": 14}
+        ]
+    }
+    """
+    pkg_id = request.matchdict.get("id")
+    try:
+        uuid.UUID(pkg_id)
+    except ValueError:
+        return Response(json_body={"error": "Invalid package ID format"}, status=400)
+
+    try:
+        date_from = date.fromisoformat(request.params["from"]) if request.params.get("from") else date.today()
+        date_to = (
+            date.fromisoformat(request.params["to"])
+            if request.params.get("to")
+            else date_from + timedelta(days=DEFAULT_RANGE_DAYS)
+        )
+    except ValueError:
+        return Response(json_body={"error": "from and to must be dates in YYYY-MM-DD format"}, status=400)
+
+    if date_to < date_from:
+        return Response(json_body={"error": "to must not be before from"}, status=400)
+    if (date_to - date_from).days >= MAX_RANGE_DAYS:
+        return Response(json_body={"error": f"Date range cannot exceed {MAX_RANGE_DAYS} days"}, status=400)
+
+    with Session() as session:
+        try:
+            max_travelers = session.execute(
+                select(Package.max_travelers).where(Package.id == pkg_id)
+            ).scalar_one_or_none()
+            if max_travelers is None:
+                return Response(json_body={"error": "Package not found"}, status=404)
+
+            inventory = inventory_range(session, pkg_id, date_from, date_to)
+        except Exception as e:
+            print(f"Error fetching package availability: {e}")
+            return Response(json_body={"error": "Internal server error"}, status=500)
+
+    # Tanggal tanpa baris inventory belum punya booking sama sekali
+    dates = []
+    day = date_from
+    while day <= date_to:
+        capacity, booked = inventory.get(day, (max_travelers, 0))
+        dates.append({
+            "date": day.isoformat(),
+            "capacity": capacity,
+            "booked": booked,
+            "remaining": max(capacity - booked, 0),
+        })
+        day += timedelta(days=1)
+
+    return {"packageId": pkg_id, "capacity": max_travelers, "dates": dates}
@@ -0,0 +1,205 @@
+from pyramid.response import Response
+from pyramid.view import view_config
+from sqlalchemy import select, insert
+from db import Session
+from models.package_model import Package
+from models.destination_model import Destination
+from helpers.jwt_validate_helper import jwt_validate
+from helpers.cache_helper import catalog_cache, PACKAGE_LIST_TAG
+from helpers.media_storage_helper import PACKAGE_MEDIA
+from pydantic import ValidationError
+from .packages_view import PackageRequest
+import csv
+import io
+import json
+import uuid
+
+
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+
+
+def iter_csv_rows(body_file):
+    """Yield (row number, dict or row error) from a CSV body, `images` separated by `|`"""
+    reader = csv.DictReader(io.TextIOWrapper(body_file, encoding="utf-8", newline=""))
+    for row_number, row in enumerate(reader, start=1):
+        # Kolom lebih banyak dari header -> DictReader menaruhnya di key None
+        if None in row:
+            yield row_number, ValueError(f"Row has {len(row[None])} more field(s) than the header")
+            continue
+        images = (row.get("images") or "").strip()
+        row["images"] = [url.strip() for url in images.split("|") if url.strip()] if images else []
+        yield row_number, row
+
+
+def iter_ndjson_rows(body_file):
+    """Yield (row number, dict or parse error) from an NDJSON body, one object per line"""
+    for row_number, line in enumerate(io.TextIOWrapper(body_file, encoding="utf-8"), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield row_number, json.loads(line)
+        except json.JSONDecodeError as err:
+            yield row_number, ValueError(f"Invalid JSON: {err.msg}")
+
+
+def to_package_values(req_data, agent_id):
+    return {
+        "agent_id": agent_id,
+        "destination_id": uuid.UUID(req_data.destinationId),
+        "name": req_data.name,
+        "duration": req_data.duration,
+        "price": req_data.price,
+        "itinerary": req_data.itinerary,
+        "max_travelers": req_data.maxTravelers,
+        "contact_phone": req_data.contactPhone,
+        "images": req_data.images,
+    }
+
+
+@view_config(route_name="package_bulk", request_method="POST", renderer="json")
+@jwt_validate
+def bulk_create_packages(request):
+    """
+    POST /api/packages/bulk
+    Import many packages in one request (Agent only)
+
+    Body is streamed and processed in batches of 1000 rows:
+    - text/csv: header destinationId,name,duration,price,itinerary,maxTravelers,contactPhone,images
+      (images separated by `|`)
+    - application/x-ndjson: one PackageRequest JSON object per line
+
+    Response (200 OK):
+    {
+        "inserted": 49998,
+        "failed": 2,
+        "errors": [
+            {"row": 17, "error": "Destination id not found"}
+        ]
+    }
+    """
+    if request.jwt_claims["role"] != "agent":
+        return Response(
+            json_body={"error": "Forbidden : Only agent can access"}, status=403
+        )
+
+    content_type = (request.content_type or "").lower()
+    if content_type in CSV_CONTENT_TYPES:
+        rows = iter_csv_rows(request.body_file)
+    elif content_type in NDJSON_CONTENT_TYPES:
+        rows = iter_ndjson_rows(request.body_file)
+    else:
+        return Response(
+            json_body={"error": "Content-Type must be text/csv or application/x-ndjson"},
+            status=415,
+        )
+
+    try:
+        agent_uuid = uuid.UUID(request.jwt_claims["sub"])
+    except ValueError:
+        return Response(json_body={"error": "Invalid UUID format"}, status=400)
+
+    inserted = 0
+    failed = 0
+    errors = []
+    known_destinations = {}  # destination id -> exists
+
+    def report(row_number, message):
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"row": row_number, "error": message})
+
+    def flush(session, batch):
+        nonlocal inserted
+        if not batch:
+            return
+
+        # Resolve destinations of this batch that were not seen before in one query
+        unknown = {values["destination_id"] for _, values in batch} - known_destinations.keys()
+        if unknown:
+            found = set(
+                session.execute(
+                    select(Destination.id).where(Destination.id.in_(unknown))
+                ).scalars()
+            )
+            for destination_id in unknown:
+                known_destinations[destination_id] = destination_id in found
+
+        valid = []
+        for row_number, values in batch:
+            if known_destinations[values["destination_id"]]:
+                valid.append((row_number, values))
+            else:
+                report(row_number, "Destination id not found")
+
+        if not valid:
+            return
+
+        try:
+            # Multi-row INSERT (executemany -> insertmanyvalues batches)
+            session.execute(insert(Package), [values for _, values in valid])
+            # Gambar yang sudah ada di storage ikut direferensikan package baru
+            PACKAGE_MEDIA.retain(session, [url for _, values in valid for url in values["images"]])
+            session.commit()
+            inserted += len(valid)
+        except Exception:
+            session.rollback()
+            # Retry row by row so the failing rows can be reported individually
+            for row_number, values in valid:
+                try:
+                    session.execute(insert(Package), [values])
+                    PACKAGE_MEDIA.retain(session, values["images"])
+                    session.commit()
+                    inserted += 1
+                except Exception as err:
+                    session.rollback()
+                    report(row_number, str(getattr(err, "orig", err)))
+
+    try:
+        with Session() as session:
+            batch = []
+            for row_number, row in rows:
+                if isinstance(row, Exception):
+                    report(row_number, str(row))
+                    continue
+                if not isinstance(row, dict):
+                    report(row_number, "Row must be a JSON object")
+                    continue
+
+                try:
+                    req_data = PackageRequest(**row)
+                    values = to_package_values(req_data, agent_uuid)
+                except ValidationError as err:
+                    report(row_number, "; ".join(
+                        f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}"
+                        for detail in err.errors()
+                    ))
+                    continue
+                except ValueError:
+                    report(row_number, "Invalid destinationId format")
+                    continue
+
+                batch.append((row_number, values))
+                if len(batch) >= BATCH_SIZE:
+                    flush(session, batch)
+                    batch = []
+
+            flush(session, batch)
+    except (UnicodeDecodeError, csv.Error) as err:
+        return Response(
+            json_body={"error": f"Malformed body: {err}", "inserted": inserted},
+            status=400,
+        )
+    except Exception as e:
+        print(f"Error bulk creating packages: {e}")
+        return Response(json_body={"error": "Internal server error", "inserted": inserted}, status=500)
+    finally:
+        if inserted:
+            catalog_cache.invalidate(PACKAGE_LIST_TAG)
+
+    return {"inserted": inserted, "failed": failed, "errors": errors}
@@ -4,9 +4,16 @@ from sqlalchemy import select
 from sqlalchemy.exc import NoResultFound
 from db import Session
 from models.package_model import Package
+from models.booking_model import Booking
 from helpers.jwt_validate_helper import jwt_validate
 from pydantic import BaseModel, ValidationError
 from typing import Optional, List
+from helpers.cache_helper import cached_view, catalog_cache, PACKAGE_LIST_TAG, package_tag, destination_tag
+from helpers.conditional_helper import conditional_view, row_validators
+from helpers.loader_helper import with_loaders, package_loaders
+from helpers.media_storage_helper import PACKAGE_MEDIA
+from helpers.inventory_helper import update_capacity
+from helpers.booking_helper import release_payment_proofs
 from . import serialization_data
 
 
@@ -21,12 +28,17 @@ class PackageUpdateRequest(BaseModel):
 
 
 @view_config(route_name="package_detail", request_method="GET", renderer="json")
+@conditional_view(row_validators(Package))
+@cached_view(
+    "package_detail",
+    lambda request, result: (package_tag(result["id"]), destination_tag(result["destinationId"])),
+)
 def package_detail(request):
     pkg_id = request.matchdict.get("id")
 
     with Session() as session:
         try:
-            stmt = select(Package).where(Package.id == pkg_id)
+            stmt = with_loaders(select(Package), package_loaders()).where(Package.id == pkg_id)
             pkg = session.execute(stmt).scalars().one()
             return serialization_data(pkg)
         except NoResultFound:
@@ -67,6 +79,12 @@ def update_package(request):
             )
 
         update_data = req_data.model_dump(exclude_unset=True)
+        if update_data.get("images") is not None:
+            # Pindahkan referensi media dari gambar lama ke gambar baru
+            PACKAGE_MEDIA.retain(session, update_data["images"])
+            PACKAGE_MEDIA.release(session, pkg.images)
+        if update_data.get("maxTravelers") is not None:
+            update_capacity(session, pkg.id, update_data["maxTravelers"])
         for key, value in update_data.items():
             if key == "maxTravelers":
                 key = "max_travelers"
@@ -76,6 +94,7 @@ def update_package(request):
 
         try:
             session.commit()
+            catalog_cache.invalidate(PACKAGE_LIST_TAG, package_tag(pkg_id))
             session.refresh(pkg)
             return serialization_data(pkg)
         except Exception as e:
@@ -107,8 +126,12 @@ def delete_package(request):
             )
 
         try:
+            PACKAGE_MEDIA.release(session, pkg.images)
+            # Booking ikut terhapus (cascade), bukti pembayarannya tidak direferensikan lagi
+            release_payment_proofs(session, Booking.package_id == pkg.id)
             session.delete(pkg)
             session.commit()
+            catalog_cache.invalidate(PACKAGE_LIST_TAG, package_tag(pkg_id))
             return {"message": "Package Successfully Deleted"}
         except Exception as e:
             session.rollback()
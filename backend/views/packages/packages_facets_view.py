@@ -0,0 +1,157 @@
+from pyramid.response import Response
+from pyramid.view import view_config
+from sqlalchemy import select, func, case, and_, true, tuple_
+from db import Session
+from models.package_model import Package
+from models.destination_model import Destination
+from helpers.cache_helper import cached_view, PACKAGE_LIST_TAG
+from helpers.conditional_helper import conditional_view, collection_validators
+from helpers.search_helper import build_prefix_tsquery, search_condition
+import uuid
+
+
+# (key, min inclusive, max exclusive) - sama dengan pilihan filter harga di halaman packages
+PRICE_BUCKETS = [
+    ("0-500", 0, 500),
+    ("500-1000", 500, 1000),
+    ("1000-2000", 1000, 2000),
+    ("2000+", 2000, None),
+]
+
+# durasi dalam hari (min inclusive, max inclusive)
+DURATION_BUCKETS = [
+    ("1-3", 1, 3),
+    ("4-7", 4, 7),
+    ("8-14", 8, 14),
+    ("15+", 15, None),
+]
+
+# GROUPING() bitmask over (destination_id, country, price_bucket, duration_bucket)
+GROUP_DESTINATION = 0b0011
+GROUP_COUNTRY = 0b1011
+GROUP_PRICE = 0b1101
+GROUP_DURATION = 0b1110
+GROUP_TOTAL = 0b1111
+
+
+def bucket_expression(column, buckets, upper_inclusive):
+    whens = []
+    for key, _, upper in buckets:
+        if upper is None:
+            continue
+        condition = column <= upper if upper_inclusive else column < upper
+        whens.append((condition, key))
+    return case(*whens, else_=buckets[-1][0])
+
+
+def bucket_counts(buckets, counts):
+    return [
+        {"key": key, "min": lower, "max": upper, "count": counts.get(key, 0)}
+        for key, lower, upper in buckets
+    ]
+
+
+@view_config(route_name="package_facets", request_method="GET", renderer="json")
+@conditional_view(collection_validators("package_facets", PACKAGE_LIST_TAG))
+@cached_view("package_facets", lambda request, result: (PACKAGE_LIST_TAG,))
+def get_package_facets(request):
+    destination_id = request.params.get("destination")
+    search_query = request.params.get("q") or request.params.get("search")
+    min_price = request.params.get("minPrice")
+    max_price = request.params.get("maxPrice")
+
+    # Filter search berlaku untuk semua facet. Filter destinasi tidak dipakai untuk
+    # facet destinasi/negara dan filter harga tidak dipakai untuk facet harga,
+    # supaya UI tetap bisa menampilkan jumlah untuk pilihan lain.
+    destination_conditions = []
+    if destination_id and destination_id != "all":
+        try:
+            uuid.UUID(destination_id)
+            destination_conditions.append(Package.destination_id == destination_id)
+        except ValueError:
+            pass
+
+    price_conditions = []
+    try:
+        if min_price:
+            price_conditions.append(Package.price >= float(min_price))
+        if max_price:
+            price_conditions.append(Package.price <= float(max_price))
+    except ValueError:
+        return Response(json_body={"error": "minPrice and maxPrice must be valid numbers"}, status=400)
+
+    destination_match = and_(*destination_conditions) if destination_conditions else true()
+    price_match = and_(*price_conditions) if price_conditions else true()
+
+    price_bucket = bucket_expression(Package.price, PRICE_BUCKETS, upper_inclusive=False)
+    duration_bucket = bucket_expression(Package.duration, DURATION_BUCKETS, upper_inclusive=True)
+
+    stmt = (
+        select(
+            func.grouping(
+                Package.destination_id, Destination.country, price_bucket, duration_bucket
+            ).label("grouping_id"),
+            Package.destination_id,
+            Destination.name,
+            Destination.country,
+            price_bucket.label("price_bucket"),
+            duration_bucket.label("duration_bucket"),
+            func.count().filter(price_match).label("without_destination_filter"),
+            func.count().filter(destination_match).label("without_price_filter"),
+            func.count().filter(and_(destination_match, price_match)).label("all_filters"),
+        )
+        .join(Destination, Destination.id == Package.destination_id)
+        .group_by(
+            func.grouping_sets(
+                tuple_(Package.destination_id, Destination.name, Destination.country),
+                tuple_(Destination.country),
+                tuple_(price_bucket),
+                tuple_(duration_bucket),
+                tuple_(),
+            )
+        )
+    )
+
+    tsquery = build_prefix_tsquery(search_query) if search_query else None
+    if tsquery:
+        stmt = stmt.where(search_condition(Package.search_vector, tsquery))
+
+    with Session() as session:
+        try:
+            rows = session.execute(stmt).all()
+        except Exception as e:
+            print(f"Error fetching package facets : {e}")
+            return Response(json_body={"error": "Internal server error"}, status=500)
+
+    total = 0
+    destinations = []
+    countries = []
+    price_counts = {}
+    duration_counts = {}
+    for row in rows:
+        if row.grouping_id == GROUP_DESTINATION:
+            destinations.append({
+                "id": str(row.destination_id),
+                "name": row.name,
+                "country": row.country,
+                "count": row.without_destination_filter,
+            })
+        elif row.grouping_id == GROUP_COUNTRY:
+            countries.append({"country": row.country, "count": row.without_destination_filter})
+        elif row.grouping_id == GROUP_PRICE:
+            price_counts[row.price_bucket] = row.without_price_filter
+        elif row.grouping_id == GROUP_DURATION:
+            duration_counts[row.duration_bucket] = row.all_filters
+        elif row.grouping_id == GROUP_TOTAL:
+            total = row.all_filters
+
+    destinations.sort(key=lambda item: (-item["count"], item["name"]))
+    countries.sort(key=lambda item: (-item["count"], item["country"]))
+
+    return {
+        "total": total,
+        "destinations": destinations,
+        "countries": countries,
+        "priceBuckets": bucket_counts(PRICE_BUCKETS, price_counts),
+        "durationBuckets": bucket_counts(DURATION_BUCKETS, duration_counts),
+    }
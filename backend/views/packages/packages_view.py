@@ -8,9 +8,19 @@ from models.destination_model import Destination
 from helpers.jwt_validate_helper import jwt_validate
 from pydantic import BaseModel, Field, ValidationError
 from typing import List
-from . import serialization_data
+from helpers.pagination_helper import parse_limit, encode_cursor, decode_cursor, keyset_condition
+from helpers.cache_helper import cached_view, catalog_cache, PACKAGE_LIST_TAG
+from helpers.conditional_helper import conditional_view, collection_validators
+from helpers.loader_helper import with_loaders, package_loaders
+from helpers.search_helper import build_prefix_tsquery, search_condition, search_rank
+from helpers.image_helper import ALLOWED_EXTENSIONS, schedule_package_variants
+from helpers.media_storage_helper import PACKAGE_MEDIA, UploadTooLarge
+from helpers.fieldset_helper import parse_fields, fieldset_options
+from . import serialization_data, PACKAGE_FIELDS
 import uuid
 import json
+from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 
 
@@ -26,6 +36,8 @@ class PackageRequest(BaseModel):
 
 
 @view_config(route_name="packages", request_method="GET", renderer="json")
+@conditional_view(collection_validators("packages", PACKAGE_LIST_TAG))
+@cached_view("packages", lambda request, result: (PACKAGE_LIST_TAG,))
 def get_packages(request):
     destination_id = request.params.get("destination")
     search_query = request.params.get("q") or request.params.get("search")
@@ -34,8 +46,14 @@ def get_packages(request):
     sort_by = request.params.get("sortBy")
     order = request.params.get("order", "asc")
 
+    # Sparse fieldset, mis. ?fields=name,price,duration,images,destinationName
+    try:
+        fields = parse_fields(request.params.get("fields"), PACKAGE_FIELDS)
+    except ValueError as e:
+        return Response(json_body={"error": str(e)}, status=400)
+
     with Session() as session:
-        stmt = select(Package)
+        stmt = with_loaders(select(Package), fieldset_options(fields, PACKAGE_FIELDS, package_loaders()))
 
         if destination_id and destination_id != "all":
             try:
@@ -44,8 +62,9 @@ def get_packages(request):
             except ValueError:
                 pass
 
-        if search_query:
-            stmt = stmt.where(Package.name.ilike(f"%{search_query}%"))
+        tsquery = build_prefix_tsquery(search_query) if search_query else None
+        if tsquery:
+            stmt = stmt.where(search_condition(Package.search_vector, tsquery))
 
         if min_price:
             stmt = stmt.where(Package.price >= float(min_price))
@@ -53,21 +72,62 @@ def get_packages(request):
         if max_price:
             stmt = stmt.where(Package.price <= float(max_price))
 
+        descending = order == "desc"
         if sort_by == "price":
-            sort_column = Package.price
+            sort_key, sort_column, cursor_type = "price", Package.price, Decimal
         elif sort_by == "duration":
-            sort_column = Package.duration
+            sort_key, sort_column, cursor_type = "duration", Package.duration, int
+        elif sort_by == "rating":
+            sort_key, sort_column, cursor_type = "rating", Package.rating_avg, Decimal
+        elif tsquery and sort_by in (None, "", "relevance"):
+            # Hasil search diurutkan berdasarkan relevansi (paling relevan dulu)
+            sort_key, sort_column, cursor_type = "relevance", search_rank(Package.search_vector, tsquery), float
+            descending = True
         else:
-            sort_column = Package.created_at
+            sort_key, sort_column, cursor_type = "created_at", Package.created_at, datetime.fromisoformat
 
-        if order == "desc":
-            stmt = stmt.order_by(desc(sort_column))
+        stmt = stmt.add_columns(sort_column.label("sort_value"))
+        if descending:
+            stmt = stmt.order_by(desc(sort_column), desc(Package.id))
         else:
-            stmt = stmt.order_by(asc(sort_column))
+            stmt = stmt.order_by(asc(sort_column), asc(Package.id))
 
+        # Selalu satu halaman (default 20 baris), halaman berikutnya lewat nextCursor
         try:
-            results = session.execute(stmt).scalars().all()
-            return [serialization_data(pkg) for pkg in results]
+            limit = parse_limit(request.params.get("limit"))
+        except ValueError:
+            return Response(json_body={"error": "limit must be a valid number"}, status=400)
+
+        cursor = request.params.get("cursor")
+        if cursor:
+            try:
+                last_value, last_id = decode_cursor(cursor, sort_key, cursor_type)
+            except ValueError as e:
+                return Response(json_body={"error": str(e)}, status=400)
+            stmt = stmt.where(
+                keyset_condition(sort_column, Package.id, last_value, last_id, descending)
+            )
+
+        # Ambil 1 baris ekstra untuk tahu apakah masih ada halaman berikutnya
+        stmt = stmt.limit(limit + 1)
+
+        try:
+            rows = session.execute(stmt).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            next_cursor = None
+            if has_more:
+                last = rows[-1]
+                next_cursor = encode_cursor(sort_key, last.sort_value, last.Package.id)
+
+            return {
+                "data": [serialization_data(row.Package, fields) for row in rows],
+                "pagination": {
+                    "limit": limit,
+                    "nextCursor": next_cursor,
+                    "hasMore": has_more,
+                },
+            }
         except Exception as e:
             print(f"Error fetching packages : {e}")
             return Response(json_body={"error": "Internal server error"}, status=500)
@@ -81,10 +141,6 @@ def create_package(request):
             json_body={"error": "Forbidden : Only agent can access"}, status=403
         )
 
-    # Create storage directory if it doesn't exist
-    storage_dir = Path("storage/packages")
-    storage_dir.mkdir(parents=True, exist_ok=True)
-
     try:
         # Get form data
         destination_id = request.POST.get("destinationId")
@@ -107,8 +163,8 @@ def create_package(request):
         except ValueError:
             return Response(json_body={"error": "Invalid numeric values for duration, price, or maxTravelers"}, status=400)
         
-        # Handle image uploads
-        image_urls = []
+        # Validate image uploads, files are stored once the package row is ready
+        uploads = []
         images_field = request.POST.getall("images")
         
         if images_field:
@@ -119,26 +175,12 @@ def create_package(request):
                         continue
                     
                     # Validate file extension
-                    allowed_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
                     file_ext = Path(filename).suffix.lower()
-                    
-                    if file_ext not in allowed_extensions:
-                        return Response(json_body={"error": f"File type not allowed. Allowed: {', '.join(allowed_extensions)}"}, status=400)
-                    
-                    # Check file size (max 5MB)
-                    file_content = image_file.file.read()
-                    if len(file_content) > 5 * 1024 * 1024:
-                        return Response(json_body={"error": "File size exceeds 5MB limit"}, status=400)
-                    
-                    # Generate unique filename
-                    unique_filename = f"{uuid.uuid4()}{file_ext}"
-                    file_path = storage_dir / unique_filename
-                    
-                    # Save file
-                    with open(file_path, 'wb') as f:
-                        f.write(file_content)
-                    
-                    image_urls.append(f"/packages/{unique_filename}")
+
+                    if file_ext not in ALLOWED_EXTENSIONS:
+                        return Response(json_body={"error": f"File type not allowed. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"}, status=400)
+
+                    uploads.append((image_file.file, file_ext))
                 except AttributeError:
                     continue
 
@@ -155,6 +197,17 @@ def create_package(request):
             except ValueError:
                 return Response(json_body={"error": "Invalid UUID format"}, status=400)
 
+            # Content-addressed storage (max 5MB each): identical images share one file,
+            # the references are committed together with the package
+            stored_images = []
+            for file_obj, file_ext in uploads:
+                try:
+                    stored_images.append(PACKAGE_MEDIA.put(session, file_obj, file_ext))
+                except UploadTooLarge as err:
+                    session.rollback()
+                    return Response(json_body={"error": str(err)}, status=400)
+            image_urls = [stored.url for stored in stored_images]
+
             new_package = Package(
                 agent_id=agent_uuid,
                 destination_id=dest_uuid,
@@ -170,8 +223,8 @@ def create_package(request):
             try:
                 session.add(new_package)
                 session.commit()
+                catalog_cache.invalidate(PACKAGE_LIST_TAG)
                 session.refresh(new_package)
-                return serialization_data(new_package)
             except IntegrityError as err:
                 session.rollback()
                 return Response(json_body={"error": str(err.orig)}, status=409)
@@ -179,6 +232,15 @@ def create_package(request):
                 session.rollback()
                 print(f"CRITICAL ERROR: {e}")
                 return Response(json_body={"error": f"Internal Server Error: {str(e)}"}, status=500)
+
+            # Package sudah tersimpan: gagal menjadwalkan varian (pool penuh/broken, file
+            # rusak) hanya dicatat, client tetap dapat response sukses dan tidak retry
+            for stored in stored_images:
+                try:
+                    schedule_package_variants(new_package.id, stored.path, stored.url)
+                except Exception as e:
+                    print(f"Error scheduling image variants for {stored.url}: {e}")
+            return serialization_data(new_package)
                 
     except Exception as e:
         print(f"Error creating package: {e}")
@@ -1,27 +1,41 @@
 """Generate payment with amount from QRIS"""
 import json
-import os
-import uuid
-from io import BytesIO
 from pyramid.view import view_config
 from sqlalchemy import select, desc
-import qrcode
 
 from helpers.qris_helper import generate_dynamic_qris_string
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.idempotency_helper import idempotent
+from helpers.worker_pool_helper import WorkerPoolError, pool_error
+from helpers.qr_render_helper import (
+    QR_RENDER_CACHE,
+    QrRenderParams,
+    render_qr_in_pool,
+    parse_qr_options,
+    inline_image,
+    stream_response,
+)
 from models.qris_model import Qris
 
-# Storage path untuk generated QR codes
-STORAGE_DIR = "storage/qris"
-
 
 @view_config(route_name="payment_generate", request_method="POST", renderer="json")
 @jwt_validate
+@idempotent("payment_generate")
 def payment_generate(request):
     """
     POST /api/payment/generate
     Generate custom QRIS payment dengan amount (auto-fetch QRIS terbaru)
     
+    Header opsional Idempotency-Key: retry dengan key yang sama mengembalikan response pertama
+    
+    Query Parameters:
+    - format (optional): png (default) or svg
+    - transport (optional):
+      - tidak diisi: hanya fotoQrUrl (gambar dari render cache)
+      - inline: gambar juga ada di JSON (qrImage: PNG base64 / SVG markup, qrImageFormat)
+      - stream: body response = gambar, metadata di header X-Qris-Id,
+        X-Dynamic-Qris-String, X-Total-Amount dan X-Foto-Qr-Url
+    
     Request (JSON):
     {
         "amount": 1000000
@@ -36,11 +50,17 @@ def payment_generate(request):
         "feeType": "rupiah",
         "feeValue": 10000,
         "totalAmount": 1010000,
-        "fotoQrUrl": "http://localhost:6543/qris/dynamic_[uuid].png",
+        "fotoQrUrl": "http://localhost:6543/qris/rendered/ab/cd/[sha256].png",
         "message": "Custom QRIS siap untuk diproses. Buka fotoQrUrl atau scan untuk pembayaran."
     }
     """
     try:
+        try:
+            image_format, transport = parse_qr_options(request, default_transport=None)
+        except ValueError as e:
+            request.response.status = 400
+            return {"error": str(e)}
+        
         # Parse JSON body
         try:
             body = request.json_body
@@ -78,27 +98,21 @@ def payment_generate(request):
             qris.static_qris_string,
             amount,
             qris.fee_type,
-            qris.fee_value
+            qris.fee_value,
+            qris_id=qris.id
         )
         
-        # Generate QR code image dari dynamic QRIS string
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(dynamic_qris_string)
-        qr.make(fit=True)
-        
-        # Create PIL image
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Save generated QR code to storage
-        os.makedirs(STORAGE_DIR, exist_ok=True)
-        dynamic_qr_filename = f"dynamic_{uuid.uuid4()}.png"
-        dynamic_qr_path = os.path.join(STORAGE_DIR, dynamic_qr_filename)
-        img.save(dynamic_qr_path)
+        # QR code image dari render cache (QRIS + amount yang sama tidak dirender ulang),
+        # cache miss dirender di worker process
+        params = QrRenderParams(image_format=image_format)
+        content = None
+        try:
+            if transport is None:
+                rendered = QR_RENDER_CACHE.get_or_render(dynamic_qris_string, params, render_qr_in_pool)
+            else:
+                rendered, content = QR_RENDER_CACHE.get_content(dynamic_qris_string, params, render_qr_in_pool)
+        except WorkerPoolError as e:
+            return pool_error(request, e)
         
         # Calculate total amount with fee
         total_amount = amount
@@ -108,9 +122,19 @@ def payment_generate(request):
             total_amount += (amount * float(qris.fee_value) / 100)
         
         # Generate accessible URL untuk generated QR code
-        dynamic_qr_url = f"{request.host_url.rstrip('/')}/qris/{dynamic_qr_filename}"
+        dynamic_qr_url = f"{request.host_url.rstrip('/')}{rendered.url}"
+        
+        if transport == "stream":
+            headers = {
+                "X-Qris-Id": str(qris.id),
+                "X-Total-Amount": str(total_amount),
+                "X-Foto-Qr-Url": dynamic_qr_url,
+            }
+            if dynamic_qris_string.isascii():
+                headers["X-Dynamic-Qris-String"] = dynamic_qris_string
+            return stream_response(content, image_format, headers=headers)
         
-        return {
+        data = {
             "qrisId": str(qris.id),
             "staticQrisString": qris.static_qris_string,
             "dynamicQrisString": dynamic_qris_string,
@@ -119,10 +143,14 @@ def payment_generate(request):
             "feeValue": float(qris.fee_value) if qris.fee_value else None,
             "totalAmount": total_amount,
             "fotoQrUrl": dynamic_qr_url,
-            "qrCodeImage": dynamic_qr_path,
+            "qrCodeImage": str(rendered.path),
             "createdAt": qris.created_at.isoformat() if qris.created_at else None,
             "message": "Custom QRIS berhasil di-generate. Buka fotoQrUrl untuk QR code payment custom."
         }
+        if transport == "inline":
+            data["qrImage"] = inline_image(content, image_format)
+            data["qrImageFormat"] = image_format
+        return data
     
     except Exception as e:
         request.response.status = 500
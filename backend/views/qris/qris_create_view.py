@@ -1,15 +1,14 @@
 """Upload QRIS image and save"""
 import os
 import uuid
-from io import BytesIO
-from PIL import Image
-import qrcode
-from pyzbar.pyzbar import decode
 from pyramid.view import view_config
 from sqlalchemy import select
 
 from models.qris_model import Qris
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.media_task_helper import decode_qr_image
+from helpers.qr_render_helper import QrRenderParams, render_qr_png
+from helpers.worker_pool_helper import MEDIA_POOL, WorkerPoolError, pool_error
 
 
 # Storage path configuration
@@ -66,16 +65,18 @@ def qris_create(request):
             request.response.status = 400
             return {"error": "foto_qr file size must be <= 5MB"}
         
-        # Auto-extract QRIS string dari image
-        image = Image.open(BytesIO(image_data))
-        decoded_objects = decode(image)
+        # Auto-extract QRIS string dari image (decode di worker process)
+        try:
+            decoded_payloads = MEDIA_POOL.run(decode_qr_image, image_data)
+        except WorkerPoolError as e:
+            return pool_error(request, e)
         
-        if not decoded_objects:
+        if not decoded_payloads:
             request.response.status = 400
             return {"error": "Tidak dapat membaca QR code dari gambar. Pastikan gambar berisi QR code yang jelas."}
         
         # Ambil QRIS string dari QR code yang ter-decode
-        static_qris_string = decoded_objects[0].data.decode('utf-8')
+        static_qris_string = decoded_payloads[0]
         
         if not static_qris_string:
             request.response.status = 400
@@ -122,22 +123,16 @@ def qris_create(request):
             print(f"Error deleting old files: {str(e)}")
         
         # Generate clean QR code dari QRIS string (tanpa file upload, hanya QR code bersih)
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(static_qris_string)
-        qr.make(fit=True)
-        
-        # Create clean PIL image dari QRIS string
-        img = qr.make_image(fill_color="black", back_color="white")
+        try:
+            clean_png = MEDIA_POOL.run(render_qr_png, static_qris_string, QrRenderParams())
+        except WorkerPoolError as e:
+            return pool_error(request, e)
         
         # Save clean QR code ke storage (tidak perlu nama unik, akan di-replace)
         clean_filename = "qris_code.png"
         file_path = os.path.join(STORAGE_DIR, clean_filename)
-        img.save(file_path)
+        with open(file_path, "wb") as f:
+            f.write(clean_png)
         
         # Save to database
         qris = Qris(
@@ -1,12 +1,17 @@
 """Generate preview of dynamic QRIS without saving"""
-import base64
-import io
 import json
 from pyramid.view import view_config
-import qrcode
 
 from helpers.qris_helper import generate_dynamic_qris_string
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.worker_pool_helper import WorkerPoolError, pool_error
+from helpers.qr_render_helper import (
+    QrRenderParams,
+    render_qr_in_pool,
+    parse_qr_options,
+    inline_image,
+    stream_response,
+)
 
 
 @view_config(route_name="qris_preview", request_method="POST", renderer="json")
@@ -16,6 +21,11 @@ def qris_preview(request):
     POST /api/qris/preview
     Generate preview of dynamic QRIS QR code without saving to database
     
+    Query Parameters:
+    - format (optional): png (default) or svg
+    - transport (optional): inline (default, image inside JSON) or stream
+      (response body is the image, dynamic QRIS string in X-Dynamic-Qris-String)
+    
     Request (JSON):
     {
         \"staticQrisString\": \"00020126450014com.midtrans...\",
@@ -29,8 +39,15 @@ def qris_preview(request):
         \"base64Qr\": \"iVBORw0KGgoAAAANSUhEUgAA...\",
         \"dynamicQrisString\": \"00020126...\"
     }
+    (format=svg: \"svgQr\": \"<svg ...>\" instead of base64Qr)
     """
     try:
+        try:
+            image_format, transport = parse_qr_options(request)
+        except ValueError as e:
+            request.response.status = 400
+            return {"error": str(e)}
+        
         # Parse JSON body
         try:
             body = request.json_body
@@ -86,29 +103,24 @@ def qris_preview(request):
             request.response.status = 400
             return {"error": str(e)}
         
-        # Generate QR code
+        # Generate QR code (di worker process)
         try:
-            qr = qrcode.QRCode(
-                version=None,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(dynamic_qris_string)
-            qr.make(fit=True)
-            
-            img = qr.make_image(fill_color="black", back_color="white")
-            img_byte_arr = io.BytesIO()
-            img.save(img_byte_arr, format="PNG")
-            img_byte_arr.seek(0)
-            
-            base64_qr = base64.b64encode(img_byte_arr.getvalue()).decode("utf-8")
+            content = render_qr_in_pool(dynamic_qris_string, QrRenderParams(image_format=image_format))
+        except WorkerPoolError as e:
+            return pool_error(request, e)
         except Exception as e:
             request.response.status = 400
             return {"error": f"Failed to generate QR code: {str(e)}"}
         
+        if transport == "stream":
+            headers = {}
+            if dynamic_qris_string.isascii():
+                headers["X-Dynamic-Qris-String"] = dynamic_qris_string
+            return stream_response(content, image_format, headers=headers)
+        
+        image_key = "svgQr" if image_format == "svg" else "base64Qr"
         return {
-            "base64Qr": base64_qr,
+            image_key: inline_image(content, image_format),
             "dynamicQrisString": dynamic_qris_string,
         }
     
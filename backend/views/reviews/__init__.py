@@ -0,0 +1,23 @@
+from models.review_model import Review
+from helpers.fieldset_helper import FieldSpec
+from helpers.loader_helper import review_tourist_loaders
+
+
+# Field review untuk review_by_package (termasuk ringkasan tourist)
+REVIEW_PACKAGE_FIELDS = {
+    "id": FieldSpec(lambda r: str(r.id), (Review.id,)),
+    "packageId": FieldSpec(lambda r: str(r.package_id), (Review.package_id,)),
+    "touristId": FieldSpec(lambda r: str(r.tourist_id), (Review.tourist_id,)),
+    "bookingId": FieldSpec(lambda r: str(r.booking_id) if r.booking_id else None, (Review.booking_id,)),
+    "rating": FieldSpec(lambda r: r.rating, (Review.rating,)),
+    "comment": FieldSpec(lambda r: r.comment, (Review.comment,)),
+    "createdAt": FieldSpec(lambda r: r.created_at.isoformat() if r.created_at else None, (Review.created_at,)),
+    "tourist": FieldSpec(
+        lambda r: {
+            "id": str(r.tourist.id),
+            "name": r.tourist.name
+        } if r.tourist else None,
+        (Review.tourist_id,),
+        review_tourist_loaders(),
+    ),
+}
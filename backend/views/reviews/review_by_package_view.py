@@ -3,6 +3,9 @@ from pyramid.view import view_config
 from sqlalchemy import select
 
 from models.review_model import Review
+from helpers.loader_helper import with_loaders, review_tourist_loaders
+from helpers.fieldset_helper import parse_fields, fieldset_options, serialize_fields
+from . import REVIEW_PACKAGE_FIELDS
 
 
 @view_config(route_name="review_by_package", request_method="GET", renderer="json")
@@ -11,6 +14,9 @@ def review_by_package(request):
     GET /api/reviews/package/{packageId}
     Get all reviews for a package
     
+    Query Parameters:
+    - fields (optional): Comma separated fields to return (e.g. id,rating,comment)
+    
     Response (200 OK):
     [
         {
@@ -35,27 +41,18 @@ def review_by_package(request):
             request.response.status = 400
             return {"error": "Package ID is required"}
         
+        try:
+            fields = parse_fields(request.params.get("fields"), REVIEW_PACKAGE_FIELDS)
+        except ValueError as e:
+            request.response.status = 400
+            return {"error": str(e)}
+        
         db_session = request.dbsession
-        query = select(Review).where(Review.package_id == package_id).order_by(Review.created_at.desc())
+        query = with_loaders(select(Review), fieldset_options(fields, REVIEW_PACKAGE_FIELDS, review_tourist_loaders())).where(Review.package_id == package_id).order_by(Review.created_at.desc())
         result = db_session.execute(query)
         reviews = result.scalars().all()
         
-        return [
-            {
-                "id": str(r.id),
-                "packageId": str(r.package_id),
-                "touristId": str(r.tourist_id),
-                "bookingId": str(r.booking_id) if r.booking_id else None,
-                "rating": r.rating,
-                "comment": r.comment,
-                "createdAt": r.created_at.isoformat() if r.created_at else None,
-                "tourist": {
-                    "id": str(r.tourist.id),
-                    "name": r.tourist.name
-                } if r.tourist else None
-            }
-            for r in reviews
-        ]
+        return [serialize_fields(r, fields, REVIEW_PACKAGE_FIELDS) for r in reviews]
     
     except Exception as e:
         request.response.status = 500
@@ -4,6 +4,7 @@ from sqlalchemy import select
 
 from models.review_model import Review
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.loader_helper import with_loaders, review_package_loaders
 
 
 @view_config(route_name="review_by_tourist", request_method="GET", renderer="json")
@@ -45,7 +46,7 @@ def review_by_tourist(request):
             return {"error": "Forbidden"}
         
         db_session = request.dbsession
-        query = select(Review).where(Review.tourist_id == tourist_id).order_by(Review.created_at.desc())
+        query = with_loaders(select(Review), review_package_loaders()).where(Review.tourist_id == tourist_id).order_by(Review.created_at.desc())
         result = db_session.execute(query)
         reviews = result.scalars().all()
         
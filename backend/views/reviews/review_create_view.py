@@ -7,15 +7,20 @@ from models.review_model import Review
 from models.booking_model import Booking
 from models.package_model import Package
 from helpers.jwt_validate_helper import jwt_validate
+from helpers.idempotency_helper import idempotent
+from helpers.cache_helper import catalog_cache, PACKAGE_LIST_TAG, package_tag
 
 
 @view_config(route_name="reviews", request_method="POST", renderer="json")
 @jwt_validate
+@idempotent("reviews")
 def review_create(request):
     """
     POST /api/reviews
     Create review (Tourist only)
     
+    Header opsional Idempotency-Key: retry dengan key yang sama mengembalikan response pertama
+    
     Request Body:
     {
         "packageId": "uuid",
@@ -132,9 +137,12 @@ def review_create(request):
         if booking:
             booking.has_reviewed = True
         
+        # packages.rating_sum/rating_count/rating_avg di-update oleh trigger
+        # reviews_rating_aggregate_trigger di transaksi yang sama dengan insert ini
         db_session.add(review)
         db_session.flush()
         db_session.commit()
+        catalog_cache.invalidate(PACKAGE_LIST_TAG, package_tag(package_id))
         
         request.response.status = 201
         return {
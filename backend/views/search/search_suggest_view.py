@@ -0,0 +1,104 @@
+"""Typo-tolerant autocomplete for destinations and packages"""
+from pyramid.view import view_config
+from sqlalchemy import select, union_all, literal, cast, String, desc
+
+from models.destination_model import Destination
+from models.package_model import Package
+from helpers.search_helper import set_fuzzy_threshold, fuzzy_condition, fuzzy_score
+
+DEFAULT_SUGGEST_LIMIT = 8
+MAX_SUGGEST_LIMIT = 20
+MIN_QUERY_LENGTH = 2
+
+
+@view_config(route_name="search_suggest", request_method="GET", renderer="json")
+def search_suggest(request):
+    """
+    GET /api/search/suggest
+    Fuzzy autocomplete over destination names, countries and package names
+    
+    Query Parameters:
+    - q (required): Text typed by the user (min 2 characters)
+    - limit (optional, default: 8, max: 20): Top N suggestions
+    
+    Response (200 OK):
+    [
+        {
+            "type": "destination",
+            "id": "uuid",
+            "label": "Yogyakarta",
+            "score": 0.54
+        },
+        {
+            "type": "country",
+            "id": null,
+            "label": "Indonesia",
+            "score": 0.4
+        },
+        {
+            "type": "package",
+            "id": "uuid",
+            "label": "Yogyakarta Heritage Tour",
+            "score": 0.38
+        }
+    ]
+    """
+    try:
+        search_query = (request.params.get("q") or "").strip()
+        
+        if len(search_query) < MIN_QUERY_LENGTH:
+            return []
+        
+        try:
+            limit = int(request.params.get("limit", DEFAULT_SUGGEST_LIMIT))
+        except (ValueError, TypeError):
+            request.response.status = 400
+            return {"error": "limit must be a valid number"}
+        limit = max(1, min(limit, MAX_SUGGEST_LIMIT))
+        
+        # Each branch is served by its own gin_trgm_ops index, merged and ranked in one query
+        destination_query = select(
+            literal("destination").label("type"),
+            cast(Destination.id, String).label("id"),
+            Destination.name.label("label"),
+            fuzzy_score(Destination.name, search_query).label("score"),
+        ).where(fuzzy_condition(Destination.name, search_query))
+        
+        country_query = select(
+            literal("country").label("type"),
+            literal(None, String).label("id"),
+            Destination.country.label("label"),
+            fuzzy_score(Destination.country, search_query).label("score"),
+        ).where(fuzzy_condition(Destination.country, search_query)).distinct()
+        
+        package_query = select(
+            literal("package").label("type"),
+            cast(Package.id, String).label("id"),
+            Package.name.label("label"),
+            fuzzy_score(Package.name, search_query).label("score"),
+        ).where(fuzzy_condition(Package.name, search_query))
+        
+        suggestions = union_all(destination_query, country_query, package_query).subquery()
+        query = (
+            select(suggestions)
+            .order_by(desc(suggestions.c.score), suggestions.c.label)
+            .limit(limit)
+        )
+        
+        db_session = request.dbsession
+        set_fuzzy_threshold(db_session)
+        rows = db_session.execute(query).all()
+        
+        return [
+            {
+                "type": row.type,
+                "id": row.id,
+                "label": row.label,
+                "score": round(float(row.score), 3),
+            }
+            for row in rows
+        ]
+    
+    except Exception as e:
+        request.response.status = 500
+        return {"error": f"Internal server error: {str(e)}"}
@@ -11,19 +11,24 @@ import {
 } from "@/services/booking.service";
 
 /**
- * Hook untuk mengambil semua bookings (Admin/Agent)
+ * Hook untuk mengambil bookings (Admin/Agent) per halaman, loadMore menambah halaman berikutnya
  */
 export function useBookings() {
   const [bookings, setBookings] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [hasMore, setHasMore] = useState(false);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [error, setError] = useState(null);
 
   const fetchBookings = useCallback(async () => {
     setIsLoading(true);
     setError(null);
     try {
-      const data = await getAllBookings();
-      setBookings(data);
+      const page = await getAllBookings();
+      setBookings(page.data);
+      setNextCursor(page.nextCursor);
+      setHasMore(page.hasMore);
     } catch (err) {
       setError(err.message || "Gagal mengambil data bookings");
     } finally {
@@ -31,11 +36,27 @@ export function useBookings() {
     }
   }, []);
 
+  const loadMore = useCallback(async () => {
+    if (!hasMore || !nextCursor || isLoadingMore) return;
+    setIsLoadingMore(true);
+    setError(null);
+    try {
+      const page = await getAllBookings({ cursor: nextCursor });
+      setBookings((prev) => [...prev, ...page.data]);
+      setNextCursor(page.nextCursor);
+      setHasMore(page.hasMore);
+    } catch (err) {
+      setError(err.message || "Gagal mengambil data bookings");
+    } finally {
+      setIsLoadingMore(false);
+    }
+  }, [hasMore, nextCursor, isLoadingMore]);
+
   useEffect(() => {
     fetchBookings();
   }, [fetchBookings]);
 
-  return { bookings, isLoading, error, refetch: fetchBookings };
+  return { bookings, isLoading, isLoadingMore, error, hasMore, loadMore, refetch: fetchBookings };
 }
 
 /**
@@ -34,11 +34,12 @@ export default function LandingPage() {
     const fetchData = async () => {
       setIsLoading(true);
       try {
-        const [packagesData, destinationsData] = await Promise.all([
-          packageService.getAllPackages(),
+        // Featured cukup halaman pertama, tidak perlu seluruh katalog
+        const [packagesPage, destinationsData] = await Promise.all([
+          packageService.getPackagesPage(),
           destinationService.getAllDestinations(),
         ]);
-        setPackages(packagesData);
+        setPackages(packagesPage.data);
         setDestinations(destinationsData);
       } catch (error) {
         console.error("Failed to fetch data:", error);
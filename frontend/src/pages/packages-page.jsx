@@ -1,4 +1,4 @@
-import { useEffect, useState, useMemo } from "react";
+import { useEffect, useState } from "react";
 import { Search, Phone, Loader2, Heart } from "lucide-react";
 import { useNavigate } from "react-router-dom";
 import { Button } from "@/components/ui/button";
@@ -27,9 +27,24 @@ import { toast } from "sonner";
 import { getImageUrl } from "@/lib/image-utils";
 import { getWhatsAppLink } from "@/lib/formatters";
 
+// Nilai Select -> query parameter GET /api/packages
+const PRICE_RANGES = {
+  "0-500": { minPrice: 0, maxPrice: 500 },
+  "500-1000": { minPrice: 500, maxPrice: 1000 },
+  "1000-2000": { minPrice: 1000, maxPrice: 2000 },
+  "2000+": { minPrice: 2000 },
+};
+
+const SORT_OPTIONS = {
+  rating: { sortBy: "rating", order: "desc" },
+  "price-low": { sortBy: "price", order: "asc" },
+  "price-high": { sortBy: "price", order: "desc" },
+  duration: { sortBy: "duration", order: "asc" },
+};
+
 export default function PackagesPage() {
   const navigate = useNavigate();
-  const { destinations, packages, setDestinations, setPackages } = useDestinationStore();
+  const { destinations, setDestinations } = useDestinationStore();
   const { addToWishlist, removeFromWishlist, isInWishlist } = useWishlistStore();
   const { isAuthenticated } = useAuthStore();
   const { getParam, setParams } = useUrlParams();
@@ -38,9 +53,11 @@ export default function PackagesPage() {
   const [selectedDestination, setSelectedDestination] = useState(getParam("destination", "all"));
   const [priceRange, setPriceRange] = useState(getParam("price", "all"));
   const [sortBy, setSortBy] = useState(getParam("sort", "popular"));
+  const [packages, setPackages] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [hasMore, setHasMore] = useState(false);
   const [isLoading, setIsLoading] = useState(true);
-  const [currentPage, setCurrentPage] = useState(1);
-  const ITEMS_PER_PAGE = 9;
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   // Debounce search query
   const debouncedSearch = useDebounce(searchQuery, 500);
@@ -54,28 +71,48 @@ export default function PackagesPage() {
   });
 
   useEffect(() => {
-    const fetchData = async () => {
-      setIsLoading(true);
+    destinationService
+      .getAllDestinations()
+      .then(setDestinations)
+      .catch((err) => console.error("Failed to fetch destinations:", err));
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
 
-      try {
-        const [packagesData, destinationsData] = await Promise.all([
-          packageService.getAllPackages(),
-          destinationService.getAllDestinations(),
-        ]);
+  // Filter, harga dan urutan dikerjakan server; di sini hanya halaman pertama
+  const filters = {
+    destination: selectedDestination,
+    search: debouncedSearch,
+    ...(PRICE_RANGES[priceRange] || {}),
+    ...(SORT_OPTIONS[sortBy] || {}),
+  };
+
+  useEffect(() => {
+    let ignore = false;
 
-        setPackages(packagesData);
-        setDestinations(destinationsData);
+    const fetchFirstPage = async () => {
+      setIsLoading(true);
+      try {
+        const page = await packageService.getPackagesPage(filters);
+        if (ignore) return;
+        setPackages(page.data);
+        setNextCursor(page.nextCursor);
+        setHasMore(page.hasMore);
       } catch (err) {
-        console.error("Failed to fetch data:", err);
+        if (ignore) return;
+        console.error("Failed to fetch packages:", err);
         toast.error("Failed to load packages");
       } finally {
-        setIsLoading(false);
+        if (!ignore) setIsLoading(false);
       }
     };
 
-    fetchData();
+    fetchFirstPage();
+    return () => {
+      // Response filter lama yang datang belakangan diabaikan
+      ignore = true;
+    };
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, []);
+  }, [debouncedSearch, selectedDestination, priceRange, sortBy]);
 
   // Update URL params when filters change
   useEffect(() => {
@@ -87,70 +124,24 @@ export default function PackagesPage() {
     });
   }, [debouncedSearch, selectedDestination, priceRange, sortBy, setParams]);
 
-  // Reset to page 1 when filters change
-  useEffect(() => {
-    Promise.resolve().then(() => setCurrentPage(1));
-  }, [debouncedSearch, selectedDestination, priceRange, sortBy]);
-
-  const filteredPackages = useMemo(() => {
-    let filtered = [...packages];
-
-    if (debouncedSearch) {
-      filtered = filtered.filter((pkg) =>
-        pkg.name.toLowerCase().includes(debouncedSearch.toLowerCase())
-      );
+  const handleLoadMore = async () => {
+    if (!nextCursor || isLoadingMore) return;
+    setIsLoadingMore(true);
+    try {
+      const page = await packageService.getPackagesPage(filters, { cursor: nextCursor });
+      setPackages((prev) => [...prev, ...page.data]);
+      setNextCursor(page.nextCursor);
+      setHasMore(page.hasMore);
+    } catch (err) {
+      console.error("Failed to fetch more packages:", err);
+      toast.error("Failed to load more packages");
+    } finally {
+      setIsLoadingMore(false);
     }
-
-    if (selectedDestination !== "all") {
-      filtered = filtered.filter((pkg) => pkg.destinationId === selectedDestination);
-    }
-
-    // Price filtering
-    if (priceRange !== "all") {
-      const ranges = {
-        "0-500": [0, 500],
-        "500-1000": [500, 1000],
-        "1000-2000": [1000, 2000],
-        "2000+": [2000, Infinity],
-      };
-      const [min, max] = ranges[(priceRange, Infinity)];
-      filtered = filtered.filter((pkg) => pkg.price >= min && pkg.price < max);
-    }
-
-    // Sorting
-    switch (sortBy) {
-      case "price-low":
-        filtered.sort((a, b) => a.price - b.price);
-        break;
-      case "price-high":
-        filtered.sort((a, b) => b.price - a.price);
-        break;
-      case "rating":
-        filtered.sort((a, b) => (b.rating || 0) - (a.rating || 0));
-        break;
-      case "duration":
-        filtered.sort((a, b) => a.duration - b.duration);
-        break;
-      default: // popular
-        filtered.sort((a, b) => (b.reviewsCount || 0) - (a.reviewsCount || 0));
-    }
-
-    return filtered;
-  }, [packages, debouncedSearch, selectedDestination, priceRange, sortBy]);
+  };
 
   const isSearching = searchQuery !== debouncedSearch;
 
-  // Pagination
-  const totalPages = Math.ceil(filteredPackages.length / ITEMS_PER_PAGE);
-  const startIndex = (currentPage - 1) * ITEMS_PER_PAGE;
-  const endIndex = startIndex + ITEMS_PER_PAGE;
-  const paginatedPackages = filteredPackages.slice(startIndex, endIndex);
-
-  const handlePageChange = (page) => {
-    setCurrentPage(page);
-    window.scrollTo({ top: 0, behavior: "smooth" });
-  };
-
   const getDestinationById = (id) => {
     return destinations.find((d) => d.id === id);
   };
@@ -263,14 +254,8 @@ export default function PackagesPage() {
         {/* Results Count */}
         <div className="flex items-center justify-between">
           <p className="text-muted-foreground text-sm">
-            Showing {startIndex + 1}-{Math.min(endIndex, filteredPackages.length)} of{" "}
-            {filteredPackages.length} packages
+            Showing {packages.length} packages{hasMore ? ", more available" : ""}
           </p>
-          {totalPages > 1 && (
-            <p className="text-muted-foreground text-sm">
-              Page {currentPage} of {totalPages}
-            </p>
-          )}
         </div>
 
         {/* Package Grid */}
@@ -280,10 +265,10 @@ export default function PackagesPage() {
               <PackageCardSkeleton key={i} />
             ))}
           </div>
-        ) : filteredPackages.length > 0 ? (
+        ) : packages.length > 0 ? (
           <>
             <div className="grid gap-6 md:grid-cols-2 lg:grid-cols-3">
-              {paginatedPackages.map((pkg) => {
+              {packages.map((pkg) => {
                 const destination = getDestinationById(pkg.destinationId);
                 return (
                   <Card
@@ -362,55 +347,12 @@ export default function PackagesPage() {
               })}
             </div>
 
-            {/* Pagination */}
-            {totalPages > 1 && (
-              <div className="flex items-center justify-center gap-2 pt-4">
-                <Button
-                  variant="outline"
-                  size="sm"
-                  onClick={() => handlePageChange(currentPage - 1)}
-                  disabled={currentPage === 1}
-                >
-                  Previous
-                </Button>
-
-                <div className="flex gap-1">
-                  {Array.from({ length: totalPages }, (_, i) => i + 1).map((page) => {
-                    // Show first page, last page, current page, and pages around current
-                    if (
-                      page === 1 ||
-                      page === totalPages ||
-                      (page >= currentPage - 1 && page <= currentPage + 1)
-                    ) {
-                      return (
-                        <Button
-                          key={page}
-                          variant={currentPage === page ? "default" : "outline"}
-                          size="sm"
-                          onClick={() => handlePageChange(page)}
-                          className="min-w-10"
-                        >
-                          {page}
-                        </Button>
-                      );
-                    } else if (page === currentPage - 2 || page === currentPage + 2) {
-                      return (
-                        <span key={page} className="px-2">
-                          ...
-                        </span>
-                      );
-                    }
-                    return null;
-                  })}
-                </div>
-
-                <Button
-                  variant="outline"
-                  size="sm"
-                  onClick={() => handlePageChange(currentPage + 1)}
-                  disabled={currentPage === totalPages}
-                >
-                  Next
+            {/* Load More */}
+            {hasMore && (
+              <div className="flex items-center justify-center pt-4">
+                <Button variant="outline" onClick={handleLoadMore} disabled={isLoadingMore}>
+                  {isLoadingMore && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
+                  Load More
                 </Button>
               </div>
             )}
@@ -1,21 +1,27 @@
 import apiClient from "./api";
 
-// Get all bookings (Admin/Agent)
-export const getAllBookings = async () => {
+export const BOOKINGS_PAGE_SIZE = 20;
+
+// Get one page of bookings (Admin/Agent), newest first.
+// Halaman berikutnya diambil dengan mengirim nextCursor sebagai cursor
+export const getAllBookings = async ({ limit = BOOKINGS_PAGE_SIZE, cursor, ...filters } = {}) => {
   try {
-    const response = await apiClient.get("/api/bookings");
+    const params = { ...filters, limit };
+    if (cursor) params.cursor = cursor;
+
+    const response = await apiClient.get("/api/bookings", { params });
     console.log('getAllBookings response:', response);
-    
-    if (response.data?.data && Array.isArray(response.data.data)) {
-      return response.data.data;
-    }
-    if (Array.isArray(response.data)) {
-      return response.data;
-    }
-    return [];
+
+    const data = Array.isArray(response.data?.data) ? response.data.data : [];
+    const pagination = response.data?.pagination;
+    return {
+      data,
+      nextCursor: pagination?.nextCursor ?? null,
+      hasMore: Boolean(pagination?.hasMore),
+    };
   } catch (error) {
     console.error('Error fetching all bookings:', error);
-    return [];
+    return { data: [], nextCursor: null, hasMore: false };
   }
 };
 
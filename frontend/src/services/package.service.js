@@ -1,6 +1,11 @@
 import apiClient from "./api";
-// Get all packages with optional filters
-export const getAllPackages = async (filters) => {
+
+export const PACKAGES_PAGE_SIZE = 20;
+// Batas maksimum limit di backend
+const PACKAGES_MAX_LIMIT = 100;
+
+// Map filter UI ke query parameter GET /api/packages
+const buildPackageParams = (filters) => {
   const params = {};
 
   if (filters?.destination && filters.destination !== "all") {
@@ -22,8 +27,36 @@ export const getAllPackages = async (filters) => {
     params.order = filters.order;
   }
 
+  return params;
+};
+
+// Get one page of packages; pass nextCursor as cursor for the next page
+export const getPackagesPage = async (filters, { limit = PACKAGES_PAGE_SIZE, cursor } = {}) => {
+  const params = { ...buildPackageParams(filters), limit };
+  if (cursor) params.cursor = cursor;
+
   const response = await apiClient.get("/api/packages", { params });
-  return response.data;
+  const pagination = response.data?.pagination;
+  return {
+    data: Array.isArray(response.data?.data) ? response.data.data : [],
+    nextCursor: pagination?.nextCursor ?? null,
+    hasMore: Boolean(pagination?.hasMore),
+  };
+};
+
+// Get all packages with optional filters, following nextCursor page by page.
+// Untuk lookup (nama/gambar package); halaman katalog memakai getPackagesPage
+export const getAllPackages = async (filters) => {
+  const packages = [];
+  let cursor = null;
+
+  do {
+    const page = await getPackagesPage(filters, { limit: PACKAGES_MAX_LIMIT, cursor });
+    packages.push(...page.data);
+    cursor = page.hasMore ? page.nextCursor : null;
+  } while (cursor);
+
+  return packages;
 };
 
 // Get package by ID
@@ -34,10 +67,7 @@ export const getPackageById = async (id) => {
 
 // Get packages by destination - using query parameter
 export const getPackagesByDestination = async (destinationId) => {
-  const response = await apiClient.get("/api/packages", {
-    params: { destination: destinationId },
-  });
-  return response.data;
+  return getAllPackages({ destination: destinationId });
 };
 
 // Get packages by agent
@@ -82,8 +112,6 @@ export const deletePackage = async (id) => {
 
 // Search packages - using query parameter on main endpoint
 export const searchPackages = async (query) => {
-  const response = await apiClient.get("/api/packages", {
-    params: { q: query },
-  });
-  return response.data;
+  const page = await getPackagesPage({ search: query });
+  return page.data;
 };
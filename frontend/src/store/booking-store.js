@@ -4,17 +4,43 @@ import * as paymentService from "@/services/payment.service";
 
 export const useBookingStore = create((set, get) => ({
   bookings: [],
+  bookingsCursor: null,
+  hasMoreBookings: false,
   pendingPayments: [],
   isLoading: false,
   error: null,
 
   setBookings: (bookings) => set({ bookings }),
 
-  fetchBookings: async () => {
+  // Halaman pertama; halaman berikutnya lewat fetchMoreBookings
+  fetchBookings: async (filters = {}) => {
     set({ isLoading: true, error: null });
     try {
-      const bookings = await bookingService.getAllBookings();
-      set({ bookings, isLoading: false });
+      const page = await bookingService.getAllBookings(filters);
+      set({
+        bookings: page.data,
+        bookingsCursor: page.nextCursor,
+        hasMoreBookings: page.hasMore,
+        isLoading: false,
+      });
+    } catch (error) {
+      set({ error: error.message, isLoading: false });
+    }
+  },
+
+  fetchMoreBookings: async (filters = {}) => {
+    const { bookingsCursor, hasMoreBookings, isLoading } = get();
+    if (!hasMoreBookings || !bookingsCursor || isLoading) return;
+
+    set({ isLoading: true, error: null });
+    try {
+      const page = await bookingService.getAllBookings({ ...filters, cursor: bookingsCursor });
+      set((state) => ({
+        bookings: [...state.bookings, ...page.data],
+        bookingsCursor: page.nextCursor,
+        hasMoreBookings: page.hasMore,
+        isLoading: false,
+      }));
     } catch (error) {
       set({ error: error.message, isLoading: false });
     }
@@ -24,7 +50,7 @@ export const useBookingStore = create((set, get) => ({
     set({ isLoading: true, error: null });
     try {
       const bookings = await bookingService.getBookingsByTourist(touristId);
-      set({ bookings, isLoading: false });
+      set({ bookings, bookingsCursor: null, hasMoreBookings: false, isLoading: false });
     } catch (error) {
       set({ error: error.message, isLoading: false });
     }
@@ -34,7 +60,7 @@ export const useBookingStore = create((set, get) => ({
     set({ isLoading: true, error: null });
     try {
       const bookings = await bookingService.getBookingsByPackage(packageId);
-      set({ bookings, isLoading: false });
+      set({ bookings, bookingsCursor: null, hasMoreBookings: false, isLoading: false });
     } catch (error) {
       set({ error: error.message, isLoading: false });
     }